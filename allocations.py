@@ -0,0 +1,124 @@
+"""
+Rockstar Bros - Allocations et ramasse-miettes
+Mode --track-allocations: snapshot tracemalloc toutes les N frames et lignes du jeu
+dont la memoire retenue a le plus augmente depuis le snapshot precedent.
+GcPolicy: pendant le gameplay, les objets du stage sont geles (gc.freeze) et les
+collectes completes sont repoussees aux transitions, hors des combats.
+"""
+
+import gc
+import time
+import tracemalloc
+from typing import Optional
+
+from settings import (
+    BASE_DIR, ALLOC_TRACK_FRAMES, ALLOC_TRACK_TOP, ALLOC_TRACK_DEPTH,
+    GC_GAMEPLAY_THRESHOLDS,
+)
+
+
+class AllocationTracker:
+    """
+    Compare un snapshot tracemalloc toutes les every_frames frames au precedent.
+    Un snapshot ne voit que les blocs encore vivants: la colonne mesure la memoire
+    retenue (fuites, caches qui grossissent), pas les objets temporaires crees et
+    liberes dans la frame. Pour ceux-la, le rapport donne les collectes de la
+    generation 0 par frame (gc.get_stats), qui montent avec les allocations d'objets.
+    """
+
+    def __init__(self, every_frames=ALLOC_TRACK_FRAMES, top=ALLOC_TRACK_TOP):
+        """
+        Args:
+            every_frames: Frames entre deux snapshots
+            top: Nombre de lignes affichees
+        """
+        self.every_frames = every_frames
+        self.top = top
+        self.frames = 0
+        self.previous: Optional[tracemalloc.Snapshot] = None
+        self.gen0_collections = gc.get_stats()[0]["collections"]
+        # Seulement le code du jeu (pas pygame, la lib standard ni ce module)
+        self.filters = [
+            tracemalloc.Filter(True, str(BASE_DIR / "*")),
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(ALLOC_TRACK_DEPTH)
+
+    def end_frame(self, scene_name):
+        """Fin de frame: rapport toutes les every_frames frames"""
+        self.frames += 1
+        if self.frames % self.every_frames == 0:
+            print(self.report(scene_name))
+
+    def report(self, scene_name="") -> str:
+        """Lignes dont la memoire retenue a le plus augmente depuis le dernier rapport"""
+        snapshot = tracemalloc.take_snapshot().filter_traces(self.filters)
+        previous, self.previous = self.previous, snapshot
+        current, peak = tracemalloc.get_traced_memory()
+        gen0 = gc.get_stats()[0]["collections"]
+        gen0_per_frame = (gen0 - self.gen0_collections) / self.every_frames
+        self.gen0_collections = gen0
+        lines = [f"[Allocations] frame {self.frames} ({scene_name}): "
+                 f"{current / 1024:.0f} Ko suivis, pic {peak / 1024:.0f} Ko, "
+                 f"{gen0_per_frame:.2f} collectes gen0/frame (objets temporaires)"]
+        if previous is None:
+            lines.append("  (premier snapshot: reference)")
+            return "\n".join(lines)
+
+        stats = [stat for stat in snapshot.compare_to(previous, "lineno") if stat.count_diff > 0]
+        stats.sort(key=lambda stat: -stat.count_diff)
+        for stat in stats[:self.top]:
+            frame = stat.traceback[0]
+            filename = frame.filename.replace(str(BASE_DIR), "").lstrip("/\\")
+            lines.append(f"  {stat.count_diff / self.every_frames:7.1f} blocs retenus en plus/frame "
+                         f"{stat.size_diff / 1024:+8.1f} Ko  {filename}:{frame.lineno}")
+        return "\n".join(lines)
+
+    def stop(self):
+        """Arrete tracemalloc"""
+        self.previous = None
+        tracemalloc.stop()
+
+
+class GcPolicy:
+    """
+    Ramasse-miettes du gameplay: apres le chargement d'un stage, collecte puis gel des
+    objets vivants (exclus des collectes suivantes) et seuils releves pour que seules
+    les jeunes generations soient collectees en jeu. Les seuils d'origine et une
+    collecte complete reviennent a la sortie du gameplay (transition, pause).
+    """
+
+    def __init__(self, thresholds=GC_GAMEPLAY_THRESHOLDS, verbose=False):
+        """
+        Args:
+            thresholds: Seuils gc.set_threshold pendant le gameplay
+            verbose: True pour afficher chaque collecte de chargement (--track-allocations)
+        """
+        self.thresholds = thresholds
+        self.verbose = verbose
+        self.default_thresholds = gc.get_threshold()
+        self.active = False
+
+    def stage_loaded(self):
+        """Stage charge: collecte complete, gel des objets du stage, seuils du gameplay"""
+        start = time.perf_counter()
+        # Les objets geles du stage precedent redeviennent collectables
+        gc.unfreeze()
+        collected = gc.collect()
+        gc.freeze()
+        gc.set_threshold(*self.thresholds)
+        self.active = True
+        if self.verbose:
+            print(f"[GC] stage charge: {collected} objets collectes, {gc.get_freeze_count()} geles "
+                  f"({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+    def suspend(self):
+        """Sortie du gameplay: seuils d'origine et collecte complete (pendant la transition)"""
+        if not self.active:
+            return
+        self.active = False
+        gc.set_threshold(*self.default_thresholds)
+        gc.unfreeze()
+        gc.collect()
@@ -0,0 +1,109 @@
+"""
+Rockstar Bros - Animations pre-rendues
+Titres pulses et zooms d'images sans police ni gros redimensionnement par frame
+"""
+
+import pygame
+
+from assets import get_font
+from settings import ANIM_SCALE_STEP
+
+
+def _quantize(scale, step):
+    """Index du pas de quantification le plus proche d'une echelle"""
+    return int(round(scale / step))
+
+
+class PulsingTitle:
+    """
+    Texte avec ombre rendu une seule fois a sa taille maximale.
+    Les tailles intermediaires (pulsation) sont reduites depuis ce rendu
+    et gardees par echelle quantifiee.
+    """
+
+    def __init__(self, text, font_path, size, color, shadow_color, shadow_offset=3,
+                 max_scale=1.0, scale_step=ANIM_SCALE_STEP):
+        """
+        Args:
+            text: Texte a afficher
+            font_path: Police (None = police par defaut)
+            size: Taille de police a l'echelle 1.0
+            color, shadow_color: Couleurs du texte et de l'ombre
+            shadow_offset: Decalage de l'ombre en pixels a l'echelle 1.0
+            max_scale: Plus grande echelle utilisee par l'animation
+            scale_step: Pas de quantification des echelles
+        """
+        self.max_scale = max_scale
+        self.scale_step = scale_step
+        self.max_index = _quantize(max_scale, scale_step)
+
+        font_size = int(size * max_scale)
+        try:
+            font = get_font(font_path, font_size)
+        except (pygame.error, FileNotFoundError):
+            font = get_font(None, font_size)
+
+        text_surf = font.render(text, True, color)
+        shadow_surf = font.render(text, True, shadow_color)
+        offset = int(round(shadow_offset * max_scale))
+
+        # Texte + ombre dans une seule surface
+        width, height = text_surf.get_size()
+        self.master = pygame.Surface((width + offset, height + offset), pygame.SRCALPHA)
+        self.master.blit(shadow_surf, (offset, offset))
+        self.master.blit(text_surf, (0, 0))
+        self.text_size = (width, height)
+
+        self.frames = {}
+
+    def frame(self, scale=1.0):
+        """Surface pour une echelle donnee (ombre incluse)"""
+        index = min(_quantize(scale, self.scale_step), self.max_index)
+        surf = self.frames.get(index)
+        if surf is None:
+            ratio = index / self.max_index
+            if ratio >= 1.0:
+                surf = self.master
+            else:
+                master_width, master_height = self.master.get_size()
+                size = (max(1, int(master_width * ratio)), max(1, int(master_height * ratio)))
+                surf = pygame.transform.smoothscale(self.master, size)
+            self.frames[index] = surf
+        return surf, index / self.max_index
+
+    def prebake(self, min_scale, max_scale=None):
+        """Prepare toutes les frames d'un intervalle d'echelles"""
+        max_scale = self.max_scale if max_scale is None else max_scale
+        for index in range(_quantize(min_scale, self.scale_step), _quantize(max_scale, self.scale_step) + 1):
+            self.frame(index * self.scale_step)
+
+    def draw(self, canvas, center, scale=1.0, alpha=255):
+        """Dessine le titre centre (le centre est celui du texte, sans l'ombre) comme texte du canevas"""
+        surf, ratio = self.frame(scale)
+        text_width = self.text_size[0] * ratio
+        text_height = self.text_size[1] * ratio
+        canvas.text(surf, (int(center[0] - text_width / 2), int(center[1] - text_height / 2)), alpha)
+
+
+class ZoomSprite:
+    """
+    Image zoomee avec une echelle quantifiee, dessinee par un canevas de
+    render.OverlayCanvas (redimensionnee par le renderer en GPU; en logiciel, les
+    dernieres tailles sont gardees: un zoom progressif ne redimensionne qu'une fois par pas).
+    """
+
+    def __init__(self, image, scale_step=ANIM_SCALE_STEP):
+        self.image = image
+        self.scale_step = scale_step
+
+    def size(self, zoom):
+        """Taille de l'image pour un zoom donne (quantifie)"""
+        zoom = _quantize(zoom, self.scale_step) * self.scale_step
+        width, height = self.image.get_size()
+        return max(1, int(width * zoom)), max(1, int(height * zoom))
+
+    def draw(self, canvas, center, zoom=1.0, alpha=255):
+        """Dessine l'image zoomee centree"""
+        rect = pygame.Rect((0, 0), self.size(zoom))
+        rect.center = center
+        canvas.blit_scaled(self.image, rect, alpha)
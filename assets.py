@@ -0,0 +1,245 @@
+"""
+Rockstar Bros - Cache des assets
+Images et polices partagees, prechargement des images en arriere-plan
+"""
+
+import queue
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+import pygame
+
+import tracing
+from startup_profile import span
+
+
+# Une image est identifiee par (chemin, taille, alpha)
+# taille: None = taille d'origine, (w, h) = redimensionnee,
+#         (None, h) = hauteur fixe et largeur proportionnelle
+ImageKey = Tuple[str, Optional[tuple], bool]
+
+_images: Dict[ImageKey, pygame.Surface] = {}
+_fonts: Dict[Tuple[str, int], pygame.font.Font] = {}
+
+
+def _target_size(original_size, size):
+    """Taille finale d'une image selon la taille demandee"""
+    width, height = size
+    if width is None:
+        original_width, original_height = original_size
+        width = int(original_width * height / original_height)
+    return (width, height)
+
+
+# Formats de reference quand aucun mode video n'est ouvert (backend GPU)
+_formats: Dict[bool, pygame.Surface] = {}
+
+
+def _convert(surface, alpha):
+    """Convertit au format de l'ecran (thread principal uniquement)"""
+    if pygame.display.get_surface() is None:
+        reference = _formats.get(alpha)
+        if reference is None:
+            reference = pygame.Surface((1, 1), pygame.SRCALPHA if alpha else 0, 32)
+            _formats[alpha] = reference
+        return surface.convert(reference)
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
+def load_image(path, size=None, alpha=True) -> pygame.Surface:
+    """
+    Charge une image (convertie et redimensionnee) en passant par le cache.
+    La surface retournee est partagee: ne pas la modifier, faire une copie.
+
+    Args:
+        path: Chemin du fichier image
+        size: None, (w, h) ou (None, h) pour garder les proportions
+        alpha: True pour convert_alpha(), False pour convert()
+
+    Raises:
+        pygame.error, FileNotFoundError: si l'image ne peut pas etre chargee
+    """
+    key = (str(path), size, alpha)
+    image = _images.pop(key, None)
+    if image is not None:
+        # Remis en fin de dict: le cache est vide par les plus anciens (evict_images)
+        _images[key] = image
+        return image
+
+    # Recuperer ce que le thread de prechargement a deja decode
+    if _preloader is not None:
+        _preloader.collect()
+        image = _images.get(key)
+        if image is not None:
+            return image
+
+    base_key = (str(path), None, alpha)
+    base = _images.get(base_key)
+    if base is None:
+        with span("asset", Path(path).name), tracing.span("asset", Path(path).name):
+            base = _convert(pygame.image.load(str(path)), alpha)
+        _images[base_key] = base
+    if size is None:
+        return base
+
+    with span("asset", f"{Path(path).name} {size}"), tracing.span("asset", f"scale {Path(path).name}"):
+        image = pygame.transform.scale(base, _target_size(base.get_size(), size))
+    _images[key] = image
+    return image
+
+
+def get_font(path, size) -> pygame.font.Font:
+    """
+    Police partagee (une seule instance par fichier et taille).
+    path=None donne la police par defaut de pygame.
+
+    Raises:
+        pygame.error, FileNotFoundError: si la police ne peut pas etre chargee
+    """
+    key = (str(path) if path is not None else None, size)
+    font = _fonts.get(key)
+    if font is None:
+        with span("font", f"{Path(path).name if path is not None else 'defaut'} {size}"):
+            font = pygame.font.Font(key[0], size)
+        _fonts[key] = font
+    return font
+
+
+def _spec_keys(spec):
+    """Cles de cache d'un tuple (chemin, taille[, alpha]): l'image et son original"""
+    path, size = spec[0], spec[1]
+    alpha = spec[2] if len(spec) > 2 else True
+    return ((str(path), size, alpha), (str(path), None, alpha))
+
+
+def release_images(specs, keep=()) -> int:
+    """
+    Retire des images du cache (la memoire est rendue quand plus rien ne les reference).
+
+    Args:
+        specs: Tuples (chemin, taille[, alpha]) a liberer
+        keep: Tuples a garder meme s'ils figurent dans specs
+
+    Returns:
+        Nombre d'entrees retirees du cache
+    """
+    kept = {key for spec in keep for key in _spec_keys(spec)}
+    released = 0
+    for spec in specs:
+        for key in _spec_keys(spec):
+            if key not in kept and _images.pop(key, None) is not None:
+                released += 1
+    return released
+
+
+def cached_images():
+    """(nom de fichier, surface) de chaque image en cache, pour resources"""
+    for (path, size, _), image in list(_images.items()):
+        name = Path(path).name
+        yield (name if size is None else f"{name} {size}"), image
+
+
+def evict_images(nbytes) -> int:
+    """Retire les images les moins recemment demandees jusqu'a liberer nbytes; retourne les octets retires"""
+    freed = 0
+    for key in list(_images):
+        if freed >= nbytes:
+            break
+        image = _images.pop(key)
+        width, height = image.get_size()
+        freed += width * height * image.get_bytesize()
+    return freed
+
+
+def clear_cache():
+    """Vide les caches d'images et de polices"""
+    _images.clear()
+    _fonts.clear()
+
+
+class AssetPreloader:
+    """
+    Decode et redimensionne des images sur un thread de travail.
+    Le thread ne produit que des surfaces non converties; la conversion au
+    format de l'ecran se fait sur le thread principal dans collect().
+    """
+
+    def __init__(self):
+        self._requests: "queue.Queue[ImageKey]" = queue.Queue()
+        self._results: "queue.Queue[Tuple[ImageKey, Optional[pygame.Surface], Optional[pygame.Surface]]]" = queue.Queue()
+        self._queued: Set[ImageKey] = set()
+        self._thread: Optional[threading.Thread] = None
+
+    def request(self, specs: Iterable[tuple]):
+        """
+        Demande le prechargement d'images.
+
+        Args:
+            specs: tuples (chemin, taille) ou (chemin, taille, alpha), voir load_image
+        """
+        for spec in specs:
+            path, size = spec[0], spec[1]
+            alpha = spec[2] if len(spec) > 2 else True
+            key = (str(path), size, alpha)
+            if key in _images or key in self._queued:
+                continue
+            self._queued.add(key)
+            self._requests.put(key)
+
+        if self._queued and self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="asset-preloader", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        """Boucle du thread de travail"""
+        while True:
+            key = self._requests.get()
+            path, size, alpha = key
+            base = scaled = None
+            try:
+                with span("asset", Path(path).name), tracing.span("asset", Path(path).name):
+                    base = pygame.image.load(path)
+                    if size is not None:
+                        scaled = pygame.transform.scale(base, _target_size(base.get_size(), size))
+            except (pygame.error, FileNotFoundError):
+                # load_image() relevera l'erreur au moment du vrai chargement
+                pass
+            except Exception as e:
+                # Le thread doit survivre et toujours repondre, sinon la transition attend
+                print(f"Warning: Could not preload {path}: {e!r}")
+                base = scaled = None
+            self._results.put((key, base, scaled))
+
+    def collect(self):
+        """Integre au cache les images decodees (thread principal)"""
+        while True:
+            try:
+                key, base, scaled = self._results.get_nowait()
+            except queue.Empty:
+                return
+            self._queued.discard(key)
+            if base is None:
+                continue
+            path, size, alpha = key
+            base_key = (path, None, alpha)
+            if base_key not in _images:
+                _images[base_key] = _convert(base, alpha)
+            if scaled is not None:
+                _images[key] = _convert(scaled, alpha)
+
+    def is_ready(self) -> bool:
+        """True quand toutes les images demandees sont dans le cache"""
+        self.collect()
+        return not self._queued
+
+
+_preloader: Optional[AssetPreloader] = None
+
+
+def get_preloader() -> AssetPreloader:
+    """Retourne l'instance globale du preloader"""
+    global _preloader
+    if _preloader is None:
+        _preloader = AssetPreloader()
+    return _preloader
@@ -0,0 +1,227 @@
+"""
+Rockstar Bros - Banque audio
+Chaque son est decode une seule fois pour tout le jeu, a sa premiere lecture;
+les scenes recoivent des handles qui gerent volume, canaux et nombre de voix.
+Les versions OGG produites par tools/build_audio.py sont preferees aux WAV.
+"""
+
+import math
+from array import array
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, Optional
+
+import pygame
+
+import tracing
+
+from settings import (
+    SND_DIR, COMPRESSED_AUDIO_SUFFIX,
+    AUDIO_CHANNELS, AUDIO_RESERVED_CHANNELS, AUDIO_MAX_VOICES,
+)
+
+
+def resolve_sound_path(filename) -> Path:
+    """
+    Fichier a charger pour un son: la version compressee (.ogg) si elle existe,
+    sinon le fichier d'origine.
+    """
+    path = SND_DIR / filename
+    compressed = path.with_suffix(COMPRESSED_AUDIO_SUFFIX)
+    if path.suffix.lower() != COMPRESSED_AUDIO_SUFFIX and compressed.exists():
+        return compressed
+    return path
+
+
+def make_beep(frequency=1000, duration_ms=30, volume=0.6):
+    """Bip court genere au format du mixer (None si le mixer est absent)"""
+    init = pygame.mixer.get_init()
+    if not init:
+        return None
+    rate, size, channels = init
+    if size != -16:
+        return None
+    samples = array("h")
+    count = rate * duration_ms // 1000
+    for i in range(count):
+        # Enveloppe decroissante pour eviter un clic a la fin
+        value = int(32767 * volume * (1 - i / count) * math.sin(2 * math.pi * frequency * i / rate))
+        samples.extend([value] * channels)
+    return pygame.mixer.Sound(buffer=samples.tobytes())
+
+
+def play_music(filename, volume=0.5, loops=-1):
+    """
+    Lance une musique en streaming (pygame.mixer.music ne decode pas tout le fichier).
+
+    Raises:
+        pygame.error, FileNotFoundError: si la musique ne peut pas etre chargee
+    """
+    music_path = str(resolve_sound_path(filename))
+    with tracing.span("audio", f"music {filename}"):
+        try:
+            pygame.mixer.music.load(music_path)
+        except pygame.error:
+            pygame.mixer.music.load(music_path, namehint=".mp3")
+        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play(loops)
+
+
+class SoundHandle:
+    """
+    Acces d'une scene a un son de la banque.
+    Plusieurs handles peuvent partager le meme son avec des volumes differents.
+    Le son n'est decode qu'a la premiere lecture.
+    """
+
+    __slots__ = ("bank", "name", "volume", "loop_channel", "max_voices", "_voices")
+
+    def __init__(self, bank, name, volume, loop_channel=None, max_voices=AUDIO_MAX_VOICES):
+        self.bank = bank
+        self.name = name
+        self.volume = volume
+        self.loop_channel = loop_channel
+        self.max_voices = max_voices
+        self._voices: Deque[pygame.mixer.Channel] = deque()
+
+    @property
+    def sound(self) -> Optional[pygame.mixer.Sound]:
+        """Son decode (None s'il n'a pas pu etre decode)"""
+        return self.bank.decode(self.name)
+
+    def set_volume(self, volume):
+        """Volume des prochaines lectures (0.0 - 1.0)"""
+        self.volume = volume
+
+    def play(self, loops=0) -> Optional[pygame.mixer.Channel]:
+        """
+        Joue le son. Les sons avec loop_channel jouent sur leur canal reserve;
+        les autres prennent un canal libre sans jamais voler un canal reserve.
+        """
+        sound = self.sound
+        if sound is None:
+            return None
+
+        if self.loop_channel is not None:
+            channel = pygame.mixer.Channel(self.loop_channel)
+        else:
+            # Oublier les voix terminees ou reprises par un autre son
+            while self._voices and self._voices[0].get_sound() is not sound:
+                self._voices.popleft()
+            if len(self._voices) >= self.max_voices:
+                # Limite atteinte: on relance la plus ancienne voix de ce son
+                channel = self._voices.popleft()
+            else:
+                channel = pygame.mixer.find_channel(True)
+            if channel is None:
+                return None
+            self._voices.append(channel)
+
+        channel.set_volume(self.volume)
+        channel.play(sound, loops=loops)
+        return channel
+
+    def stop(self):
+        """Arrete toutes les lectures de ce son"""
+        sound = self.bank.decoded(self.name)
+        if sound is not None:
+            sound.stop()
+        self._voices.clear()
+
+
+class AudioBank:
+    """Sons decodes une seule fois (a la demande), avec leur taille en memoire"""
+
+    def __init__(self):
+        self._sounds: Dict[str, Optional[pygame.mixer.Sound]] = {}
+        self.sizes: Dict[str, int] = {}  # octets PCM par fichier decode
+        self._channels_ready = False
+
+    def _setup_channels(self):
+        """Configure les canaux du mixer (une fois le mixer initialise)"""
+        if self._channels_ready or not pygame.mixer.get_init():
+            return
+        pygame.mixer.set_num_channels(AUDIO_CHANNELS)
+        pygame.mixer.set_reserved(AUDIO_RESERVED_CHANNELS)
+        self._channels_ready = True
+
+    def decoded(self, filename) -> Optional[pygame.mixer.Sound]:
+        """Son deja decode, sans declencher de decodage"""
+        return self._sounds.get(filename)
+
+    def decode(self, filename) -> Optional[pygame.mixer.Sound]:
+        """Decode un son au premier appel (None si le decodage echoue)"""
+        if filename in self._sounds:
+            return self._sounds[filename]
+
+        sound = None
+        try:
+            with tracing.span("audio", f"decode {filename}"):
+                sound = pygame.mixer.Sound(str(resolve_sound_path(filename)))
+            frequency, size, channels = pygame.mixer.get_init()
+            self.sizes[filename] = int(sound.get_length() * frequency) * channels * (abs(size) // 8)
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Impossible de charger le son {filename}: {e}")
+        self._sounds[filename] = sound
+        return sound
+
+    def get(self, filename, volume=0.5, loop_channel=None,
+            max_voices=AUDIO_MAX_VOICES) -> Optional[SoundHandle]:
+        """
+        Retourne un handle sur un son, ou None si le fichier ou le mixer manque.
+        Le decodage est differe a la premiere lecture.
+
+        Args:
+            filename: Nom du fichier dans SND_DIR
+            volume: Volume de lecture (0.0 - 1.0)
+            loop_channel: Canal reserve (sons en boucle), None = canal libre
+            max_voices: Lectures simultanees maximum de ce son
+        """
+        self._setup_channels()
+        if not pygame.mixer.get_init() or not resolve_sound_path(filename).exists():
+            return None
+        return SoundHandle(self, filename, volume, loop_channel, max_voices)
+
+    def decoded_sounds(self):
+        """(nom, son) de chaque son decode, pour resources"""
+        for filename, sound in list(self._sounds.items()):
+            if sound is not None:
+                yield filename, sound
+
+    def evict(self, nbytes) -> int:
+        """Libere les plus gros sons qui ne jouent pas jusqu'a nbytes; retourne les octets liberes"""
+        freed = 0
+        for filename in sorted(self.sizes, key=self.sizes.get, reverse=True):
+            if freed >= nbytes:
+                break
+            sound = self._sounds.get(filename)
+            if sound is not None and sound.get_num_channels() == 0:
+                freed += self.sizes[filename]
+                self.release([filename])
+        return freed
+
+    def memory_usage(self) -> int:
+        """Memoire totale des sons decodes, en octets"""
+        return sum(self.sizes.values())
+
+    def release(self, filenames):
+        """Libere certains sons (ils seront redecodes a la prochaine lecture)"""
+        for filename in filenames:
+            self._sounds.pop(filename, None)
+            self.sizes.pop(filename, None)
+
+    def clear(self):
+        """Libere tous les sons (ils seront redecodes a la prochaine lecture)"""
+        self._sounds.clear()
+        self.sizes.clear()
+
+
+_bank: Optional[AudioBank] = None
+
+
+def get_audio_bank() -> AudioBank:
+    """Retourne l'instance globale de la banque audio"""
+    global _bank
+    if _bank is None:
+        _bank = AudioBank()
+    return _bank
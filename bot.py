@@ -0,0 +1,507 @@
+"""
+Rockstar Bros - Bot joueur
+Controleur de simulation (voir simulation.py) qui joue a partir de l'etat du jeu.
+Le sol, les trous et les plateformes du stage (lus via le LevelLoader) donnent un
+graphe des positions ou le joueur tient debout, reliees par des pas et des sauts
+simules avec la physique du joueur: le bot suit le plus court chemin vers la fin
+du stage (ou vers le boss), tire sur les ennemis devant lui et saute les projectiles
+(ou se baisse dessous).
+Memes actions que le clavier: left, right, jump, crouch, attack, ultimate.
+"""
+
+import heapq
+import math
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import pygame
+
+from settings import (
+    FPS, HEIGHT, LANE_ACTIONS, PLAYER_SPEED, PLAYER_JUMP_FORCE, GRAVITY, MAX_FALL_SPEED, MYSTERY_BLOCK_SIZE,
+    BOT_SHOOT_RANGE, BOT_THREAT_RANGE, BOT_BOSS_DISTANCE, BOT_MAX_AIR_FRAMES, BOT_MAX_NODES,
+    BOT_JUMP_COST, BOT_SAFETY_FRAMES, BOT_MAX_WAIT_FRAMES, BOT_HUNT_RANGE, BOT_HUNT_FRAMES,
+    BOT_STUCK_FRAMES, BOT_RUSH_FRAMES, RIVAL_PROJECTILE_SPEED,
+)
+from entities.projectile import RivalProjectile
+from level_loader import get_loader
+
+
+# Chute sous cette hauteur: le joueur est perdu (voir GameplayScene, fall_limit)
+_FALL_Y = HEIGHT
+# Une position debout: (x // PLAYER_SPEED, y)
+Key = Tuple[int, int]
+# Une arete: (action "walk"/"jump", direction, cout en frames, position d'arrivee)
+Edge = Tuple[str, int, int, Key]
+
+
+def predict(rect, solids, direction, velocity_y, frames, trace=None) -> Tuple[pygame.Rect, Optional[str], int]:
+    """
+    Physique du joueur (Player.update) en tenant une direction.
+    trace: liste qui recoit la position du joueur a chaque frame
+
+    Returns:
+        (position, issue, frames ecoulees): issue "landed" a l'atterrissage,
+        "fall" dans un trou, None si le joueur est encore en l'air
+    """
+    rect = rect.copy()
+    for frame in range(1, frames + 1):
+        velocity_y = min(velocity_y + GRAVITY, MAX_FALL_SPEED)
+        rect.x += PLAYER_SPEED * direction
+        hit = rect.collidelist(solids)
+        if hit >= 0:
+            if direction > 0:
+                rect.right = solids[hit].left
+            else:
+                rect.left = solids[hit].right
+
+        # Pas entiers puis reste arrondi par pygame.Rect (Player._move_vertical)
+        sign = 1 if velocity_y > 0 else -1
+        whole = int(abs(velocity_y))
+        rect.y += sign * whole + math.floor(sign * (abs(velocity_y) - whole) + 0.5)
+        hit = rect.collidelist(solids)
+        if hit >= 0:
+            if velocity_y > 0:
+                rect.bottom = solids[hit].top
+                return rect, "landed", frame
+            rect.top = solids[hit].bottom
+            velocity_y = 0
+        if trace is not None:
+            trace.append(rect.copy())
+        if rect.top > _FALL_Y:
+            return rect, "fall", frame
+    return rect, None, frames
+
+
+class RouteGraph:
+    """Positions debout d'un stage et pas/sauts qui les relient (construit a la demande)"""
+
+    def __init__(self, solids: List[pygame.Rect]):
+        self.solids = solids
+        self.rects: Dict[Key, pygame.Rect] = {}
+        self.edges: Dict[Key, List[Edge]] = {}
+
+    @staticmethod
+    def key(rect) -> Key:
+        """Position debout quantifiee (un pas de course)"""
+        return rect.x // PLAYER_SPEED, rect.y
+
+    def add(self, rect) -> Key:
+        """Ajoute une position (la premiere vue represente sa case)"""
+        key = self.key(rect)
+        if key not in self.rects:
+            self.rects[key] = rect.copy()
+        return key
+
+    def near(self, rect) -> List[pygame.Rect]:
+        """Obstacles a portee d'un saut"""
+        reach = PLAYER_SPEED * BOT_MAX_AIR_FRAMES + rect.width
+        return [solid for solid in self.solids
+                if solid.right >= rect.left - reach and solid.left <= rect.right + reach]
+
+    def neighbours(self, key) -> List[Edge]:
+        """Aretes d'une position du graphe (calculees une fois)"""
+        edges = self.edges.get(key)
+        if edges is None:
+            edges = self.edges[key] = self.moves(self.rects[key])
+        return edges
+
+    def moves(self, rect) -> List[Edge]:
+        """Aretes depuis une position exacte: un pas a gauche/droite, un saut dans les trois directions"""
+        key = self.key(rect)
+        edges = []
+        solids = self.near(rect)
+        for direction in (1, -1):
+            # Un pas, et la chute qui suit s'il n'y a plus de sol
+            end, outcome, frames = predict(rect, solids, direction, 0, 1)
+            if outcome is None:
+                end, outcome, more = predict(end, solids, direction, GRAVITY, BOT_MAX_AIR_FRAMES)
+                frames += more
+            if outcome == "landed" and self.key(end) != key:
+                edges.append(("walk", direction, frames, self.add(end)))
+        for direction in (1, 0, -1):
+            end, outcome, frames = predict(rect, solids, direction, -PLAYER_JUMP_FORCE, BOT_MAX_AIR_FRAMES)
+            if outcome == "landed" and self.key(end) != key:
+                edges.append(("jump", direction, frames + BOT_JUMP_COST, self.add(end)))
+        return edges
+
+    def route(self, rect, goal: Callable[[pygame.Rect], bool], limit=None) -> Optional[List[Edge]]:
+        """Plus court chemin (en frames, au plus limit) vers une position qui satisfait goal; None si aucun"""
+        start = self.add(rect)
+        costs = {start: 0}
+        previous: Dict[Key, Tuple[Key, Edge]] = {}
+        queue = [(0, start)]
+        while queue and len(costs) < BOT_MAX_NODES:
+            cost, key = heapq.heappop(queue)
+            if cost > costs[key]:
+                continue
+            if limit is not None and cost > limit:
+                break
+            if goal(self.rects[key]):
+                path = []
+                while key != start:
+                    key, edge = previous[key]
+                    path.append(edge)
+                return path[::-1]
+            # Premieres aretes depuis la position exacte du joueur (pas celle de sa case)
+            for edge in self.moves(rect) if key == start else self.neighbours(key):
+                target = edge[3]
+                new_cost = cost + edge[2]
+                if new_cost < costs.get(target, new_cost + 1):
+                    costs[target] = new_cost
+                    previous[target] = (key, edge)
+                    heapq.heappush(queue, (new_cost, target))
+        return None
+
+
+# Graphes deja explores, par stage (la geometrie ne change pas pendant une partie)
+_graphs: Dict[tuple, RouteGraph] = {}
+
+
+def route_graph(level_id, stage_id) -> Optional[RouteGraph]:
+    """Graphe d'un stage construit sur sa geometrie (sol, plateformes, mystery blocks)"""
+    cache_key = (level_id, stage_id, PLAYER_SPEED, PLAYER_JUMP_FORCE, GRAVITY)
+    graph = _graphs.get(cache_key)
+    if graph is None:
+        stage = get_loader().get_stage(level_id, stage_id)
+        if stage is None:
+            return None
+        solids = [pygame.Rect(s.x, s.y, s.width, HEIGHT - s.y + 100) for s in stage.ground_segments]
+        solids += [pygame.Rect(p.x, p.y, p.width, p.height) for p in stage.platforms]
+        solids += [pygame.Rect(b.x, b.y, MYSTERY_BLOCK_SIZE, MYSTERY_BLOCK_SIZE) for b in stage.mystery_blocks]
+        graph = _graphs[cache_key] = RouteGraph(solids)
+    return graph
+
+
+class BotController:
+    """Bot jouable en simulation headless (interface de ScriptedController)"""
+
+    def __init__(self):
+        self.graph: Optional[RouteGraph] = None
+        self.level_width = 0
+        self.path: List[Edge] = []
+        self.expected: Optional[Key] = None
+        self.air_direction = 0
+        self.waited = 0
+        self.boss = None
+        self.best_right = 0
+        self.stalled = 0
+        self.rush = 0
+
+    def reset(self, scene):
+        """Debut d'un stage: graphe de sa geometrie"""
+        self.graph = route_graph(scene.current_level_id, scene.current_stage_id)
+        self.level_width = scene.level_width
+        self.path = []
+        self.expected = None
+        self.air_direction = 0
+        self.waited = 0
+        self.best_right = 0
+        self.stalled = 0
+        self.rush = 0
+        # Taille d'un tir de rival (pour les tirs pas encore partis, voir _hit_frame)
+        self.rival_shot = RivalProjectile(0, 0, 1, 0).rect
+        # Accroupi pour cette frame (voir _avoid)
+        self.crouching = False
+
+    def step(self, scene, now_ms) -> Tuple[FrozenSet[str], Iterable[str]]:
+        """Actions maintenues et actions appuyees pour la frame"""
+        player = scene.player
+        rect = self._standing(player)
+        pressed = []
+        self.crouching = False
+
+        # Pendant l'ultime tout est fige: jouer les notes de la sequence
+        if scene.ultimate_active:
+            return frozenset(), self._play_notes(scene.ultimate_track, now_ms)
+        if scene.boss_intro_active or self.graph is None:
+            return frozenset(), pressed
+
+        boss = self.boss = scene.boss if scene.boss is not None and scene.boss in scene.enemies else None
+        jump = False
+        rushing = self._rushing(rect, boss)
+        if player.on_ground:
+            target = boss or (None if rushing else self._hunted(scene, rect))
+            direction, jump = self._follow(rect, target, player.facing_right)
+            leaving = jump or (direction != 0 and not self._supported(rect.move(PLAYER_SPEED * direction, 0)))
+            threat = self._threat(scene, rect) if boss is None else None
+            if threat is not None:
+                # Ennemi proche dans la ligne de tir: s'arreter et lui faire face
+                toward = 1 if threat.rect.centerx > rect.centerx else -1
+                direction = 0 if player.facing_right == (toward > 0) else toward
+                jump = False
+                self.expected = None
+                leaving = direction != 0 and not self._supported(rect.move(PLAYER_SPEED * direction, 0))
+            direction, jump, leaving = self._avoid(scene, player, boss, direction, jump, leaving, not rushing)
+            if leaving and not self._lands(rect, direction, jump):
+                # Jamais de saut ni de pas qui finit dans un trou (demi-tour au bord du vide)
+                direction, jump = 0, False
+        else:
+            direction = self._air_direction(player, rect)
+
+        facing_right = player.facing_right if direction == 0 else direction > 0
+        # Tir: ennemi devant a portee et a hauteur du projectile
+        if player.can_attack() and self._target_ahead(scene, rect, facing_right):
+            pressed.append("attack")
+        # Ennemi volant juste devant: sauter pour le mettre dans l'axe du tir
+        elif player.on_ground and not jump and self._flyer_above(scene, rect, facing_right) \
+                and self._lands(rect, direction):
+            jump = True
+
+        if player.can_use_ultimate() and (boss is not None or self._crowd_ahead(scene, rect)):
+            pressed.append("ultimate")
+        if jump:
+            pressed.append("jump")
+            self.air_direction = direction
+            # Saut hors du chemin prevu: recalcule a l'atterrissage
+            if self.expected is None:
+                self.path = []
+        hold = {"right"} if direction > 0 else {"left"} if direction < 0 else set()
+        if self.crouching:
+            hold.add("crouch")
+        return frozenset(hold), pressed
+
+    def _air_direction(self, player, rect) -> int:
+        """
+        Direction en l'air: celle du saut, ou une autre si elle finit dans un trou
+        (trajectoire changee par un rebond sur un ennemi ou un plafond)
+        """
+        for direction in (self.air_direction, 0, -self.air_direction):
+            _, outcome, _ = predict(rect, self.graph.near(rect), direction, player.velocity_y, BOT_MAX_AIR_FRAMES)
+            if outcome == "landed":
+                return direction
+        return self.air_direction
+
+    @staticmethod
+    def _standing(player) -> pygame.Rect:
+        """Position du joueur debout (meme accroupi): les calculs de chemin se font debout"""
+        return pygame.Rect(player.rect.x, player.rect.bottom - player.normal_height,
+                           player.rect.width, player.normal_height)
+
+    # --- Deplacement ---
+
+    def _rushing(self, rect, boss) -> bool:
+        """
+        Bloque sans progresser depuis BOT_STUCK_FRAMES frames (tireur hors d'atteinte,
+        ennemis qui gardent un passage): foncer sans attendre ni detour pendant un temps.
+        """
+        if boss is not None or rect.right > self.best_right:
+            self.best_right = max(self.best_right, rect.right)
+            self.stalled = 0
+        else:
+            self.stalled += 1
+        if self.stalled >= BOT_STUCK_FRAMES:
+            self.stalled = 0
+            self.rush = BOT_RUSH_FRAMES
+        if self.rush > 0:
+            self.rush -= 1
+            return True
+        return False
+
+    def _avoid(self, scene, player, boss, direction, jump, leaving, patient=True) -> Tuple[int, bool, bool]:
+        """
+        Corrige le deplacement prevu pour eviter ennemis et projectiles (patient: attendre
+        si besoin). Se baisser sur place met self.crouching.
+        """
+        rect = self._standing(player)
+        hit = self._hit_frame(scene, rect, 0, None)
+        if hit is not None:
+            # Ennemi ou projectile sur le joueur: garder le plan s'il l'evite, sinon se
+            # baisser s'il passe au-dessus, ou sauter sur place, en arriere ou par-dessus
+            # (le coup le plus tardif, au mieux aucun); sur place seulement face au boss,
+            # pour continuer a tirer
+            if not (leaving and self._safe(scene, rect, direction, jump)):
+                crouched = pygame.Rect(rect.x, rect.bottom - player.crouch_height,
+                                       rect.width, player.crouch_height)
+                if self._hit_frame(scene, crouched, 0, None) is None:
+                    self.crouching = True
+                    return 0, False, False
+                back = -1 if player.facing_right else 1
+                best = (hit, direction, jump, leaving)
+                for escape in (0,) if boss is not None else (0, back, -back):
+                    if self._lands(rect, escape):
+                        escape_hit = self._hit_frame(scene, rect, escape, True)
+                        if escape_hit is None:
+                            return escape, True, True
+                        if escape_hit > best[0]:
+                            best = (escape_hit, escape, True, True)
+                return best[1:]
+        elif patient and leaving and not self._safe(scene, rect, direction, jump) \
+                and self.waited < BOT_MAX_WAIT_FRAMES:
+            # Saut ou chute vers un ennemi ou un projectile: attendre que le passage se libere
+            self.waited += 1
+            self.expected = None
+            return 0, False, False
+        else:
+            self.waited = 0
+        return direction, jump, leaving
+
+    def _goal(self, target) -> Callable[[pygame.Rect], bool]:
+        """
+        Position visee: fin du stage, a portee de tir du boss (il s'arrete avant le
+        contact), ou un tireur dans la ligne de tir a distance moyenne.
+        """
+        if target is None:
+            return lambda rect: rect.right >= self.level_width - 50
+        if target is self.boss:
+            return lambda rect: abs(target.rect.centerx - rect.centerx) <= BOT_BOSS_DISTANCE
+        low, high = BOT_THREAT_RANGE / 2, BOT_SHOOT_RANGE / 2
+        return lambda rect: (low <= abs(target.rect.centerx - rect.centerx) <= high
+                             and self._in_line(rect, target))
+
+    def _follow(self, rect, target, facing_right) -> Tuple[int, bool]:
+        """(direction, sauter) pour la frame: arete suivante du chemin, recalcule si besoin"""
+        key = self.graph.key(rect)
+        path = None
+        if target is not None:
+            # Cible mobile: chemin recalcule a chaque frame (court pour un tireur)
+            limit = None if target is self.boss else BOT_HUNT_FRAMES
+            path = self.graph.route(rect, self._goal(target), limit)
+            if path == []:
+                # Arrive: se tourner vers la cible (un pas suffit)
+                self.path, self.expected = [], None
+                toward = 1 if target.rect.centerx > rect.centerx else -1
+                return (0 if facing_right == (toward > 0) else toward), False
+        if path is None and (key != self.expected or not self.path or target is not None):
+            path = self.graph.route(rect, self._goal(None))
+        if path is not None:
+            self.path = path
+        self.expected = None
+        if not self.path:
+            return 1, False
+        action, direction, _, self.expected = self.path.pop(0)
+        # Un pas qui finit en chute: garder la direction en l'air
+        self.air_direction = direction
+        return direction, action == "jump"
+
+    def _supported(self, rect) -> bool:
+        """Le joueur a quelque chose sous les pieds a cette position"""
+        return rect.move(0, 1).collidelist(self.graph.solids) >= 0
+
+    def _lands(self, rect, direction, jump=True) -> bool:
+        """Un saut (ou un pas hors du sol) maintenant ne finit pas dans un trou"""
+        velocity_y = -PLAYER_JUMP_FORCE if jump else 0
+        _, outcome, _ = predict(rect, self.graph.near(rect), direction, velocity_y, BOT_MAX_AIR_FRAMES)
+        return outcome == "landed"
+
+    @staticmethod
+    def _play_notes(track, now_ms) -> List[str]:
+        """Actions des pistes dont une note arrive pendant cette frame"""
+        song_ms = track.song_time(now_ms) - track.latency_ms
+        lanes = {note.lane for note in track.pending() if abs(note.time - song_ms) <= 500 / FPS}
+        return [LANE_ACTIONS[lane] for lane in sorted(lanes)]
+
+    # --- Ennemis ---
+
+    @staticmethod
+    def _alive(scene):
+        """Ennemis vivants (boss compris)"""
+        return [enemy for enemy in scene.enemies if not getattr(enemy, "is_dead", False)]
+
+    def _target_ahead(self, scene, rect, facing_right) -> bool:
+        """Un ennemi est dans la ligne de tir"""
+        line = rect.centery
+        for enemy in self._alive(scene):
+            dx = enemy.rect.centerx - rect.centerx
+            if (dx > 0) != facing_right or abs(dx) > BOT_SHOOT_RANGE:
+                continue
+            if enemy.rect.top - 10 <= line <= enemy.rect.bottom + 10:
+                return True
+        return False
+
+    def _threat(self, scene, rect):
+        """Ennemi le plus proche dans la ligne de tir, a moins de BOT_THREAT_RANGE"""
+        line = rect.centery
+        near = [enemy for enemy in self._alive(scene)
+                if abs(enemy.rect.centerx - rect.centerx) < BOT_THREAT_RANGE
+                and enemy.rect.top - 10 <= line <= enemy.rect.bottom + 10]
+        return min(near, key=lambda enemy: abs(enemy.rect.centerx - rect.centerx), default=None)
+
+    @staticmethod
+    def _in_line(rect, enemy) -> bool:
+        """L'ennemi est a hauteur du tir du joueur"""
+        return enemy.rect.top - 10 <= rect.centery <= enemy.rect.bottom + 10
+
+    def _hunted(self, scene, rect):
+        """Tireur proche hors de la ligne de tir (sur un autre etage): a aller chercher"""
+        shooters = [enemy for enemy in self._alive(scene)
+                    if getattr(enemy, "enemy_type", "") == "rival"
+                    and abs(enemy.rect.centerx - rect.centerx) < BOT_HUNT_RANGE
+                    and not self._in_line(rect, enemy)]
+        return min(shooters, key=lambda enemy: abs(enemy.rect.centerx - rect.centerx), default=None)
+
+    def _flyer_above(self, scene, rect, facing_right) -> bool:
+        """Un ennemi au-dessus de la ligne de tir, proche devant"""
+        for enemy in self._alive(scene):
+            dx = enemy.rect.centerx - rect.centerx
+            if (dx > 0) == facing_right and abs(dx) < BOT_THREAT_RANGE and enemy.rect.bottom < rect.centery:
+                return True
+        return False
+
+    def _crowd_ahead(self, scene, rect) -> bool:
+        """Au moins trois ennemis devant a portee: l'ultime vaut le coup"""
+        ahead = [enemy for enemy in self._alive(scene)
+                 if 0 < enemy.rect.centerx - rect.centerx < BOT_SHOOT_RANGE]
+        return len(ahead) >= 3
+
+    def _safe(self, scene, rect, direction, jump) -> bool:
+        """Ni ennemi ni projectile sur la trajectoire du joueur (voir _hit_frame)"""
+        return self._hit_frame(scene, rect, direction, jump) is None
+
+    def _hit_frame(self, scene, rect, direction, jump) -> Optional[int]:
+        """
+        Premiere frame ou un ennemi ou un projectile touche le joueur (None: jamais)
+        pour un saut (jump True), un pas ou une chute dans la direction (False),
+        ou en restant immobile (None). Les tirs des rivals qui vont tirer pendant
+        la trajectoire comptent aussi.
+        """
+        trace = []
+        if jump is not None:
+            velocity_y = -PLAYER_JUMP_FORCE if jump else 0
+            predict(rect, self.graph.near(rect), direction, velocity_y, BOT_MAX_AIR_FRAMES, trace)
+        # Quelques frames debout apres l'atterrissage (ou sur place)
+        trace += [trace[-1] if trace else rect] * BOT_SAFETY_FRAMES
+        first = None
+        # Les ennemis avancent vers le joueur a leur vitesse; retomber sur la tete
+        # d'un ennemi (pas le boss) l'ecrase (voir GameplayScene._check_collisions)
+        for enemy in self._alive(scene):
+            speed = getattr(enemy, "speed", 0)
+            body = enemy.rect.inflate(16, 0)
+            previous = rect
+            for frame, position in enumerate(trace[:first]):
+                dx = position.centerx - body.centerx
+                body = body.move(min(speed, abs(dx)) * (1 if dx > 0 else -1), 0)
+                if position.colliderect(body):
+                    if enemy is not scene.boss and position.y > previous.y \
+                            and position.bottom <= enemy.rect.top + 30:
+                        break
+                    first = frame
+                    break
+                previous = position
+        for group in (scene.enemy_projectiles, scene.boss_projectiles):
+            for proj in group:
+                vel_x, vel_y = getattr(proj, "vel_x", 0), getattr(proj, "vel_y", 0)
+                for frame, position in enumerate(trace[:first]):
+                    if position.colliderect(proj.rect.move(vel_x * (frame + 1), vel_y * (frame + 1))):
+                        first = frame
+                        break
+        # Rivals tireurs (Enemy.update): tir a la frame ou leur timer expire, depuis leur
+        # centre vers la position du joueur a cet instant, s'il est a portee
+        frame_ms = 1000 / FPS
+        for enemy in self._alive(scene):
+            if not getattr(enemy, "can_shoot", False):
+                continue
+            fire = max(0, math.ceil(enemy.shoot_timer / frame_ms) - 1)
+            while fire < (len(trace) if first is None else first):
+                aim = trace[fire]
+                dx, dy = aim.centerx - enemy.rect.centerx, aim.centery - enemy.rect.centery
+                distance = math.hypot(dx, dy)
+                if abs(dx) < enemy.detection_range and distance > 0:
+                    vel_x, vel_y = dx / distance * RIVAL_PROJECTILE_SPEED, dy / distance * RIVAL_PROJECTILE_SPEED
+                    shot = self.rival_shot.copy()
+                    shot.center = enemy.rect.center
+                    for frame in range(fire + 1, len(trace) if first is None else first):
+                        flight = frame - fire
+                        if trace[frame].colliderect(shot.move(vel_x * flight, vel_y * flight)):
+                            first = frame
+                            break
+                fire += math.ceil(enemy.shoot_cooldown / frame_ms)
+        return first
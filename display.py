@@ -0,0 +1,246 @@
+"""
+Rockstar Bros - Backends d'affichage
+Les scenes dessinent dans une Surface; le backend choisit comment elle arrive
+a l'ecran (flip logiciel ou SDL Renderer). Les operations couteuses
+(transparence, mise a l'echelle, miroir, rotation) passent par un canevas
+(canvas_for) qui les fait sur la Surface ou sur le renderer.
+"""
+
+import weakref
+from collections import OrderedDict
+
+import pygame
+
+from settings import ANIM_ZOOM_CACHE_FRAMES
+
+
+# SDL_BLENDMODE_NONE / SDL_BLENDMODE_BLEND (pygame._sdl2 n'exporte pas les constantes)
+_BLENDMODE_NONE = 0
+_BLENDMODE_BLEND = 1
+
+# Affichage GPU actif: sa surface est dessinee par le renderer (voir canvas_for)
+_gpu_display = None
+# Canevas logiciels deja crees, par surface
+_canvases = weakref.WeakKeyDictionary()
+
+
+class SurfaceCanvas:
+    """
+    Canevas logiciel: tout est dessine dans la Surface.
+    Les images transformees sont gardees par image source (les dernieres
+    ANIM_ZOOM_CACHE_FRAMES), la rotation est refaite a chaque appel.
+    """
+
+    _transforms = weakref.WeakKeyDictionary()
+
+    def __init__(self, surface):
+        self.surface = surface
+        self._overlay = None
+
+    def blit(self, image, pos):
+        """Dessine une image telle quelle"""
+        self.surface.blit(image, pos)
+
+    def blit_alpha(self, image, pos, alpha):
+        """Dessine une image avec une opacite globale (0-255)"""
+        previous = image.get_alpha()
+        image.set_alpha(alpha)
+        self.surface.blit(image, pos)
+        image.set_alpha(previous)
+
+    def blit_scaled(self, image, rect, alpha=255, flip_x=False):
+        """Dessine une image etiree dans rect, eventuellement en miroir"""
+        rect = pygame.Rect(rect)
+        self.blit_alpha(self._transformed(image, rect.size, flip_x), rect.topleft, alpha)
+
+    def blit_rotated(self, image, center, angle, size=None, alpha=255):
+        """Dessine une image (redimensionnee a size) tournee de angle degres autour de center"""
+        if size is not None and size != image.get_size():
+            image = pygame.transform.scale(image, size)
+        rotated = pygame.transform.rotate(image, angle)
+        self.blit_alpha(rotated, rotated.get_rect(center=center), alpha)
+
+    def fill_alpha(self, color, alpha, rect=None):
+        """Voile de couleur semi-transparent (tout l'ecran si rect est None)"""
+        rect = self.surface.get_rect() if rect is None else pygame.Rect(rect)
+        overlay = self._overlay
+        if overlay is None or overlay.get_size() != rect.size:
+            overlay = self._overlay = pygame.Surface(rect.size, pygame.SRCALPHA)
+        overlay.fill((*color[:3], alpha))
+        self.surface.blit(overlay, rect)
+
+    @classmethod
+    def _transformed(cls, image, size, flip_x):
+        """Image redimensionnee et/ou en miroir (gardee tant que l'image source existe)"""
+        if size == image.get_size() and not flip_x:
+            return image
+        frames = cls._transforms.get(image)
+        if frames is None:
+            frames = cls._transforms[image] = OrderedDict()
+        key = (size, flip_x)
+        surf = frames.get(key)
+        if surf is not None:
+            frames.move_to_end(key)
+            return surf
+        surf = image if size == image.get_size() else pygame.transform.scale(image, size)
+        if flip_x:
+            surf = pygame.transform.flip(surf, True, False)
+        frames[key] = surf
+        if len(frames) > ANIM_ZOOM_CACHE_FRAMES:
+            frames.popitem(last=False)
+        return surf
+
+
+class SoftwareDisplay:
+    """Affichage classique: pygame.display.set_mode + flip"""
+
+    name = "software"
+
+    def __init__(self, size, title):
+        self.surface = pygame.display.set_mode(size)
+        pygame.display.set_caption(title)
+
+    def present(self):
+        """Affiche la frame dessinee dans self.surface"""
+        pygame.display.flip()
+
+
+class GpuDisplay:
+    """
+    Affichage par pygame._sdl2.video (Window, Renderer, Texture).
+    Les appels du canevas (canvas_for) sont faits par le renderer avec des
+    textures gardees par image. Pour garder l'ordre de dessin, ce que les scenes
+    ont dessine dans la surface est envoye avant chacun (texture streaming) et la
+    surface, transparente dans ce mode, est videe. Une frame sans appel du canevas
+    est dessinee dans une surface opaque (blits plus rapides) envoyee une fois;
+    le premier appel d'une telle frame est fait en logiciel et la frame suivante
+    passe en mode calques. Le renderer met la frame a l'echelle de la fenetre
+    (redimensionnable). Sans GPU, SDL utilise son renderer logiciel avec le meme code.
+    """
+
+    def __init__(self, size, title, vsync=False):
+        # Import local: _sdl2 n'existe pas sur toutes les builds de pygame
+        from pygame._sdl2 import sdl2
+        from pygame._sdl2.video import Window, Renderer, Texture
+
+        self.window = Window(title, size=size, resizable=True)
+        try:
+            self.renderer = Renderer(self.window, accelerated=1, vsync=vsync)
+            self.name = "gpu"
+        except (pygame.error, sdl2.error):
+            # Pas de driver accelere (machines de build sans GPU)
+            self.renderer = Renderer(self.window, accelerated=0)
+            self.name = "gpu-software"
+        self.renderer.logical_size = size
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self._texture_class = Texture
+
+        # Formats 32 bits compatibles avec la texture du calque (ARGB8888)
+        self.opaque_surface = pygame.Surface(size, 0, 32)
+        self.layer_surface = pygame.Surface(size, pygame.SRCALPHA, 32)
+        self.layer = Texture(self.renderer, size, streaming=True)
+        self.textures = weakref.WeakKeyDictionary()
+        # Mode calques pour cette frame, et demande pour la suivante
+        self.layered = False
+        self.wants_layers = False
+        # Premier envoi de la frame: opaque, comme l'affichage logiciel
+        self.layer_sent = False
+        self.surface = self.opaque_surface
+
+        global _gpu_display
+        _gpu_display = self
+
+    def canvas(self):
+        """Canevas de la surface de l'ecran pour cette frame"""
+        self.wants_layers = True
+        return self if self.layered else canvas_for(self.opaque_surface, software=True)
+
+    def _texture(self, image):
+        """Texture d'une image (creee une fois, l'image ne doit plus changer ensuite)"""
+        texture = self.textures.get(image)
+        if texture is None:
+            texture = self.textures[image] = self._texture_class.from_surface(self.renderer, image)
+            texture.blend_mode = _BLENDMODE_BLEND
+        return texture
+
+    def _flush_layer(self):
+        """Envoie au renderer ce que les scenes ont dessine dans la surface"""
+        self.layer.update(self.surface)
+        self.layer.blend_mode = _BLENDMODE_BLEND if self.layer_sent else _BLENDMODE_NONE
+        self.layer.draw()
+        self.layer_sent = True
+        if self.layered:
+            self.surface.fill((0, 0, 0, 0))
+
+    def _draw(self, image, rect, alpha=255, angle=0.0, flip_x=False):
+        """Dessine une image par le renderer, au-dessus de ce qui est deja dessine"""
+        self._flush_layer()
+        texture = self._texture(image)
+        texture.alpha = alpha
+        texture.draw(dstrect=rect, angle=angle, flip_x=flip_x)
+
+    def blit(self, image, pos):
+        """Dessine une image telle quelle"""
+        self._draw(image, image.get_rect(topleft=pos))
+
+    def blit_alpha(self, image, pos, alpha):
+        """Dessine une image avec une opacite globale (0-255)"""
+        self._draw(image, image.get_rect(topleft=pos), alpha)
+
+    def blit_scaled(self, image, rect, alpha=255, flip_x=False):
+        """Dessine une image etiree dans rect, eventuellement en miroir"""
+        self._draw(image, pygame.Rect(rect), alpha, flip_x=flip_x)
+
+    def blit_rotated(self, image, center, angle, size=None, alpha=255):
+        """Dessine une image (redimensionnee a size) tournee de angle degres autour de center"""
+        rect = pygame.Rect((0, 0), size or image.get_size())
+        rect.center = center
+        # Le renderer tourne dans le sens horaire, transform.rotate dans l'autre
+        self._draw(image, rect, alpha, angle=-angle)
+
+    def fill_alpha(self, color, alpha, rect=None):
+        """Voile de couleur semi-transparent (tout l'ecran si rect est None)"""
+        self._flush_layer()
+        self.renderer.draw_blend_mode = _BLENDMODE_BLEND
+        self.renderer.draw_color = (*color[:3], alpha)
+        self.renderer.fill_rect(self.surface.get_rect() if rect is None else pygame.Rect(rect))
+        self.renderer.draw_color = (0, 0, 0, 255)
+
+    def present(self):
+        """Envoie la fin de la frame, l'affiche et choisit la surface de la frame suivante"""
+        self._flush_layer()
+        self.renderer.present()
+        self.renderer.clear()
+        self.layer_sent = False
+        self.layered, self.wants_layers = self.wants_layers, False
+        self.surface = self.layer_surface if self.layered else self.opaque_surface
+
+
+def canvas_for(surface, software=False):
+    """
+    Canevas de dessin d'une surface: l'affichage GPU si c'est sa surface
+    (sauf software=True), sinon un SurfaceCanvas (captures, rendu logiciel).
+    """
+    if not software and _gpu_display is not None and surface is _gpu_display.surface:
+        return _gpu_display.canvas()
+    canvas = _canvases.get(surface)
+    if canvas is None:
+        canvas = _canvases[surface] = SurfaceCanvas(surface)
+    return canvas
+
+
+def create_display(backend, size, title):
+    """
+    Cree le backend demande, avec repli sur l'affichage logiciel.
+
+    Args:
+        backend: "software" ou "gpu" (voir DISPLAY_BACKENDS)
+        size: Taille de la frame (largeur, hauteur)
+        title: Titre de la fenetre
+    """
+    if backend == "gpu":
+        try:
+            return GpuDisplay(size, title)
+        except (ImportError, pygame.error) as e:
+            print(f"Affichage GPU indisponible, repli logiciel: {e}")
+    return SoftwareDisplay(size, title)
@@ -35,9 +35,29 @@ from settings import (
     IMG_BOSS3_IDLE, IMG_BOSS3_RUN1, IMG_BOSS3_RUN2, IMG_BOSS3_JUMP, IMG_BOSS3_ATTACK,
 )
 from entities.projectile import BossProjectile, RivalProjectile
+from assets import load_image
+from display import canvas_for
+import tracing
 import math
 
 
+# Cercles d'impact (hit flash) par rayon, dessines une fois a l'opacite maximum
+_impact_surfaces = {}
+
+
+def _impact_surface(radius, alpha):
+    """Cercle d'impact rouge d'un rayon donne, avec l'opacite de la frame"""
+    surf = _impact_surfaces.get(radius)
+    if surf is None:
+        surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (255, 50, 50, 200), (radius, radius), radius)
+        # Cercle interieur plus clair
+        pygame.draw.circle(surf, (255, 150, 100, 100), (radius, radius), int(radius * 0.6))
+        _impact_surfaces[radius] = surf
+    surf.set_alpha(int(alpha * 255 / 200))
+    return surf
+
+
 class Enemy(pygame.sprite.Sprite):
     """Classe de base pour les ennemis avec animations"""
 
@@ -140,17 +160,14 @@ class Enemy(pygame.sprite.Sprite):
         self.velocity_y = 0
         self.on_ground = False
 
-    def _load_images(self):
-        """Charge toutes les images d'animation de l'ennemi"""
-        # Cle de cache unique pour ce type d'ennemi
-        cache_key = self.enemy_type if self.enemy_type != "rival_shooter" else "rival_shooter"
-
-        # Utiliser le cache si disponible
-        if cache_key in Enemy._image_cache:
-            self.images = dict(Enemy._image_cache[cache_key])
-            return
-
-        if self.enemy_type == "hater":
+    @staticmethod
+    def image_specs(enemy_type):
+        """
+        Images d'un type d'ennemi: {cle: (chemin, taille)} au format de assets.load_image.
+        Utilise aussi pour le prechargement des stages.
+        """
+        if enemy_type == "hater":
+            width, height = HATER_WIDTH, HATER_HEIGHT
             img_files = {
                 "idle": IMG_HATER_IDLE,
                 "run1": IMG_HATER_RUN,
@@ -158,7 +175,8 @@ class Enemy(pygame.sprite.Sprite):
                 "attack": IMG_HATER_ATTACK,
                 "dead": IMG_HATER_DEAD,
             }
-        elif self.enemy_type == "hater_flying":
+        elif enemy_type == "hater_flying":
+            width, height = HATER_FLYING_WIDTH, HATER_FLYING_HEIGHT
             img_files = {
                 "idle": IMG_HATER_FLYING_IDLE,
                 "run1": IMG_HATER_FLYING_FLY1,  # Animation de vol
@@ -167,26 +185,38 @@ class Enemy(pygame.sprite.Sprite):
                 "dead": IMG_HATER_FLYING_DEAD,
             }
         else:  # rival / rival_shooter
+            if enemy_type in ("rival", "rival_shooter"):
+                width, height = RIVAL_WIDTH, RIVAL_HEIGHT
+            else:
+                width, height = HATER_WIDTH, HATER_HEIGHT
             img_files = {
                 "idle": IMG_RIVAL_IDLE,
                 "run1": IMG_RIVAL_RUN1,
                 "run2": IMG_RIVAL_RUN2,
-                "attack": IMG_RIVAL_ATTACK2 if self.can_shoot else IMG_RIVAL_ATTACK,
+                "attack": IMG_RIVAL_ATTACK2 if enemy_type == "rival_shooter" else IMG_RIVAL_ATTACK,
                 "dead": IMG_RIVAL_DEAD,
             }
 
+        specs = {}
         for key, filename in img_files.items():
+            # Pour l'attaque et dead, garder les proportions
+            size = (None, height) if key in ("attack", "dead") else (width, height)
+            specs[key] = (IMG_ENEMIES_DIR / filename, size)
+        return specs
+
+    def _load_images(self):
+        """Charge toutes les images d'animation de l'ennemi"""
+        # Cle de cache unique pour ce type d'ennemi
+        cache_key = self.enemy_type if self.enemy_type != "rival_shooter" else "rival_shooter"
+
+        # Utiliser le cache si disponible
+        if cache_key in Enemy._image_cache:
+            self.images = dict(Enemy._image_cache[cache_key])
+            return
+
+        for key, (path, size) in self.image_specs(self.enemy_type).items():
             try:
-                path = IMG_ENEMIES_DIR / filename
-                img = pygame.image.load(str(path)).convert_alpha()
-                # Pour l'attaque et dead, garder les proportions
-                if key in ("attack", "dead"):
-                    original_width, original_height = img.get_size()
-                    ratio = self.height / original_height
-                    new_width = int(original_width * ratio)
-                    img = pygame.transform.scale(img, (new_width, self.height))
-                else:
-                    img = pygame.transform.scale(img, (self.width, self.height))
+                img = load_image(path, size)
                 # Miroir de l'image attack du rival_shooter (image orientee a droite)
                 if key == "attack" and self.can_shoot:
                     img = pygame.transform.flip(img, True, False)
@@ -197,6 +227,26 @@ class Enemy(pygame.sprite.Sprite):
         # Mettre en cache
         Enemy._image_cache[cache_key] = dict(self.images)
 
+    @classmethod
+    def cached_images(cls):
+        """(type d'ennemi, surface) du cache de classe, pour resources"""
+        for enemy_type, images in list(cls._image_cache.items()):
+            for image in images.values():
+                if image is not None:
+                    yield enemy_type, image
+
+    @classmethod
+    def evict_image_cache(cls, nbytes) -> int:
+        """Oublie les types d'ennemis les plus anciens du cache jusqu'a nbytes"""
+        freed = 0
+        for enemy_type in list(cls._image_cache):
+            if freed >= nbytes:
+                break
+            images = cls._image_cache.pop(enemy_type)
+            freed += sum(image.get_width() * image.get_height() * image.get_bytesize()
+                         for image in images.values() if image is not None)
+        return freed
+
     def _get_placeholder(self, size, color):
         """Cree une image placeholder"""
         surf = pygame.Surface(size, pygame.SRCALPHA)
@@ -449,14 +499,7 @@ class Enemy(pygame.sprite.Sprite):
             impact_radius = int(15 + flash_progress * 25)
             impact_alpha = int(200 * (1 - flash_progress))
 
-            impact_surf = pygame.Surface((impact_radius * 2, impact_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(impact_surf, (255, 50, 50, impact_alpha),
-                             (impact_radius, impact_radius), impact_radius)
-            # Cercle interieur plus clair
-            inner_radius = int(impact_radius * 0.6)
-            pygame.draw.circle(impact_surf, (255, 150, 100, impact_alpha // 2),
-                             (impact_radius, impact_radius), inner_radius)
-
+            impact_surf = _impact_surface(impact_radius, impact_alpha)
             impact_pos = (draw_rect.centerx - impact_radius, draw_rect.centery - impact_radius)
             screen.blit(impact_surf, impact_pos)
 
@@ -528,10 +571,12 @@ class Boss(pygame.sprite.Sprite):
         # Flag pour declencher le son de tir
         self.just_attacked = False
 
-    def _load_images(self):
-        """Charge toutes les images d'animation du boss"""
+    @staticmethod
+    def image_specs(boss_type):
+        """Images d'un type de boss: {cle: (chemin, taille)} au format de assets.load_image"""
         # Selection des images selon le type de boss
-        if self.boss_type == "boss2":
+        if boss_type == "boss2":
+            width, height = BOSS2_WIDTH, BOSS2_HEIGHT
             img_files = {
                 "idle": IMG_BOSS2_IDLE,
                 "run1": IMG_BOSS2_RUN1,
@@ -539,7 +584,8 @@ class Boss(pygame.sprite.Sprite):
                 "jump": IMG_BOSS2_JUMP,
                 "attack": IMG_BOSS2_ATTACK,
             }
-        elif self.boss_type == "boss3":
+        elif boss_type == "boss3":
+            width, height = BOSS3_WIDTH, BOSS3_HEIGHT
             img_files = {
                 "idle": IMG_BOSS3_IDLE,
                 "run1": IMG_BOSS3_RUN1,
@@ -548,6 +594,7 @@ class Boss(pygame.sprite.Sprite):
                 "attack": IMG_BOSS3_ATTACK,
             }
         else:  # boss1
+            width, height = BOSS_WIDTH, BOSS_HEIGHT
             img_files = {
                 "idle": IMG_BOSS_IDLE,
                 "run1": IMG_BOSS_RUN1,
@@ -556,19 +603,18 @@ class Boss(pygame.sprite.Sprite):
                 "attack": IMG_BOSS_ATTACK,
             }
 
+        specs = {}
         for key, filename in img_files.items():
+            # Pour l'attaque, garder les proportions (hauteur fixe, largeur proportionnelle)
+            size = (None, height) if key == "attack" else (width, height)
+            specs[key] = (IMG_ENEMIES_DIR / filename, size)
+        return specs
+
+    def _load_images(self):
+        """Charge toutes les images d'animation du boss"""
+        for key, (path, size) in self.image_specs(self.boss_type).items():
             try:
-                path = IMG_ENEMIES_DIR / filename
-                img = pygame.image.load(str(path)).convert_alpha()
-                # Pour l'attaque, garder les proportions (hauteur fixe, largeur proportionnelle)
-                if key == "attack":
-                    original_width, original_height = img.get_size()
-                    ratio = self.height / original_height
-                    new_width = int(original_width * ratio)
-                    img = pygame.transform.scale(img, (new_width, self.height))
-                else:
-                    img = pygame.transform.scale(img, (self.width, self.height))
-                self.images[key] = img
+                self.images[key] = load_image(path, size)
             except (pygame.error, FileNotFoundError):
                 self.images[key] = None
 
@@ -662,15 +708,16 @@ class Boss(pygame.sprite.Sprite):
         self.attack_anim_timer = 400  # Animation d'attaque pendant 400ms
         self.just_attacked = True  # Declenche le son de tir
 
-        if self.boss_type == "boss3":
-            # Boss 3: Attaques en rafale et en eventail
-            self._attack_boss3(player_rect, projectiles_group)
-        elif self.boss_type == "boss2":
-            # Boss 2: Attaques en cercle et vagues
-            self._attack_boss2(player_rect, projectiles_group)
-        else:
-            # Boss 1: Attaques simples directes
-            self._attack_boss1(player_rect, projectiles_group)
+        with tracing.span("boss", f"attack {self.boss_type} phase {self.phase}"):
+            if self.boss_type == "boss3":
+                # Boss 3: Attaques en rafale et en eventail
+                self._attack_boss3(player_rect, projectiles_group)
+            elif self.boss_type == "boss2":
+                # Boss 2: Attaques en cercle et vagues
+                self._attack_boss2(player_rect, projectiles_group)
+            else:
+                # Boss 1: Attaques simples directes
+                self._attack_boss1(player_rect, projectiles_group)
 
     def _attack_boss1(self, player_rect, projectiles_group):
         """Attaques du Boss 1 - Simples et directes"""
@@ -832,12 +879,10 @@ class Boss(pygame.sprite.Sprite):
     def draw(self, screen, camera_x):
         """Dessine le boss avec effets"""
         img = self.image
-        # L'image de base regarde a droite, donc flip si le boss regarde a gauche
-        if not self.facing_right:
-            img = pygame.transform.flip(img, True, False)
-
         draw_rect = self.rect.move(-camera_x, 0)
-        screen.blit(img, draw_rect)
+        # L'image de base regarde a droite, donc flip si le boss regarde a gauche
+        canvas_for(screen).blit_scaled(img, img.get_rect(topleft=draw_rect.topleft),
+                                       flip_x=not self.facing_right)
 
         # Effet d'impact rouge quand touche
         if self.hit_flash > 0:
@@ -845,13 +890,7 @@ class Boss(pygame.sprite.Sprite):
             impact_radius = int(25 + flash_progress * 40)  # Plus grand pour le boss
             impact_alpha = int(200 * (1 - flash_progress))
 
-            impact_surf = pygame.Surface((impact_radius * 2, impact_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(impact_surf, (255, 50, 50, impact_alpha),
-                             (impact_radius, impact_radius), impact_radius)
-            inner_radius = int(impact_radius * 0.6)
-            pygame.draw.circle(impact_surf, (255, 150, 100, impact_alpha // 2),
-                             (impact_radius, impact_radius), inner_radius)
-
+            impact_surf = _impact_surface(impact_radius, impact_alpha)
             impact_pos = (draw_rect.centerx - impact_radius, draw_rect.centery - impact_radius)
             screen.blit(impact_surf, impact_pos)
 
@@ -10,6 +10,7 @@ from settings import (
     MYSTERY_BLOCK_SIZE,
     IMG_UI_DIR, IMG_MYSTERY_BLOCK,
 )
+from assets import load_image
 
 
 class MysteryBlock(pygame.sprite.Sprite):
@@ -45,12 +46,15 @@ class MysteryBlock(pygame.sprite.Sprite):
         self.arrow_bob_speed = 4
         self.arrow_distance = 20  # Distance above the block
 
+    @staticmethod
+    def image_spec():
+        """Sprite of the block: (path, size) in assets.load_image format"""
+        return (IMG_UI_DIR / IMG_MYSTERY_BLOCK, (MYSTERY_BLOCK_SIZE, MYSTERY_BLOCK_SIZE))
+
     def _load_image(self):
         """Load the mystery block sprite or create placeholder"""
         try:
-            path = IMG_UI_DIR / IMG_MYSTERY_BLOCK
-            img = pygame.image.load(str(path)).convert_alpha()
-            return pygame.transform.scale(img, (self.width, self.height))
+            return load_image(*self.image_spec())
         except (pygame.error, FileNotFoundError):
             # Create placeholder - golden block with question mark (Mario style)
             surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
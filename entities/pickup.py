@@ -10,6 +10,7 @@ from settings import (
     PICKUP_WIDTH, PICKUP_HEIGHT,
     IMG_UI_DIR, IMG_NOTE, IMG_MEDIATOR, IMG_AMPLI, IMG_HEALTH,
 )
+from assets import load_image
 
 
 class Pickup(pygame.sprite.Sprite):
@@ -38,18 +39,21 @@ class Pickup(pygame.sprite.Sprite):
         self.float_offset = 0
         self.float_speed = 2
 
-    def _load_image(self):
-        """Charge l'image du pickup"""
+    @staticmethod
+    def image_spec(pickup_type):
+        """Image d'un pickup: (chemin, taille) au format de assets.load_image"""
         img_map = {
             "note": IMG_NOTE,
             "mediator": IMG_MEDIATOR,
             "ampli": IMG_AMPLI,
             "health": IMG_HEALTH,
         }
+        return (IMG_UI_DIR / img_map.get(pickup_type, IMG_NOTE), (PICKUP_WIDTH, PICKUP_HEIGHT))
+
+    def _load_image(self):
+        """Charge l'image du pickup"""
         try:
-            path = IMG_UI_DIR / img_map.get(self.pickup_type, IMG_NOTE)
-            img = pygame.image.load(str(path)).convert_alpha()
-            self.image = pygame.transform.scale(img, (PICKUP_WIDTH, PICKUP_HEIGHT))
+            self.image = load_image(*self.image_spec(self.pickup_type))
         except (pygame.error, FileNotFoundError):
             pass
 
@@ -7,6 +7,7 @@ import pygame
 from settings import (
     IMG_PLATFORMS_DIR, IMG_PLATFORM, IMG_PLATFORM_SMALL, IMG_GROUND,
 )
+from assets import load_image
 
 
 class Platform(pygame.sprite.Sprite):
@@ -18,29 +19,29 @@ class Platform(pygame.sprite.Sprite):
         self.width = width
         self.height = height
 
-        # Creer le placeholder par defaut
-        color = (80, 60, 40) if is_ground else (100, 80, 60)
-        self.image = pygame.Surface((width, height))
-        self.image.fill(color)
-        pygame.draw.rect(self.image, (60, 40, 20), (0, 0, width, height), 3)
-
-        # Charger l'image si disponible
-        self._load_image()
+        # Image partagee par toutes les plateformes de meme taille (cache assets)
+        self.image = self._load_image()
 
         self.rect = self.image.get_rect(topleft=(x, y))
 
+    @staticmethod
+    def image_spec(width, height, is_ground=False):
+        """Image d'une plateforme: (chemin, taille) au format de assets.load_image"""
+        if is_ground:
+            img_file = IMG_GROUND
+        elif width <= 120:
+            img_file = IMG_PLATFORM_SMALL
+        else:
+            img_file = IMG_PLATFORM
+        return (IMG_PLATFORMS_DIR / img_file, (width, height))
+
     def _load_image(self):
-        """Charge l'image de la plateforme"""
+        """Charge l'image de la plateforme, ou un placeholder si elle manque"""
         try:
-            if self.is_ground:
-                img_file = IMG_GROUND
-            elif self.width <= 120:
-                img_file = IMG_PLATFORM_SMALL
-            else:
-                img_file = IMG_PLATFORM
-
-            path = IMG_PLATFORMS_DIR / img_file
-            img = pygame.image.load(str(path)).convert_alpha()
-            self.image = pygame.transform.scale(img, (self.width, self.height))
+            return load_image(*self.image_spec(self.width, self.height, self.is_ground))
         except (pygame.error, FileNotFoundError):
-            pass  # Garder le placeholder
+            color = (80, 60, 40) if self.is_ground else (100, 80, 60)
+            image = pygame.Surface((self.width, self.height))
+            image.fill(color)
+            pygame.draw.rect(image, (60, 40, 20), (0, 0, self.width, self.height), 3)
+            return image
@@ -7,7 +7,7 @@ import pygame
 from settings import (
     PURPLE, ORANGE, YELLOW,
     GRAVITY, MAX_FALL_SPEED,
-    PLAYER_SPEED, PLAYER_JUMP_FORCE, PLAYER_MAX_HEALTH,
+    PLAYER_SPEED, PLAYER_JUMP_FORCE, JUMP_BUFFER_TIME, PLAYER_MAX_HEALTH,
     PLAYER_INVINCIBILITY_TIME, PLAYER_WIDTH, PLAYER_HEIGHT,
     PROJECTILE_COOLDOWN, ULTIMATE_CHARGE_MAX,
     STAR_MODE_DURATION,
@@ -16,8 +16,8 @@ from settings import (
     IMG_PLAYER2_IDLE, IMG_PLAYER2_RUN1, IMG_PLAYER2_RUN2, IMG_PLAYER2_JUMP, IMG_PLAYER2_ATTACK,
     IMG_PLAYER1_ULTIMATE, IMG_PLAYER2_ULTIMATE,
     IMG_PLAYER1_CROUCH1, IMG_PLAYER1_CROUCH2, IMG_PLAYER2_CROUCH1, IMG_PLAYER2_CROUCH2,
-    CONTROLS,
 )
+from assets import load_image
 
 
 class Player(pygame.sprite.Sprite):
@@ -63,6 +63,9 @@ class Player(pygame.sprite.Sprite):
         self.normal_height = PLAYER_HEIGHT
         self.crouch_height = PLAYER_HEIGHT // 2  # Moitie de la hauteur normale
 
+        # Dernier appui sur saut (horloge rhythm.now_ms), pour le buffer de saut
+        self.jump_pressed_at = None
+
         # Flags pour le son
         self.just_jumped = False
         self.just_crouched = False
@@ -79,9 +82,10 @@ class Player(pygame.sprite.Sprite):
         self.star_mode_flash_timer = 0
         self.star_mode_just_ended = False  # Flag pour detecter la fin du star mode
 
-    def _load_images(self):
-        """Charge les images du joueur"""
-        if self.character_id == 1:
+    @staticmethod
+    def image_specs(character_id):
+        """Images d'un personnage: {cle: (chemin, taille)} au format de assets.load_image"""
+        if character_id == 1:
             img_files = {
                 "idle": IMG_PLAYER1_IDLE,
                 "run1": IMG_PLAYER1_RUN1,
@@ -104,18 +108,18 @@ class Player(pygame.sprite.Sprite):
                 "crouch2": IMG_PLAYER2_CROUCH2,
             }
 
+        specs = {}
         for key, filename in img_files.items():
+            # Pour l'attaque, garder les proportions (hauteur fixe, largeur proportionnelle)
+            size = (None, PLAYER_HEIGHT) if key == "attack" else (PLAYER_WIDTH, PLAYER_HEIGHT)
+            specs[key] = (IMG_PLAYER_DIR / filename, size)
+        return specs
+
+    def _load_images(self):
+        """Charge les images du joueur"""
+        for key, (path, size) in self.image_specs(self.character_id).items():
             try:
-                path = IMG_PLAYER_DIR / filename
-                img = pygame.image.load(str(path)).convert_alpha()
-                # Pour l'attaque, garder les proportions (hauteur fixe, largeur proportionnelle)
-                if key == "attack":
-                    original_width, original_height = img.get_size()
-                    ratio = PLAYER_HEIGHT / original_height
-                    new_width = int(original_width * ratio)
-                    img = pygame.transform.scale(img, (new_width, PLAYER_HEIGHT))
-                else:
-                    img = pygame.transform.scale(img, (PLAYER_WIDTH, PLAYER_HEIGHT))
+                img = load_image(path, size)
                 # Flipper les images crouch car elles sont orientees dans l'autre sens
                 if key in ("crouch1", "crouch2"):
                     img = pygame.transform.flip(img, True, False)
@@ -165,12 +169,22 @@ class Player(pygame.sprite.Sprite):
 
         return img
 
-    def handle_input(self, keys):
-        """Gere les inputs du joueur"""
+    def buffer_jump(self, press_ms):
+        """Memorise l'instant d'un appui sur saut (evenement horodate)"""
+        self.jump_pressed_at = press_ms
+
+    def handle_input(self, actions, now_ms=None):
+        """
+        Gere les inputs du joueur.
+
+        Args:
+            actions: InputMap dont l'etat de la frame est a jour (update)
+            now_ms: Instant de la frame, pour le buffer de saut (None = pas de buffer)
+        """
         self.velocity_x = 0
 
         # Accroupissement (seulement au sol)
-        crouch = any(keys[k] for k in CONTROLS["crouch"])
+        crouch = actions.held("crouch")
         was_crouching = self.is_crouching
 
         if crouch and self.on_ground:
@@ -186,8 +200,8 @@ class Player(pygame.sprite.Sprite):
             self.wants_to_stand = not crouch and was_crouching
 
         # Deplacement horizontal (plus lent si accroupi)
-        move_left = any(keys[k] for k in CONTROLS["left"])
-        move_right = any(keys[k] for k in CONTROLS["right"])
+        move_left = actions.held("left")
+        move_right = actions.held("right")
 
         speed = PLAYER_SPEED // 2 if self.is_crouching else PLAYER_SPEED
 
@@ -199,8 +213,13 @@ class Player(pygame.sprite.Sprite):
             self.facing_right = True
 
         # Saut (pas possible si accroupi)
-        jump = any(keys[k] for k in CONTROLS["jump"])
+        jump = actions.held("jump")
+        # Un appui relache juste avant l'atterrissage compte encore
+        if (not jump and now_ms is not None and self.jump_pressed_at is not None
+                and now_ms - self.jump_pressed_at <= JUMP_BUFFER_TIME):
+            jump = True
         if jump and self.on_ground and not self.is_crouching:
+            self.jump_pressed_at = None
             self.velocity_y = -PLAYER_JUMP_FORCE
             self.on_ground = False
             self.just_jumped = True
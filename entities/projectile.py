@@ -15,6 +15,7 @@ from settings import (
     IMG_FX_DIR, IMG_PROJECTILE, IMG_SHOCKWAVE, IMG_RIVAL_PROJECTILE,
     IMG_ENEMIES_DIR, IMG_BOSS_PROJECTILE, IMG_BOSS2_PROJECTILE, IMG_BOSS3_PROJECTILE,
 )
+from assets import load_image
 
 
 class Projectile(pygame.sprite.Sprite):
@@ -31,16 +32,16 @@ class Projectile(pygame.sprite.Sprite):
         self.pierce_count = 0  # Nombre d'ennemis restants a traverser (0 = detruit au 1er impact)
         self.hit_enemies = []  # Ennemis deja touches (evite les double hits)
 
+    @staticmethod
+    def image_spec():
+        """Image du projectile: (chemin, taille) au format de assets.load_image"""
+        # Garder les proportions (hauteur fixe, largeur proportionnelle)
+        return (IMG_FX_DIR / IMG_PROJECTILE, (None, PROJECTILE_HEIGHT))
+
     def _load_image(self):
         """Charge l'image du projectile avec proportions respectees"""
         try:
-            path = IMG_FX_DIR / IMG_PROJECTILE
-            img = pygame.image.load(str(path)).convert_alpha()
-            # Garder les proportions (hauteur fixe, largeur proportionnelle)
-            original_width, original_height = img.get_size()
-            ratio = PROJECTILE_HEIGHT / original_height
-            new_width = int(original_width * ratio)
-            self.image = pygame.transform.scale(img, (new_width, PROJECTILE_HEIGHT))
+            self.image = load_image(*self.image_spec())
         except (pygame.error, FileNotFoundError):
             pass
 
@@ -104,13 +105,8 @@ class BossProjectile(pygame.sprite.Sprite):
     def _load_image(self):
         """Charge l'image du projectile du boss"""
         try:
-            path = IMG_ENEMIES_DIR / self.img_file
-            img = pygame.image.load(str(path)).convert_alpha()
             # Garder les proportions (hauteur fixe, largeur proportionnelle)
-            original_width, original_height = img.get_size()
-            ratio = self.projectile_height / original_height
-            new_width = int(original_width * ratio)
-            self.image = pygame.transform.scale(img, (new_width, self.projectile_height))
+            self.image = load_image(IMG_ENEMIES_DIR / self.img_file, (None, self.projectile_height))
         except (pygame.error, FileNotFoundError):
             pass
 
@@ -135,8 +131,6 @@ class BossProjectile(pygame.sprite.Sprite):
 class RivalProjectile(pygame.sprite.Sprite):
     """Projectile des rivals tireurs"""
 
-    _cached_image = None  # Cache classe pour eviter de recharger depuis le disque
-
     def __init__(self, x, y, target_x, target_y):
         super().__init__()
         self.projectile_height = 40  # Hauteur cible du projectile
@@ -157,23 +151,16 @@ class RivalProjectile(pygame.sprite.Sprite):
 
         self.damage = RIVAL_PROJECTILE_DAMAGE
 
-    def _load_image(self):
-        """Charge l'image projectile rival avec proportions respectees"""
-        # Utiliser le cache si disponible
-        if RivalProjectile._cached_image is not None:
-            self.image = RivalProjectile._cached_image
-            return
+    @staticmethod
+    def image_spec():
+        """Image du projectile rival: (chemin, taille) au format de assets.load_image"""
+        # Garder les proportions (hauteur fixe, largeur proportionnelle)
+        return (IMG_ENEMIES_DIR / IMG_RIVAL_PROJECTILE, (None, 40))
 
+    def _load_image(self):
+        """Charge l'image projectile rival avec proportions respectees (cache partage)"""
         try:
-            path = IMG_ENEMIES_DIR / IMG_RIVAL_PROJECTILE
-            img = pygame.image.load(str(path)).convert_alpha()
-            # Garder les proportions (hauteur fixe, largeur proportionnelle)
-            original_width, original_height = img.get_size()
-            ratio = self.projectile_height / original_height
-            new_width = int(original_width * ratio)
-            self.image = pygame.transform.scale(img, (new_width, self.projectile_height))
-            # Mettre en cache
-            RivalProjectile._cached_image = self.image
+            self.image = load_image(*self.image_spec())
         except Exception as e:
             print(f"Impossible de charger rival_projectile.png: {e}")
 
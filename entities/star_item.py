@@ -7,10 +7,25 @@ import pygame
 import math
 from settings import (
     YELLOW, ORANGE, WHITE,
-    STAR_SIZE, STAR_SPAWN_VELOCITY,
+    STAR_SIZE, STAR_SPAWN_VELOCITY, STAR_SPIN_FRAMES,
     GRAVITY, MAX_FALL_SPEED,
     IMG_UI_DIR, IMG_STAR,
 )
+from assets import load_image
+
+
+# Sparkle path tables: unit circle per degree, and per-sparkle (distance, size)
+# sampled over one period of the pulses (pi seconds: sin(4t) and sin(6t) both loop)
+SPARKLE_COUNT = 4
+SPARKLE_STEPS = 120
+_CIRCLE = [(math.cos(math.radians(d)), math.sin(math.radians(d))) for d in range(360)]
+_SPARKLE_TABLE = []
+for _step in range(SPARKLE_STEPS):
+    _t = _step * math.pi / SPARKLE_STEPS
+    _SPARKLE_TABLE.append(tuple(
+        (20 + math.sin(_t * 4 + i) * 5, int(2 + math.sin(_t * 6 + i * 2) * 1))
+        for i in range(SPARKLE_COUNT)
+    ))
 
 
 class StarItem(pygame.sprite.Sprite):
@@ -20,15 +35,21 @@ class StarItem(pygame.sprite.Sprite):
     Grants STAR_MODE when collected.
     """
 
+    # Spin frames shared by every star: [(surface, x offset)], built once
+    _spin_frames = None
+
     def __init__(self, x, y):
         super().__init__()
         self.width = STAR_SIZE
         self.height = STAR_SIZE
 
-        # Load or create image
-        self.image = self._load_image()
-        self.original_image = self.image.copy()
-        self.rect = self.image.get_rect(center=(x, y))
+        if StarItem._spin_frames is None:
+            StarItem._spin_frames = self._bake_spin_frames(self._load_image())
+        self.image = StarItem._spin_frames[0][0]
+        # The rect keeps the full star size, frames are centered inside it
+        self.rect = pygame.Rect(0, 0, self.width, self.height)
+        self.rect.center = (x, y)
+        self.frame_offset = 0
 
         # Physics - star pops up then moves right
         self.velocity_x = 3  # Move right
@@ -39,18 +60,33 @@ class StarItem(pygame.sprite.Sprite):
         self.rotation = 0
         self.sparkle_timer = 0
 
+    @staticmethod
+    def image_spec():
+        """Star sprite: (path, size) in assets.load_image format"""
+        return (IMG_UI_DIR / IMG_STAR, (STAR_SIZE, STAR_SIZE))
+
     def _load_image(self):
         """Load star sprite or create placeholder"""
         try:
-            path = IMG_UI_DIR / IMG_STAR
-            img = pygame.image.load(str(path)).convert_alpha()
-            return pygame.transform.scale(img, (self.width, self.height))
+            return load_image(*self.image_spec())
         except (pygame.error, FileNotFoundError):
             # Create placeholder star
             surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
             self._draw_star_shape(surf, self.width // 2, self.height // 2, self.width // 2 - 4, YELLOW, ORANGE)
             return surf
 
+    def _bake_spin_frames(self, image):
+        """Pre-render one full spin (X squash faking a 3D rotation)"""
+        frames = []
+        for i in range(STAR_SPIN_FRAMES):
+            rotation = i * 360 / STAR_SPIN_FRAMES
+            # Scale X based on rotation to create a 3D spinning effect
+            scale_x = max(abs(math.cos(math.radians(rotation))), 0.2)
+            new_width = max(int(self.width * scale_x), 4)
+            frame = pygame.transform.scale(image, (new_width, self.height))
+            frames.append((frame, (self.width - new_width) // 2))
+        return frames
+
     def _draw_star_shape(self, surface, cx, cy, size, fill_color, outline_color):
         """Draw a 5-pointed star shape"""
         import math as m
@@ -95,27 +131,13 @@ class StarItem(pygame.sprite.Sprite):
         # Sparkle effect
         self.sparkle_timer += dt
 
-        # Rotate image for visual effect
-        self._update_rotated_image()
-
-    def _update_rotated_image(self):
-        """Update the rotated image for spinning effect"""
-        # Scale X based on rotation to create a 3D spinning effect
-        scale_x = abs(math.cos(math.radians(self.rotation)))
-        if scale_x < 0.2:
-            scale_x = 0.2
-
-        new_width = int(self.width * scale_x)
-        if new_width < 4:
-            new_width = 4
-
-        self.image = pygame.transform.scale(self.original_image, (new_width, self.height))
-        old_center = self.rect.center
-        self.rect = self.image.get_rect(center=old_center)
+        # Pick the pre-baked spin frame
+        index = int(self.rotation * STAR_SPIN_FRAMES / 360) % STAR_SPIN_FRAMES
+        self.image, self.frame_offset = StarItem._spin_frames[index]
 
     def draw(self, screen, camera_x):
         """Draw the star with sparkle effects"""
-        draw_x = self.rect.x - camera_x
+        draw_x = self.rect.x - camera_x + self.frame_offset
         draw_y = self.rect.y
 
         # Draw sparkles around the star
@@ -126,16 +148,11 @@ class StarItem(pygame.sprite.Sprite):
 
     def _draw_sparkles(self, screen, cx, cy):
         """Draw animated sparkles around the star"""
-        sparkle_count = 4
-        for i in range(sparkle_count):
-            angle = self.sparkle_timer * 2 + i * (360 / sparkle_count)
-            distance = 20 + math.sin(self.sparkle_timer * 4 + i) * 5
-            x = cx + math.cos(math.radians(angle)) * distance
-            y = cy + math.sin(math.radians(angle)) * distance
-
-            # Pulsing size
-            size = 2 + math.sin(self.sparkle_timer * 6 + i * 2) * 1
+        step = int(self.sparkle_timer * SPARKLE_STEPS / math.pi) % SPARKLE_STEPS
+        base_angle = int(self.sparkle_timer * 2)
+        for i, (distance, size) in enumerate(_SPARKLE_TABLE[step]):
+            cos_a, sin_a = _CIRCLE[(base_angle + i * (360 // SPARKLE_COUNT)) % 360]
 
             # Sparkle color alternates
             color = YELLOW if i % 2 == 0 else WHITE
-            pygame.draw.circle(screen, color, (int(x), int(y)), int(size))
+            pygame.draw.circle(screen, color, (int(cx + cos_a * distance), int(cy + sin_a * distance)), size)
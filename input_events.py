@@ -0,0 +1,56 @@
+"""
+Rockstar Bros - Evenements horodates
+Les evenements SDL sont releves plusieurs fois par frame (pendant l'attente
+de la frame suivante) et horodates a leur arrivee sur l'horloge de rhythm.now_ms
+"""
+
+import time
+from typing import List
+
+import pygame
+
+from rhythm import now_ms
+
+
+# Intervalle de releve des evenements pendant l'attente de fin de frame (ms)
+POLL_INTERVAL_MS = 1
+
+
+def event_time(event) -> float:
+    """Instant d'arrivee d'un evenement (maintenant s'il n'a pas ete horodate)"""
+    return getattr(event, "input_time", None) or now_ms()
+
+
+class EventPump:
+    """
+    Remplace l'attente de clock.tick(): au lieu de dormir jusqu'a la frame
+    suivante, on dort par petites tranches en relevant les evenements.
+    Un appui est donc date a ~1 ms pres au lieu de l'etre au debut de frame.
+    """
+
+    def __init__(self):
+        self._events: List[pygame.event.Event] = []
+
+    def poll(self):
+        """Releve les evenements en attente et les horodate"""
+        events = pygame.event.get()
+        if events:
+            stamp = now_ms()
+            for event in events:
+                event.input_time = stamp
+            self._events.extend(events)
+
+    def wait_until(self, deadline_ms):
+        """Attend jusqu'a deadline_ms (horloge now_ms) en relevant les evenements"""
+        while True:
+            self.poll()
+            remaining = deadline_ms - now_ms()
+            if remaining <= 0:
+                return
+            time.sleep(min(remaining, POLL_INTERVAL_MS) / 1000)
+
+    def drain(self) -> List[pygame.event.Event]:
+        """Evenements horodates depuis le dernier appel, dans l'ordre d'arrivee"""
+        self.poll()
+        events, self._events = self._events, []
+        return events
@@ -0,0 +1,217 @@
+"""
+Rockstar Bros - Carte des actions
+Traduit touches et boutons de manette en actions ("jump", "attack"...).
+Les bindings sont compiles en tables touche -> actions (recherche O(1)) et
+l'etat des actions maintenues est calcule une seule fois par frame.
+La croix et le stick gauche de la manette donnent left/right/up/down, pour
+naviguer dans les menus comme avec les fleches.
+"""
+
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import pygame
+
+from preferences import get_preferences
+from settings import CONTROLS, GAMEPAD_BUTTONS, GAMEPAD_AXIS_DEADZONE
+
+
+def _compile(bindings: Dict[str, List[int]]) -> Dict[int, Tuple[str, ...]]:
+    """{action: [codes]} -> {code: (actions...)}"""
+    table: Dict[int, Tuple[str, ...]] = {}
+    for action, codes in bindings.items():
+        for code in codes:
+            table[code] = table.get(code, ()) + (action,)
+    return table
+
+
+def _direction_actions(axis, direction) -> Tuple[str, ...]:
+    """Action de navigation d'une direction (-1, 0, 1) sur l'axe 0 (horizontal) ou 1 (vertical)"""
+    if direction == 0:
+        return ()
+    if axis == 0:
+        return ("left",) if direction < 0 else ("right",)
+    return ("up",) if direction < 0 else ("down",)
+
+
+class InputMap:
+    """
+    Bindings d'un joueur: clavier (CONTROLS + touches reconfigurees) et manettes.
+    Chaque InputMap est independante: une simulation peut en creer une par joueur
+    sans toucher a settings.CONTROLS ni aux preferences.
+    """
+
+    def __init__(self, bindings=None, gamepad_bindings=None, persist=False):
+        """
+        Args:
+            bindings: {action: [touches]} (par defaut CONTROLS)
+            gamepad_bindings: {action: [boutons]} (par defaut GAMEPAD_BUTTONS)
+            persist: True pour sauvegarder les changements de touches dans les preferences
+        """
+        source = CONTROLS if bindings is None else bindings
+        self.bindings: Dict[str, List[int]] = {action: list(keys) for action, keys in source.items()}
+        source = GAMEPAD_BUTTONS if gamepad_bindings is None else gamepad_bindings
+        self.gamepad_bindings: Dict[str, List[int]] = {action: list(b) for action, b in source.items()}
+        self.persist = persist
+
+        # Manettes ouvertes par cette carte (instance_id -> Joystick)
+        self.joysticks: Dict[int, "pygame.joystick.JoystickType"] = {}
+        # Actions maintenues a la derniere frame (voir update)
+        self.held_actions: FrozenSet[str] = frozenset()
+        # Direction du stick par (manette, axe), pour ne declencher qu'au passage de la zone morte
+        self._axis_directions: Dict[Tuple[int, int], int] = {}
+        self._axis_event = None
+        self._axis_actions: Tuple[str, ...] = ()
+
+        self._key_actions: Dict[int, Tuple[str, ...]] = {}
+        self._button_actions: Dict[int, Tuple[str, ...]] = {}
+        self._compile()
+
+    def _compile(self):
+        """Reconstruit les tables de recherche apres un changement de bindings"""
+        self._key_actions = _compile(self.bindings)
+        self._button_actions = _compile(self.gamepad_bindings)
+
+    # --- Evenements ---
+
+    def actions(self, event) -> Tuple[str, ...]:
+        """Actions declenchees par un appui (touche ou bouton de manette)"""
+        if event.type == pygame.KEYDOWN:
+            return self._key_actions.get(event.key, ())
+        if event.type == pygame.JOYBUTTONDOWN and event.instance_id in self.joysticks:
+            return self._button_actions.get(event.button, ())
+        if event.type == pygame.JOYHATMOTION and event.instance_id in self.joysticks:
+            hat_x, hat_y = event.value
+            return _direction_actions(0, hat_x) + _direction_actions(1, -hat_y)
+        if event.type == pygame.JOYAXISMOTION and event.instance_id in self.joysticks and event.axis < 2:
+            return self._stick_actions(event)
+        return ()
+
+    def _stick_actions(self, event) -> Tuple[str, ...]:
+        """Direction du stick gauche quand il sort de la zone morte (une fois par evenement)"""
+        if event is not self._axis_event:
+            if event.value <= -GAMEPAD_AXIS_DEADZONE:
+                direction = -1
+            elif event.value >= GAMEPAD_AXIS_DEADZONE:
+                direction = 1
+            else:
+                direction = 0
+            key = (event.instance_id, event.axis)
+            previous = self._axis_directions.get(key, 0)
+            self._axis_directions[key] = direction
+            self._axis_event = event
+            self._axis_actions = _direction_actions(event.axis, direction) if direction != previous else ()
+        return self._axis_actions
+
+    def released_actions(self, event) -> Tuple[str, ...]:
+        """Actions dont une touche ou un bouton de manette vient d'etre relache"""
+        if event.type == pygame.KEYUP:
+            return self._key_actions.get(event.key, ())
+        if event.type == pygame.JOYBUTTONUP and event.instance_id in self.joysticks:
+            return self._button_actions.get(event.button, ())
+        return ()
+
+    def is_action(self, event, action) -> bool:
+        """True si l'evenement est un appui sur une entree liee a action"""
+        return action in self.actions(event)
+
+    def handle_device_event(self, event):
+        """Ouvre/ferme les manettes branchees ou debranchees"""
+        if event.type == pygame.JOYDEVICEADDED:
+            try:
+                joystick = pygame.joystick.Joystick(event.device_index)
+            except pygame.error as e:
+                print(f"Manette ignoree: {e}")
+                return
+            self.joysticks[joystick.get_instance_id()] = joystick
+        elif event.type == pygame.JOYDEVICEREMOVED:
+            self.joysticks.pop(event.instance_id, None)
+            self._axis_directions = {key: direction for key, direction in self._axis_directions.items()
+                                     if key[0] != event.instance_id}
+
+    # --- Etat par frame ---
+
+    def update(self, keys=None):
+        """
+        Calcule les actions maintenues pour la frame (une seule fois par frame).
+
+        Args:
+            keys: Etat des touches (par defaut pygame.key.get_pressed())
+        """
+        if keys is None:
+            keys = pygame.key.get_pressed()
+        held = set()
+        for key, actions in self._key_actions.items():
+            if keys[key]:
+                held.update(actions)
+
+        for joystick in self.joysticks.values():
+            for button, actions in self._button_actions.items():
+                if button < joystick.get_numbuttons() and joystick.get_button(button):
+                    held.update(actions)
+            x = joystick.get_axis(0) if joystick.get_numaxes() > 0 else 0.0
+            y = joystick.get_axis(1) if joystick.get_numaxes() > 1 else 0.0
+            if joystick.get_numhats() > 0:
+                hat_x, hat_y = joystick.get_hat(0)
+                # Croix directionnelle prioritaire sur un stick au repos
+                if abs(hat_x) > abs(x):
+                    x = hat_x
+                if abs(hat_y) > abs(y):
+                    y = -hat_y
+            if x <= -GAMEPAD_AXIS_DEADZONE:
+                held.add("left")
+            elif x >= GAMEPAD_AXIS_DEADZONE:
+                held.add("right")
+            if y >= GAMEPAD_AXIS_DEADZONE:
+                held.add("crouch")
+
+        self.held_actions = frozenset(held)
+
+    def held(self, action) -> bool:
+        """True si l'action est maintenue (etat calcule par update)"""
+        return action in self.held_actions
+
+    # --- Reconfiguration ---
+
+    def keys_for(self, action) -> List[int]:
+        """Touches liees a une action (la premiere est reconfigurable)"""
+        return self.bindings.get(action, [])
+
+    def rebind(self, action, key, slot=0):
+        """Remplace une touche d'une action et recompile les tables"""
+        keys = self.bindings.get(action)
+        if keys is None:
+            return
+        if slot < len(keys):
+            keys[slot] = key
+        else:
+            keys.append(key)
+        self._compile()
+        if self.persist:
+            self._save()
+
+    def load_overrides(self, overrides):
+        """Applique des touches sauvegardees ({action: [touches]}), en ignorant l'invalide"""
+        if not isinstance(overrides, dict):
+            return
+        for action, keys in overrides.items():
+            if action in self.bindings and isinstance(keys, list) and all(isinstance(k, int) for k in keys):
+                self.bindings[action] = list(keys)
+        self._compile()
+
+    def _save(self):
+        """Sauvegarde les actions dont les touches different de CONTROLS"""
+        overrides = {action: list(keys) for action, keys in self.bindings.items()
+                     if keys != CONTROLS.get(action)}
+        get_preferences().set("controls", overrides)
+
+
+_input_map: Optional[InputMap] = None
+
+
+def get_input_map() -> InputMap:
+    """Retourne la carte des actions du joueur local (touches sauvegardees incluses)"""
+    global _input_map
+    if _input_map is None:
+        _input_map = InputMap(persist=True)
+        _input_map.load_overrides(get_preferences().get("controls"))
+    return _input_map
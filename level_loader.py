@@ -2,25 +2,488 @@
 Level Loader - Charge les configurations de niveaux depuis JSON
 """
 
+import hashlib
 import json
 import os
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import tracing
+from audio import resolve_sound_path
+from resources import deep_size
+from level_models import Level, LevelInfo, Stage
+from settings import (
+    HEIGHT, WIDTH, GROUND_Y,
+    IMG_BG_DIR, LEVELS_DIR, LEVEL_MANIFEST_FILE,
+    ENEMY_TYPES, BOSS_TYPES, PICKUP_TYPES, LEVEL_DIFFICULTIES,
+)
+
+
+class LevelValidationError(ValueError):
+    """Levee quand un fichier de niveau ne respecte pas le schema attendu"""
+
+    def __init__(self, filename: str, problems: List[str]):
+        self.filename = filename
+        self.problems = problems
+        details = "\n  - ".join(problems)
+        super().__init__(f"Invalid level file {filename}:\n  - {details}")
+
+
+# Niveaux deja valides, indexes par (hash du contenu du fichier, hash du schema)
+_levels_by_hash: Dict[Tuple[str, str], Level] = {}
+
+# Manifest des niveaux (metadonnees + hash), regenere quand un fichier change
+MANIFEST_VERSION = 3
+
+# Chemin de chargement d'un fichier reference par un stage (la musique peut
+# n'exister qu'en version compressee, voir audio.resolve_sound_path)
+_REFERENCE_PATHS = {'background': lambda filename: IMG_BG_DIR / filename,
+                    'music': resolve_sound_path}
+
+
+def _is_number(value) -> bool:
+    """True pour int/float (bool exclu)"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _schema_hash() -> str:
+    """Hash des reglages utilises par la validation: le manifest est refait s'ils changent"""
+    schema = [MANIFEST_VERSION, WIDTH, HEIGHT, GROUND_Y, list(ENEMY_TYPES), list(BOSS_TYPES),
+              list(PICKUP_TYPES), list(LEVEL_DIFFICULTIES)]
+    return hashlib.sha1(json.dumps(schema).encode('utf-8')).hexdigest()
+
+
+def _missing_reference(key: str, filename: str) -> Optional[str]:
+    """Chemin d'un fichier reference par un stage s'il manque, sinon None"""
+    path = _REFERENCE_PATHS[key](filename)
+    return None if path.is_file() else str(path)
+
+
+class _LevelNormalizer:
+    """
+    Valide un niveau brut (dict JSON) et produit une copie avec toutes les
+    valeurs par defaut appliquees. Les erreurs sont accumulees pour tout
+    signaler d'un coup.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.problems: List[str] = []
+
+    def error(self, where: str, message: str):
+        self.problems.append(f"{where}: {message}")
+
+    def number(self, data: dict, key: str, default, where: str,
+               minimum=None, maximum=None, integer=False):
+        """Lit un nombre avec valeur par defaut et bornes optionnelles"""
+        value = data.get(key, default)
+        if not _is_number(value) or (integer and not isinstance(value, int)):
+            kind = "an integer" if integer else "a number"
+            self.error(where, f"'{key}' must be {kind}, got {value!r}")
+            return default
+        if minimum is not None and value < minimum:
+            self.error(where, f"'{key}' must be >= {minimum}, got {value}")
+        if maximum is not None and value > maximum:
+            self.error(where, f"'{key}' must be <= {maximum}, got {value}")
+        return value
+
+    def string(self, data: dict, key: str, default, where: str, choices=None):
+        """Lit une chaine avec valeur par defaut et liste de choix optionnelle"""
+        value = data.get(key, default)
+        if value is None and default is None:
+            return None
+        if not isinstance(value, str):
+            self.error(where, f"'{key}' must be a string, got {value!r}")
+            return default
+        if choices is not None and value not in choices:
+            self.error(where, f"'{key}' must be one of {', '.join(choices)}, got {value!r}")
+        return value
+
+    def entries(self, data: dict, key: str, where: str) -> List[dict]:
+        """Lit une liste d'objets (absente ou null = liste vide)"""
+        value = data.get(key)
+        if value is None:
+            return []
+        if not isinstance(value, list) or not all(isinstance(e, dict) for e in value):
+            self.error(where, f"'{key}' must be a list of objects")
+            return []
+        return value
+
+    def file_reference(self, filename, where: str, key: str):
+        """Verifie qu'un fichier reference par le niveau existe"""
+        missing = filename and _missing_reference(key, filename)
+        if missing:
+            self.error(where, f"'{key}' references missing file {missing}")
+
+    def level(self, raw, expected_id: int) -> dict:
+        """Valide et normalise un niveau complet"""
+        if not isinstance(raw, dict):
+            self.error("level", "top-level value must be an object")
+            return {}
+
+        level_id = self.number(raw, 'id', expected_id, "level", integer=True)
+        if level_id != expected_id:
+            self.error("level", f"'id' is {level_id} but file name says {expected_id}")
+
+        unlock_condition = raw.get('unlock_condition')
+        if unlock_condition is not None and (not isinstance(unlock_condition, int)
+                                             or isinstance(unlock_condition, bool)):
+            self.error("level", f"'unlock_condition' must be a level id or null, got {unlock_condition!r}")
+            unlock_condition = None
+
+        rewards_raw = raw.get('rewards') or {}
+        if not isinstance(rewards_raw, dict):
+            self.error("level", "'rewards' must be an object")
+            rewards_raw = {}
+        thresholds = rewards_raw.get('stars_thresholds', [])
+        if not isinstance(thresholds, list) or not all(_is_number(t) for t in thresholds):
+            self.error("rewards", "'stars_thresholds' must be a list of numbers")
+            thresholds = []
+        elif thresholds != sorted(thresholds):
+            self.error("rewards", "'stars_thresholds' must be in increasing order")
+        rewards = {
+            'completion_score': self.number(rewards_raw, 'completion_score', 0, "rewards", minimum=0),
+            'stars_thresholds': list(thresholds),
+        }
+
+        stages = []
+        seen_ids = set()
+        for index, stage_raw in enumerate(self.entries(raw, 'stages', "level")):
+            stage = self.stage(stage_raw, index + 1)
+            if stage['stage_id'] in seen_ids:
+                self.error(f"stage {stage['stage_id']}", "duplicate 'stage_id'")
+            seen_ids.add(stage['stage_id'])
+            stages.append(stage)
+        if not stages:
+            self.error("level", "'stages' must contain at least one stage")
+
+        return {
+            'id': level_id,
+            'name': self.string(raw, 'name', 'Unknown', "level"),
+            'description': self.string(raw, 'description', 'No description', "level"),
+            'difficulty': self.string(raw, 'difficulty', 'easy', "level", LEVEL_DIFFICULTIES),
+            'icon': self.string(raw, 'icon', None, "level"),
+            'unlock_condition': unlock_condition,
+            'rewards': rewards,
+            'stages': stages,
+        }
+
+    def stage(self, raw: dict, default_id: int) -> dict:
+        """Valide et normalise un stage"""
+        stage_id = self.number(raw, 'stage_id', default_id, f"stage #{default_id}", minimum=1, integer=True)
+        where = f"stage {stage_id}"
+        width = self.number(raw, 'width', 3000, where, minimum=1)
+
+        background = self.string(raw, 'background', None, where)
+        self.file_reference(background, where, 'background')
+        music = self.string(raw, 'music', None, where)
+        self.file_reference(music, where, 'music')
+
+        spawn_raw = raw.get('player_spawn') or {}
+        if not isinstance(spawn_raw, dict):
+            self.error(where, "'player_spawn' must be an object")
+            spawn_raw = {}
+        player_spawn = {
+            'x': self.number(spawn_raw, 'x', 100, f"{where} player_spawn", minimum=0, maximum=width),
+            'y': self.number(spawn_raw, 'y', GROUND_Y, f"{where} player_spawn", minimum=0, maximum=HEIGHT),
+        }
+
+        ground_segments = []
+        for i, seg in enumerate(self.entries(raw, 'ground_segments', where)):
+            at = f"{where} ground_segments[{i}]"
+            ground_segments.append({
+                'x': self.number(seg, 'x', 0, at, minimum=0, maximum=width),
+                'y': self.number(seg, 'y', GROUND_Y, at, minimum=0, maximum=HEIGHT),
+                'width': self.number(seg, 'width', 1000, at, minimum=1),
+            })
+
+        platforms = []
+        for i, plat in enumerate(self.entries(raw, 'platforms', where)):
+            at = f"{where} platforms[{i}]"
+            platforms.append({
+                'x': self.number(plat, 'x', 0, at, minimum=0, maximum=width),
+                'y': self.number(plat, 'y', 400, at, minimum=0, maximum=HEIGHT),
+                'width': self.number(plat, 'width', 150, at, minimum=1),
+                'height': self.number(plat, 'height', 30, at, minimum=1),
+            })
+
+        enemies = []
+        for i, enemy in enumerate(self.entries(raw, 'enemies', where)):
+            at = f"{where} enemies[{i}]"
+            enemies.append({
+                'x': self.number(enemy, 'x', 0, at, minimum=0, maximum=width),
+                'type': self.string(enemy, 'type', 'hater', at, ENEMY_TYPES),
+            })
+
+        pickups = []
+        for i, pickup in enumerate(self.entries(raw, 'pickups', where)):
+            at = f"{where} pickups[{i}]"
+            pickups.append({
+                'x': self.number(pickup, 'x', 0, at, minimum=0, maximum=width),
+                'y': self.number(pickup, 'y', 400, at, minimum=0, maximum=HEIGHT),
+                'type': self.string(pickup, 'type', 'note', at, PICKUP_TYPES),
+            })
+
+        mystery_blocks = []
+        for i, block in enumerate(self.entries(raw, 'mystery_blocks', where)):
+            at = f"{where} mystery_blocks[{i}]"
+            mystery_blocks.append({
+                'x': self.number(block, 'x', 0, at, minimum=0, maximum=width),
+                'y': self.number(block, 'y', 400, at, minimum=0, maximum=HEIGHT),
+            })
+
+        boss = None
+        boss_raw = raw.get('boss')
+        if boss_raw is not None:
+            if not isinstance(boss_raw, dict):
+                self.error(where, "'boss' must be an object or null")
+            else:
+                boss = {
+                    'x': self.number(boss_raw, 'x', WIDTH - 200, f"{where} boss", minimum=0, maximum=width),
+                    'type': self.string(boss_raw, 'type', 'boss', f"{where} boss", BOSS_TYPES),
+                }
+
+        is_boss_stage = raw.get('is_boss_stage', False)
+        if not isinstance(is_boss_stage, bool):
+            self.error(where, f"'is_boss_stage' must be true or false, got {is_boss_stage!r}")
+            is_boss_stage = False
+        if is_boss_stage and boss is None:
+            self.error(where, "boss stage without a 'boss' entry")
+
+        if not ground_segments:
+            self.error(where, "'ground_segments' must contain at least one segment")
+
+        return {
+            'stage_id': stage_id,
+            'name': self.string(raw, 'name', f"Stage {stage_id}", where),
+            'width': width,
+            'background': background,
+            'music': music,
+            'player_spawn': player_spawn,
+            'is_boss_stage': is_boss_stage,
+            'ground_segments': ground_segments,
+            'platforms': platforms,
+            'enemies': enemies,
+            'pickups': pickups,
+            'mystery_blocks': mystery_blocks,
+            'boss': boss,
+        }
 
 
 class LevelLoader:
     """Charge et gere les configurations de niveaux depuis les fichiers JSON"""
 
-    def __init__(self, levels_dir: str = "levels"):
+    def __init__(self, levels_dir: str = "levels", manifest_file=None):
         """
         Initialize le loader
 
         Args:
             levels_dir: Dossier contenant les fichiers JSON des niveaux
+            manifest_file: Cache des metadonnees entre deux lancements (None = pas de cache)
         """
         self.levels_dir = levels_dir
-        self.levels_cache: Dict[int, dict] = {}
+        self.manifest_file = manifest_file
+        self.levels_cache: Dict[int, Level] = {}
+        # ((mtime en ns, taille), hash) du fichier qui a produit chaque entree du cache
+        self.file_stamps: Dict[int, Tuple[Tuple[int, int], str]] = {}
+        # Metadonnees de tous les niveaux, remplies par _sync_manifest()
+        self.manifest: Optional[Dict[int, LevelInfo]] = None
+        self.manifest_problems: List[str] = []
+        # mtime des fichiers surveilles par poll_changes() (mode hot-reload)
+        self.watched_mtimes: Optional[Dict[int, float]] = None
+
+    def _level_path(self, level_id: int) -> str:
+        """Chemin du fichier JSON d'un niveau"""
+        return os.path.join(self.levels_dir, f"level_{level_id}.json")
+
+    def _stat(self, level_id: int) -> Tuple[int, int]:
+        """(mtime en ns, taille) d'un fichier de niveau, sans le lire"""
+        stat = os.stat(self._level_path(level_id))
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_file(self, level_id: int) -> Tuple[Tuple[int, int], bytes, str]:
+        """Lit un fichier de niveau: ((mtime en ns, taille), contenu, sha1)"""
+        filepath = self._level_path(level_id)
+        stamp = self._stat(level_id)
+        with open(filepath, 'rb') as f:
+            content = f.read()
+        return stamp, content, hashlib.sha1(content).hexdigest()
+
+    def _read_level(self, level_id: int) -> Level:
+        """
+        Lit, valide et normalise un fichier de niveau, puis construit le modele.
+        Le resultat est partage par hash: un fichier deja valide n'est pas revalide,
+        et un fichier dont le mtime et la taille n'ont pas change n'est pas relu.
+
+        Raises:
+            FileNotFoundError, LevelValidationError
+        """
+        known = self.file_stamps.get(level_id)
+        if known is not None and known[0] == self._stat(level_id):
+            level_data = _levels_by_hash.get((known[1], _schema_hash()))
+            if level_data is not None and level_data.id == level_id:
+                return level_data
+        stamp, content, digest = self._read_file(level_id)
+        level_data = self._parse_level(level_id, content, digest)
+        self.file_stamps[level_id] = (stamp, digest)
+        return level_data
+
+    def _parse_level(self, level_id: int, content: bytes, digest: str) -> Level:
+        """Valide le contenu d'un fichier de niveau (resultat partage par hash)"""
+        key = (digest, _schema_hash())
+        level_data = _levels_by_hash.get(key)
+        if level_data is None or level_data.id != level_id:
+            filename = os.path.basename(self._level_path(level_id))
+            try:
+                raw = json.loads(content.decode('utf-8'))
+            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                raise LevelValidationError(filename, [f"invalid JSON: {e}"])
+            normalizer = _LevelNormalizer(filename)
+            normalized = normalizer.level(raw, level_id)
+            if normalizer.problems:
+                raise LevelValidationError(filename, normalizer.problems)
+            level_data = Level.from_dict(normalized)
+            _levels_by_hash[key] = level_data
+
+        return level_data
+
+    def _read_manifest(self) -> Dict[int, LevelInfo]:
+        """Lit le manifest sur disque (vide s'il est absent, illisible ou d'un autre schema)"""
+        if self.manifest_file is None:
+            return {}
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if (data.get('version') != MANIFEST_VERSION or data.get('schema') != _schema_hash()
+                    or data.get('levels_dir') != os.path.abspath(self.levels_dir)):
+                return {}
+            return {entry['id']: LevelInfo.from_dict(entry) for entry in data['levels']}
+        except FileNotFoundError:
+            return {}
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            print(f"Warning: Ignoring invalid level manifest: {e}")
+            return {}
+
+    def _write_manifest(self, manifest: Dict[int, LevelInfo]):
+        """Ecrit le manifest (ignore si le dossier est en lecture seule)"""
+        if self.manifest_file is None:
+            return
+        data = {
+            'version': MANIFEST_VERSION,
+            'schema': _schema_hash(),
+            'levels_dir': os.path.abspath(self.levels_dir),
+            'levels': [manifest[level_id].to_dict() for level_id in sorted(manifest)],
+        }
+        try:
+            os.makedirs(os.path.dirname(self.manifest_file), exist_ok=True)
+            with open(self.manifest_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.write("\n")
+        except OSError as e:
+            print(f"Warning: Could not write level manifest: {e}")
+
+    def _sync_manifest(self) -> Dict[int, LevelInfo]:
+        """
+        Met a jour les metadonnees de tous les niveaux.
+        Un fichier dont le mtime et la taille sont ceux du manifest n'est pas lu;
+        sinon il est hashe, et seuls les fichiers dont le hash differe du manifest
+        sont valides en entier. Les verifications
+        rapides (fichiers references, conditions de deblocage) sont refaites a
+        chaque fois. Les erreurs sont gardees dans self.manifest_problems.
+        """
+        if self.manifest is not None:
+            return self.manifest
+
+        stored = self._read_manifest()
+        manifest: Dict[int, LevelInfo] = {}
+        problems = []
+        changed = False
+
+        for level_id in self._level_ids():
+            info = stored.get(level_id)
+            if info is not None and info.file_stamp == self._stat(level_id):
+                manifest[level_id] = info
+                continue
+            stamp, content, digest = self._read_file(level_id)
+            changed = True
+            if info is None or info.file_hash != digest:
+                try:
+                    level_data = self._parse_level(level_id, content, digest)
+                except LevelValidationError as e:
+                    problems.extend(f"{e.filename}: {p}" for p in e.problems)
+                    continue
+                info = LevelInfo.from_level(level_data, digest, stamp)
+            else:
+                # Fichier touche sans changer de contenu: seul le mtime est a jour
+                info.file_stamp = stamp
+            manifest[level_id] = info
+
+        for level_id, info in manifest.items():
+            # Un fichier reference a pu etre supprime depuis la validation
+            for stage_id, key, filename in info.references:
+                missing = _missing_reference(key, filename)
+                if missing:
+                    problems.append(f"level_{level_id}.json: stage {stage_id}: "
+                                    f"'{key}' references missing file {missing}")
+            # Les conditions de deblocage doivent pointer vers un niveau existant
+            unlock_condition = info.unlock_condition
+            if unlock_condition is not None and not os.path.exists(self._level_path(unlock_condition)):
+                problems.append(f"level_{level_id}.json: level: 'unlock_condition' "
+                                f"references unknown level {unlock_condition}")
+
+        if changed or manifest.keys() != stored.keys():
+            self._write_manifest(manifest)
+
+        self.manifest = manifest
+        self.manifest_problems = problems
+        return manifest
+
+    def _scan_mtimes(self) -> Dict[int, float]:
+        """mtime de chaque fichier level_X.json present"""
+        mtimes = {}
+        for level_id in self._level_ids():
+            try:
+                mtimes[level_id] = os.path.getmtime(self._level_path(level_id))
+            except OSError:
+                continue
+        return mtimes
+
+    def poll_changes(self) -> List[int]:
+        """
+        Detecte les fichiers de niveaux modifies, ajoutes ou supprimes depuis
+        le dernier appel (mode hot-reload) et invalide seulement ceux-la.
+
+        Returns:
+            IDs des niveaux modifies (vide au premier appel)
+        """
+        if not os.path.exists(self.levels_dir):
+            return []
+
+        mtimes = self._scan_mtimes()
+        previous = self.watched_mtimes
+        self.watched_mtimes = mtimes
+        if previous is None:
+            return []
+
+        changed = sorted(level_id for level_id in previous.keys() | mtimes.keys()
+                         if previous.get(level_id) != mtimes.get(level_id))
+        if changed:
+            for level_id in changed:
+                self.levels_cache.pop(level_id, None)
+                self.file_stamps.pop(level_id, None)
+            # Le manifest sera resynchronise (seuls les fichiers modifies sont reparses)
+            self.manifest = None
+            self._sync_manifest()
+            for problem in self.manifest_problems:
+                print(f"Error: {problem}")
+        return changed
+
+    def get_level_info(self, level_id: int) -> Optional[LevelInfo]:
+        """Metadonnees d'un niveau (sans charger ses stages)"""
+        if not os.path.exists(self.levels_dir):
+            return None
+        return self._sync_manifest().get(level_id)
 
-    def load_level(self, level_id: int) -> Optional[dict]:
+    def load_level(self, level_id: int) -> Optional[Level]:
         """
         Charge un niveau depuis son fichier JSON
 
@@ -28,36 +491,68 @@ class LevelLoader:
             level_id: ID du niveau a charger
 
         Returns:
-            Dictionnaire contenant toute la config du niveau, ou None si erreur
+            Le niveau (Level), ou None si erreur
         """
         # Verifier le cache
         if level_id in self.levels_cache:
             return self.levels_cache[level_id]
 
-        # Charger depuis le fichier
-        filename = f"level_{level_id}.json"
-        filepath = os.path.join(self.levels_dir, filename)
-
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                level_data = json.load(f)
-
-            # Valider que l'ID correspond
-            if level_data.get('id') != level_id:
-                print(f"Warning: level_id mismatch in {filename}")
-
-            # Mettre en cache
-            self.levels_cache[level_id] = level_data
-            return level_data
-
+            with tracing.span("io", f"load_level {level_id}"):
+                level_data = self._read_level(level_id)
         except FileNotFoundError:
-            print(f"Error: Level file not found: {filepath}")
+            print(f"Error: Level file not found: {self._level_path(level_id)}")
             return None
-        except json.JSONDecodeError as e:
-            print(f"Error: Invalid JSON in {filepath}: {e}")
+        except LevelValidationError as e:
+            print(f"Error: {e}")
             return None
 
-    def get_stage(self, level_id: int, stage_id: int) -> Optional[dict]:
+        # Mettre en cache
+        self.levels_cache[level_id] = level_data
+        return level_data
+
+    def cached_levels(self):
+        """(niveau, taille estimee) de chaque niveau en cache, pour resources"""
+        for level_id, level in list(self.levels_cache.items()):
+            yield f"level_{level_id}", deep_size(level)
+
+    def evict(self, nbytes) -> int:
+        """Oublie les niveaux les plus anciens du cache (relus depuis le disque au besoin)"""
+        freed = 0
+        for level_id in list(self.levels_cache):
+            if freed >= nbytes:
+                break
+            freed += deep_size(self.levels_cache.pop(level_id))
+            stamp = self.file_stamps.pop(level_id, None)
+            if stamp is not None:
+                _levels_by_hash.pop((stamp[1], _schema_hash()), None)
+        return freed
+
+    def _level_ids(self) -> List[int]:
+        """IDs des fichiers level_X.json presents dans le dossier, tries"""
+        level_ids = []
+        for filename in os.listdir(self.levels_dir):
+            if filename.startswith('level_') and filename.endswith('.json'):
+                try:
+                    level_ids.append(int(filename[len('level_'):-len('.json')]))
+                except ValueError:
+                    continue
+        return sorted(level_ids)
+
+    def validate_all(self):
+        """
+        Valide tous les niveaux du dossier via le manifest.
+        A appeler au demarrage pour qu'un pack casse echoue tout de suite;
+        les fichiers inchanges depuis le dernier lancement ne sont pas reparses.
+
+        Raises:
+            LevelValidationError: si au moins un niveau est invalide
+        """
+        self._sync_manifest()
+        if self.manifest_problems:
+            raise LevelValidationError(self.levels_dir, self.manifest_problems)
+
+    def get_stage(self, level_id: int, stage_id: int) -> Optional[Stage]:
         """
         Recupere un stage specifique d'un niveau
 
@@ -66,26 +561,25 @@ class LevelLoader:
             stage_id: ID du stage (1, 2 ou 3)
 
         Returns:
-            Dictionnaire du stage, ou None si non trouve
+            Le stage (Stage), ou None si non trouve
         """
         level_data = self.load_level(level_id)
         if not level_data:
             return None
 
-        stages = level_data.get('stages', [])
-        for stage in stages:
-            if stage.get('stage_id') == stage_id:
-                return stage
+        stage = level_data.get_stage(stage_id)
+        if stage:
+            return stage
 
         print(f"Error: Stage {stage_id} not found in level {level_id}")
         return None
 
-    def get_all_levels(self) -> List[dict]:
+    def get_all_levels(self) -> List[LevelInfo]:
         """
-        Charge tous les niveaux disponibles
+        Liste les niveaux disponibles depuis le manifest (sans charger les stages)
 
         Returns:
-            Liste des configurations de tous les niveaux
+            Liste des metadonnees de tous les niveaux, triee par ID
         """
         levels = []
 
@@ -94,20 +588,11 @@ class LevelLoader:
             print(f"Error: Levels directory not found: {self.levels_dir}")
             return levels
 
-        for filename in os.listdir(self.levels_dir):
-            if filename.startswith('level_') and filename.endswith('.json'):
-                # Extraire l'ID du nom de fichier
-                try:
-                    level_id = int(filename.replace('level_', '').replace('.json', ''))
-                    level_data = self.load_level(level_id)
-                    if level_data:
-                        levels.append(level_data)
-                except ValueError:
-                    continue
+        manifest = self._sync_manifest()
+        for problem in self.manifest_problems:
+            print(f"Error: {problem}")
 
-        # Trier par ID
-        levels.sort(key=lambda x: x.get('id', 0))
-        return levels
+        return [manifest[level_id] for level_id in sorted(manifest)]
 
     def is_level_unlocked(self, level_id: int, completed_levels: List[int]) -> bool:
         """
@@ -120,11 +605,11 @@ class LevelLoader:
         Returns:
             True si le niveau est debloque
         """
-        level_data = self.load_level(level_id)
+        level_data = self.get_level_info(level_id)
         if not level_data:
             return False
 
-        unlock_condition = level_data.get('unlock_condition')
+        unlock_condition = level_data.unlock_condition
 
         # Pas de condition = toujours debloque
         if unlock_condition is None:
@@ -146,11 +631,14 @@ class LevelLoader:
         Returns:
             Dictionnaire des recompenses (completion_score, stars_thresholds)
         """
-        level_data = self.load_level(level_id)
+        level_data = self.get_level_info(level_id)
         if not level_data:
             return None
 
-        return level_data.get('rewards', {})
+        return {
+            'completion_score': level_data.completion_score,
+            'stars_thresholds': level_data.stars_thresholds,
+        }
 
     def get_stars_count(self, level_id: int, score: int) -> int:
         """
@@ -163,11 +651,11 @@ class LevelLoader:
         Returns:
             Nombre d'etoiles (0-3)
         """
-        rewards = self.get_level_rewards(level_id)
-        if not rewards:
+        level_data = self.get_level_info(level_id)
+        if not level_data:
             return 0
 
-        thresholds = rewards.get('stars_thresholds', [])
+        thresholds = level_data.stars_thresholds
         stars = 0
 
         for threshold in thresholds:
@@ -184,5 +672,5 @@ def get_loader() -> LevelLoader:
     """Retourne l'instance globale du loader"""
     global _loader
     if _loader is None:
-        _loader = LevelLoader()
+        _loader = LevelLoader(str(LEVELS_DIR), str(LEVEL_MANIFEST_FILE))
     return _loader
@@ -0,0 +1,237 @@
+"""
+Rockstar Bros - Modeles des niveaux
+Objets legers (__slots__) construits par le LevelLoader a partir des JSON normalises
+"""
+
+from typing import Optional, Tuple
+
+
+class GroundSegment:
+    """Segment de sol d'un stage"""
+
+    __slots__ = ("x", "y", "width")
+
+    def __init__(self, x, y, width):
+        self.x = x
+        self.y = y
+        self.width = width
+
+
+class PlatformSpec:
+    """Plateforme flottante d'un stage"""
+
+    __slots__ = ("x", "y", "width", "height")
+
+    def __init__(self, x, y, width, height):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+
+class EnemySpawn:
+    """Position et type d'un ennemi (spawn sur le sol)"""
+
+    __slots__ = ("x", "enemy_type")
+
+    def __init__(self, x, enemy_type):
+        self.x = x
+        self.enemy_type = enemy_type
+
+
+class PickupSpec:
+    """Position et type d'un pickup"""
+
+    __slots__ = ("x", "y", "pickup_type")
+
+    def __init__(self, x, y, pickup_type):
+        self.x = x
+        self.y = y
+        self.pickup_type = pickup_type
+
+
+class MysteryBlockSpec:
+    """Position d'un mystery block"""
+
+    __slots__ = ("x", "y")
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class BossSpec:
+    """Position et type du boss d'un stage"""
+
+    __slots__ = ("x", "boss_type")
+
+    def __init__(self, x, boss_type):
+        self.x = x
+        self.boss_type = boss_type
+
+
+class Stage:
+    """Un stage complet: decor, geometrie et spawns"""
+
+    __slots__ = (
+        "stage_id", "name", "width", "background", "music",
+        "spawn_x", "spawn_y", "is_boss_stage",
+        "ground_segments", "platforms", "enemies", "pickups",
+        "mystery_blocks", "boss",
+    )
+
+    def __init__(self, stage_id, name, width, background, music, spawn_x, spawn_y,
+                 is_boss_stage, ground_segments, platforms, enemies, pickups,
+                 mystery_blocks, boss):
+        self.stage_id = stage_id
+        self.name = name
+        self.width = width
+        self.background = background
+        self.music = music
+        self.spawn_x = spawn_x
+        self.spawn_y = spawn_y
+        self.is_boss_stage = is_boss_stage
+        self.ground_segments: Tuple[GroundSegment, ...] = ground_segments
+        self.platforms: Tuple[PlatformSpec, ...] = platforms
+        self.enemies: Tuple[EnemySpawn, ...] = enemies
+        self.pickups: Tuple[PickupSpec, ...] = pickups
+        self.mystery_blocks: Tuple[MysteryBlockSpec, ...] = mystery_blocks
+        self.boss: Optional[BossSpec] = boss
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Stage":
+        """Construit un stage depuis un dict normalise par le LevelLoader"""
+        boss = data['boss']
+        return cls(
+            stage_id=data['stage_id'],
+            name=data['name'],
+            width=data['width'],
+            background=data['background'],
+            music=data['music'],
+            spawn_x=data['player_spawn']['x'],
+            spawn_y=data['player_spawn']['y'],
+            is_boss_stage=data['is_boss_stage'],
+            ground_segments=tuple(GroundSegment(s['x'], s['y'], s['width'])
+                                  for s in data['ground_segments']),
+            platforms=tuple(PlatformSpec(p['x'], p['y'], p['width'], p['height'])
+                            for p in data['platforms']),
+            enemies=tuple(EnemySpawn(e['x'], e['type']) for e in data['enemies']),
+            pickups=tuple(PickupSpec(p['x'], p['y'], p['type']) for p in data['pickups']),
+            mystery_blocks=tuple(MysteryBlockSpec(b['x'], b['y']) for b in data['mystery_blocks']),
+            boss=BossSpec(boss['x'], boss['type']) if boss else None,
+        )
+
+
+class Level:
+    """Un niveau: metadonnees pour les menus et liste de ses stages"""
+
+    __slots__ = (
+        "id", "name", "description", "difficulty", "icon",
+        "unlock_condition", "completion_score", "stars_thresholds", "stages",
+    )
+
+    def __init__(self, level_id, name, description, difficulty, icon,
+                 unlock_condition, completion_score, stars_thresholds, stages):
+        self.id = level_id
+        self.name = name
+        self.description = description
+        self.difficulty = difficulty
+        self.icon = icon
+        self.unlock_condition: Optional[int] = unlock_condition
+        self.completion_score = completion_score
+        self.stars_thresholds: Tuple[int, ...] = stars_thresholds
+        self.stages: Tuple[Stage, ...] = stages
+
+    @property
+    def stage_count(self) -> int:
+        """Nombre de stages du niveau"""
+        return len(self.stages)
+
+    def get_stage(self, stage_id: int) -> Optional[Stage]:
+        """Retourne le stage demande, ou None s'il n'existe pas"""
+        for stage in self.stages:
+            if stage.stage_id == stage_id:
+                return stage
+        return None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Level":
+        """Construit un niveau depuis un dict normalise par le LevelLoader"""
+        return cls(
+            level_id=data['id'],
+            name=data['name'],
+            description=data['description'],
+            difficulty=data['difficulty'],
+            icon=data['icon'],
+            unlock_condition=data['unlock_condition'],
+            completion_score=data['rewards']['completion_score'],
+            stars_thresholds=tuple(data['rewards']['stars_thresholds']),
+            stages=tuple(Stage.from_dict(s) for s in data['stages']),
+        )
+
+
+class LevelInfo:
+    """
+    Metadonnees d'un niveau lues depuis le manifest (voir LEVEL_MANIFEST_FILE).
+    Suffisant pour les menus: les stages ne sont charges qu'au lancement du niveau.
+    """
+
+    __slots__ = (
+        "id", "name", "description", "difficulty", "icon",
+        "unlock_condition", "completion_score", "stars_thresholds",
+        "stage_count", "file_hash", "references", "file_stamp",
+    )
+
+    def __init__(self, level_id, name, description, difficulty, icon, unlock_condition,
+                 completion_score, stars_thresholds, stage_count, file_hash, references=(),
+                 file_stamp=None):
+        self.id = level_id
+        self.name = name
+        self.description = description
+        self.difficulty = difficulty
+        self.icon = icon
+        self.unlock_condition: Optional[int] = unlock_condition
+        self.completion_score = completion_score
+        self.stars_thresholds: Tuple[int, ...] = stars_thresholds
+        self.stage_count = stage_count
+        self.file_hash = file_hash
+        # Fichiers references par les stages: (stage_id, cle, nom du fichier)
+        self.references: Tuple[Tuple[int, str, str], ...] = references
+        # (mtime en ns, taille) du fichier hashe: inchange = fichier pas relu
+        self.file_stamp: Optional[Tuple[int, int]] = file_stamp
+
+    @classmethod
+    def from_level(cls, level: Level, file_hash: str, file_stamp=None) -> "LevelInfo":
+        """Extrait les metadonnees d'un niveau complet"""
+        references = tuple((stage.stage_id, key, filename) for stage in level.stages
+                           for key, filename in (('background', stage.background), ('music', stage.music))
+                           if filename)
+        return cls(level.id, level.name, level.description, level.difficulty, level.icon,
+                   level.unlock_condition, level.completion_score, level.stars_thresholds,
+                   level.stage_count, file_hash, references, file_stamp)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LevelInfo":
+        """Construit depuis une entree du manifest"""
+        return cls(data['id'], data['name'], data['description'], data['difficulty'],
+                   data['icon'], data['unlock_condition'], data['completion_score'],
+                   tuple(data['stars_thresholds']), data['stage_count'], data['hash'],
+                   tuple(tuple(reference) for reference in data['references']),
+                   tuple(data['stamp']) if data.get('stamp') else None)
+
+    def to_dict(self) -> dict:
+        """Entree du manifest"""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'description': self.description,
+            'difficulty': self.difficulty,
+            'icon': self.icon,
+            'unlock_condition': self.unlock_condition,
+            'completion_score': self.completion_score,
+            'stars_thresholds': list(self.stars_thresholds),
+            'stage_count': self.stage_count,
+            'hash': self.file_hash,
+            'references': [list(reference) for reference in self.references],
+            'stamp': list(self.file_stamp) if self.file_stamp else None,
+        }
@@ -3,12 +3,26 @@ Rockstar Bros - Point d'entree principal
 Gestion de la boucle de jeu et des scenes
 """
 
-import pygame
+import argparse
 import sys
+
+# --profile-startup doit etre actif avant les imports qu'il mesure
+if __name__ == "__main__" and "--profile-startup" in sys.argv:
+    import startup_profile
+    startup_profile.enable()
+
+import pygame
+import startup_profile
+import tracing
+from telemetry import Telemetry
+from allocations import AllocationTracker, GcPolicy
 from settings import (
-    WIDTH, HEIGHT, FPS, TITLE, BG_COLOR,
+    WIDTH, HEIGHT, FPS, TITLE, BG_COLOR, HOT_RELOAD_POLL_INTERVAL,
+    DISPLAY_BACKEND, DISPLAY_BACKENDS, RENDER_SCALE, RENDER_SCALES, RENDER_NATIVE_TEXT,
     STATE_MENU, STATE_LEVEL_SELECT, STATE_GAMEPLAY, STATE_PAUSE,
-    STATE_GAME_OVER, STATE_VICTORY
+    STATE_GAME_OVER, STATE_VICTORY, STATE_CALIBRATION,
+    AUDIO_FREQUENCY, AUDIO_SIZE, AUDIO_OUTPUT_CHANNELS, AUDIO_BUFFER,
+    STARTUP_BUDGET_MS, STARTUP_TRACE_FILE, TELEMETRY_ENABLED, GC_POLICY_ENABLED, ALLOC_TRACK_FRAMES,
 )
 from scenes.menu import MenuScene
 from scenes.level_select import LevelSelectScene
@@ -16,96 +30,283 @@ from scenes.gameplay import GameplayScene
 from scenes.pause import PauseScene
 from scenes.game_over import GameOverScene
 from scenes.victory import VictoryScene
+from scenes.calibration import CalibrationScene
+from level_loader import get_loader
+from assets import get_preloader, release_images, cached_images, evict_images
+from audio import get_audio_bank
+from entities.enemy import Enemy
+from resources import get_resource_registry, walk_attributes
+from display import create_display
+from render import OverlayLayer
+from input_events import EventPump
+from input_map import get_input_map
+from rhythm import now_ms
 
 
 # Duree de la transition en millisecondes
 TRANSITION_DURATION = 1200
+# Temps de transition pendant lequel la nouvelle scene est encore cachee:
+# si ses assets ne sont pas prets, la transition attend a ce point
+TRANSITION_PRELOAD_WINDOW = 150
+# Attente maximum des assets: au-dela, la scene est entree et charge ce qui manque elle-meme
+TRANSITION_PRELOAD_TIMEOUT = 3000
+
+# Scenes du jeu, construites a leur premiere utilisation (voir Game.get_scene)
+SCENE_CLASSES = {
+    STATE_MENU: MenuScene,
+    STATE_LEVEL_SELECT: LevelSelectScene,
+    STATE_GAMEPLAY: GameplayScene,
+    STATE_PAUSE: PauseScene,
+    STATE_GAME_OVER: GameOverScene,
+    STATE_VICTORY: VictoryScene,
+    STATE_CALIBRATION: CalibrationScene,
+}
+
+
+def new_game_data():
+    """Donnees partagees entre scenes au debut d'une partie"""
+    return {
+        "selected_character": 1,
+        "selected_level": 1,
+        "current_stage": 1,
+        "score": 0,
+        "lives": 3,
+        "ultimate_charge": 0,
+        "completed_levels": [],  # Liste des IDs de niveaux completes
+        "level_stars": {},  # {level_id: stars_count}
+    }
 
 
 class Game:
     """Classe principale du jeu - gere la boucle et les scenes"""
 
-    def __init__(self):
-        pygame.init()
-        pygame.mixer.init()
-
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        pygame.display.set_caption(TITLE)
+    def __init__(self, hot_reload=False, display_backend=DISPLAY_BACKEND, render_scale=RENDER_SCALE,
+                 native_text=RENDER_NATIVE_TEXT, telemetry=TELEMETRY_ENABLED, gc_policy=GC_POLICY_ENABLED,
+                 track_allocations=0):
+        # Valider tous les niveaux avant d'ouvrir la fenetre:
+        # un fichier JSON invalide fait echouer le lancement avec un message clair
+        with startup_profile.span("init", "validation des niveaux"):
+            get_loader().validate_all()
+
+        # Mixer configure avant pygame.init(): sinon SDL choisit un buffer (et une latence) par defaut
+        pygame.mixer.pre_init(AUDIO_FREQUENCY, AUDIO_SIZE, AUDIO_OUTPUT_CHANNELS, AUDIO_BUFFER)
+        with startup_profile.span("init", "pygame.init"):
+            pygame.init()
+        with startup_profile.span("init", "pygame.mixer.init"):
+            pygame.mixer.init()
+
+        # Les scenes dessinent dans self.screen, le backend l'affiche (present)
+        with startup_profile.span("init", f"affichage {display_backend}"):
+            self.display = create_display(display_backend, (WIDTH, HEIGHT), TITLE)
+        # Resolution interne du decor du gameplay (HUD et sprites restent natifs)
+        self.render_scale = render_scale
+        # Voiles et overlays des scenes, agrandis une fois par frame (voir draw_scene)
+        self.overlay = OverlayLayer(render_scale, native_text)
         self.clock = pygame.time.Clock()
+        # Entrees horodatees a leur arrivee (voir input_events)
+        self.event_pump = EventPump()
+        self.input_map = get_input_map()
         self.running = True
+        self.exit_code = 0
+        # Temps de frame par scene ecrits dans un journal local (voir telemetry)
+        self.telemetry = Telemetry() if telemetry else None
+        # Collectes completes repoussees hors du gameplay (voir allocations.GcPolicy)
+        self.gc_policy = GcPolicy(verbose=bool(track_allocations)) if gc_policy else None
+        # --track-allocations: lignes qui allouent le plus toutes les N frames
+        self.allocation_tracker = AllocationTracker(track_allocations) if track_allocations else None
+
+        # Mode developpement: recharger les niveaux modifies sans relancer le jeu
+        self.hot_reload = hot_reload
+        self.hot_reload_timer = 0
+        # Niveaux modifies pendant qu'une scene etait suspendue (prevenue a sa reprise)
+        self.stale_level_ids = {}
+        if self.hot_reload:
+            get_loader().poll_changes()  # Premier scan de reference
 
         # Donnees partagees entre scenes
-        self.game_data = {
-            "selected_character": 1,
-            "selected_level": 1,
-            "current_stage": 1,
-            "score": 0,
-            "lives": 3,
-            "ultimate_charge": 0,
-            "completed_levels": [],  # Liste des IDs de niveaux completes
-            "level_stars": {},  # {level_id: stars_count}
-        }
-
-        # Scenes disponibles
+        self.game_data = new_game_data()
+
+        # Comptabilite memoire (overlay F1 et budgets MEMORY_BUDGETS)
+        self._register_resources()
+
+        # Scenes deja construites (les autres le sont a leur premiere utilisation)
         self.scenes = {}
         self.current_scene = None
-        self._init_scenes()
+        # Scene restee en memoire sous une scene overlay (gameplay sous la pause)
+        self.suspended_scene = None
+        # Images prechargees pour chaque scene active (liberees a sa sortie)
+        self.scene_assets = {}
 
         # Systeme de transition
         self.transitioning = False
         self.transition_timer = 0
+        # Temps passe a attendre les assets de la scene en attente (ms)
+        self.preload_wait_ms = 0
         self.transition_from_surface = None
         self.transition_to_surface = None
         self.pending_scene = None
         self.pending_kwargs = {}
+        self.pending_enter = False  # enter() en attente du prechargement
+        self.pending_assets = []
 
         # Commencer par le menu (sans transition)
         self._change_scene_immediate(STATE_MENU)
 
-    def _init_scenes(self):
-        """Initialise toutes les scenes du jeu"""
-        self.scenes[STATE_MENU] = MenuScene(self)
-        self.scenes[STATE_LEVEL_SELECT] = LevelSelectScene(self)
-        self.scenes[STATE_GAMEPLAY] = GameplayScene(self)
-        self.scenes[STATE_PAUSE] = PauseScene(self)
-        self.scenes[STATE_GAME_OVER] = GameOverScene(self)
-        self.scenes[STATE_VICTORY] = VictoryScene(self)
+    def _register_resources(self):
+        """Sources de la comptabilite memoire: les caches d'abord, puis ce que gardent les scenes"""
+        registry = get_resource_registry()
+        registry.register("images", cached_images, evict_images)
+        registry.register("ennemis", Enemy.cached_images, Enemy.evict_image_cache)
+        bank = get_audio_bank()
+        registry.register("sons", bank.decoded_sounds, bank.evict)
+        loader = get_loader()
+        registry.register("niveaux", loader.cached_levels, loader.evict)
+        registry.register("scenes", self._scene_resources)
+
+    def _scene_resources(self):
+        """Surfaces et sons gardes par les scenes construites"""
+        for scene_name, scene in list(self.scenes.items()):
+            yield from walk_attributes(scene_name, scene)
+
+    def get_scene(self, scene_name):
+        """Retourne une scene, en la construisant a sa premiere utilisation"""
+        scene = self.scenes.get(scene_name)
+        if scene is None:
+            with startup_profile.span("scene", f"{scene_name} (construction)"):
+                scene = SCENE_CLASSES[scene_name](self)
+            self.scenes[scene_name] = scene
+        return scene
+
+    def _leave_scene(self, new_scene, keep_assets, resume=False):
+        """
+        Quitte la scene courante avant d'activer new_scene: exit() puis liberation
+        de ses images. Sous une scene overlay, la scene courante est seulement suspendue.
+        """
+        old_scene = self.current_scene
+        if old_scene is None or (resume and old_scene is new_scene):
+            return
+        if old_scene.defer_gc and self.gc_policy:
+            self.gc_policy.suspend()
+        if new_scene.overlay and old_scene is not new_scene:
+            self.suspended_scene = old_scene
+            return
+
+        leaving = [old_scene]
+        if self.suspended_scene not in (None, new_scene):
+            leaving.append(self.suspended_scene)
+        self.suspended_scene = None
+        for scene in leaving:
+            scene.exit()
+            self.stale_level_ids.pop(scene, None)
+            release_images(self.scene_assets.pop(scene, []), keep=keep_assets)
 
     def _change_scene_immediate(self, scene_name, **kwargs):
         """Change la scene immediatement sans transition"""
-        if scene_name in self.scenes:
-            self.current_scene = self.scenes[scene_name]
-            self.current_scene.enter(**kwargs)
+        if scene_name in SCENE_CLASSES:
+            new_scene = self.get_scene(scene_name)
+            self._leave_scene(new_scene, [])
+            # Images chargees par enter() sans prechargement, a liberer quand meme a la sortie
+            self.scene_assets[new_scene] = new_scene.get_preload_assets(**kwargs)
+            self.current_scene = new_scene
+            with startup_profile.span("scene", f"{scene_name}.enter"), tracing.span("scene", f"{scene_name}.enter"):
+                self.current_scene.enter(**kwargs)
+            get_resource_registry().enforce()
+            self.apply_gc_policy(new_scene)
 
     def change_scene(self, scene_name, resume=False, **kwargs):
         """Change la scene avec transition slide"""
-        if scene_name in self.scenes and not self.transitioning:
+        if scene_name in SCENE_CLASSES and not self.transitioning:
             # Capturer l'ecran actuel
-            self.transition_from_surface = self.screen.copy()
+            self.transition_from_surface = self.capture_screen()
+
+            tracing.instant("scene", f"change -> {scene_name}", {"resume": resume})
 
             # Preparer la nouvelle scene
             self.pending_scene = scene_name
             self.pending_kwargs = kwargs
 
-            # Activer la nouvelle scene pour la dessiner
-            new_scene = self.scenes[scene_name]
-            if not resume:
-                new_scene.enter(**kwargs)
-
-            # Capturer l'ecran de la nouvelle scene
-            self.transition_to_surface = pygame.Surface((WIDTH, HEIGHT))
-            self.transition_to_surface.fill(BG_COLOR)
-            new_scene.draw(self.transition_to_surface)
-
             # Demarrer la transition
             self.transitioning = True
             self.transition_timer = 0
-            self.current_scene = new_scene
+            self.preload_wait_ms = 0
+            self.transition_to_surface = None
+
+            new_scene = self.get_scene(scene_name)
+            if resume:
+                # Retour sur une scene suspendue: ses images sont deja la
+                self.pending_assets = self.scene_assets.get(new_scene, [])
+                self._show_pending_scene()
+            else:
+                # Les images de la scene sont decodees sur un thread pendant l'animation,
+                # enter() est appele quand elles sont pretes (voir _update_transition)
+                self.pending_assets = new_scene.get_preload_assets(**kwargs)
+                get_preloader().request(self.pending_assets)
+                self.pending_enter = True
+
+    def _show_pending_scene(self):
+        """Active la scene en attente et capture sa premiere image pour la transition"""
+        new_scene = self.scenes[self.pending_scene]
+        # L'ancienne scene est quittee ici (et pas dans change_scene) pour qu'elle
+        # finisse sa frame; les images communes aux deux scenes restent en cache
+        self._leave_scene(new_scene, self.pending_assets, resume=not self.pending_enter)
+        self.scene_assets[new_scene] = self.pending_assets
+        if self.pending_enter:
+            self.pending_enter = False
+            with tracing.span("scene", f"{self.pending_scene}.enter"):
+                new_scene.enter(**self.pending_kwargs)
+            get_resource_registry().enforce()
+        self.current_scene = new_scene
+        self.apply_gc_policy(new_scene)
+
+        # Capturer l'ecran de la nouvelle scene
+        self.transition_to_surface = pygame.Surface((WIDTH, HEIGHT))
+        self.draw_scene(new_scene, self.transition_to_surface)
+
+    @property
+    def screen(self):
+        """Surface de la frame en cours (l'affichage GPU peut en changer entre deux frames)"""
+        return self.display.surface
+
+    def capture_screen(self):
+        """
+        Image de la scene courante, redessinee dans une surface a part
+        (en GPU, la surface de l'ecran ne contient pas les dessins du renderer)
+        """
+        surface = pygame.Surface((WIDTH, HEIGHT))
+        if self.current_scene:
+            self.draw_scene(self.current_scene, surface)
+        else:
+            surface.fill(BG_COLOR)
+        return surface
+
+    def draw_scene(self, scene, surface):
+        """Dessine une scene dans surface, puis son overlay (seule mise a l'echelle de la frame)"""
+        surface.fill(BG_COLOR)
+        self.overlay.begin(surface)
+        scene.draw(surface)
+        self.overlay.present()
+
+    def apply_gc_policy(self, scene):
+        """Scene sensible aux pauses du ramasse-miettes affichee (entree ou reprise)"""
+        if scene.defer_gc and self.gc_policy:
+            self.gc_policy.stage_loaded()
 
     def _update_transition(self, dt_ms):
         """Met a jour l'animation de transition"""
         self.transition_timer += dt_ms
 
+        if self.transition_to_surface is None:
+            if get_preloader().is_ready():
+                self._show_pending_scene()
+            elif self.preload_wait_ms >= TRANSITION_PRELOAD_TIMEOUT:
+                print(f"Warning: Assets of {self.pending_scene} not ready after "
+                      f"{TRANSITION_PRELOAD_TIMEOUT} ms, loading them synchronously")
+                self._show_pending_scene()
+            else:
+                self.preload_wait_ms += dt_ms
+                # Ne pas reveler la nouvelle scene avant qu'elle soit prete
+                self.transition_timer = min(self.transition_timer, TRANSITION_PRELOAD_WINDOW)
+
         if self.transition_timer >= TRANSITION_DURATION:
             # Transition terminee
             self.transitioning = False
@@ -130,6 +331,8 @@ class Game:
         # D'abord dessiner la nouvelle scene en entier
         if self.transition_to_surface:
             self.screen.blit(self.transition_to_surface, (0, 0))
+        else:
+            self.screen.fill(BG_COLOR)
 
         # Puis dessiner l'ancienne scene avec un clip diagonal (partie gauche)
         if self.transition_from_surface:
@@ -170,6 +373,25 @@ class Game:
         ]
         pygame.draw.polygon(self.screen, (220, 220, 220), band_points2)
 
+    def _poll_level_changes(self, dt_ms):
+        """Mode hot-reload: previent la scene courante (et la scene suspendue a sa reprise)"""
+        stale = self.stale_level_ids.pop(self.current_scene, None)
+        if stale:
+            self.current_scene.on_levels_changed(sorted(stale))
+
+        self.hot_reload_timer += dt_ms
+        if self.hot_reload_timer < HOT_RELOAD_POLL_INTERVAL:
+            return
+        self.hot_reload_timer = 0
+
+        changed = get_loader().poll_changes()
+        if changed:
+            print(f"[HotReload] Levels changed: {changed}")
+            if self.current_scene:
+                self.current_scene.on_levels_changed(changed)
+            if self.suspended_scene:
+                self.stale_level_ids.setdefault(self.suspended_scene, set()).update(changed)
+
     def reset_game(self):
         """Reinitialise les donnees du jeu pour une nouvelle partie"""
         self.game_data["selected_level"] = 1
@@ -178,50 +400,122 @@ class Game:
         self.game_data["lives"] = 3
         self.game_data["ultimate_charge"] = 0
         # Note: on ne reset pas completed_levels et level_stars pour garder la progression
-        # Recreer la scene gameplay pour reset complet
-        self.scenes[STATE_GAMEPLAY] = GameplayScene(self)
+        # Oublier la scene gameplay pour reset complet (reconstruite a la prochaine partie)
+        gameplay = self.scenes.pop(STATE_GAMEPLAY, None)
+        self.scene_assets.pop(gameplay, None)
 
     def run(self):
         """Boucle principale du jeu"""
+        frame_deadline = now_ms()
         while self.running:
+            # Attente de la frame suivante (limite FPS) en relevant les entrees
+            with tracing.span("loop", "wait"):
+                self.event_pump.wait_until(frame_deadline)
+            frame_deadline = max(frame_deadline + 1000 / FPS, now_ms())
+
             # Delta time en secondes
-            dt = self.clock.tick(FPS) / 1000.0
+            dt = self.clock.tick() / 1000.0
             dt_ms = dt * 1000
 
-            # Gestion des evenements
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                elif not self.transitioning:
-                    # Ne pas traiter les events pendant la transition
-                    if self.current_scene:
-                        self.current_scene.handle_event(event)
+            # --trace: une frame trop longue ecrit les evenements qui l'ont precedee
+            tracer = tracing.get_tracer()
+            if tracer:
+                tracer.end_frame(dt_ms)
+            scene_name = type(self.current_scene).__name__
+            if self.telemetry:
+                if self.transitioning:
+                    self.telemetry.record_frame("transition", dt_ms)
+                else:
+                    self.telemetry.record_frame(scene_name, dt_ms, self.current_scene.telemetry_context)
+            if self.allocation_tracker:
+                self.allocation_tracker.end_frame(scene_name)
+
+            # Gestion des evenements (dans l'ordre d'arrivee, avec event.input_time)
+            with tracing.span("loop", "events"):
+                for event in self.event_pump.drain():
+                    if event.type == pygame.QUIT:
+                        self.running = False
+                    elif event.type in (pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED):
+                        self.input_map.handle_device_event(event)
+                    elif tracer and self.input_map.is_action(event, "debug_trace"):
+                        tracer.flush("f4")
+                    elif not self.transitioning:
+                        # Ne pas traiter les events pendant la transition
+                        if self.current_scene:
+                            self.current_scene.handle_event(event)
+
+            if self.hot_reload and not self.transitioning:
+                self._poll_level_changes(dt_ms)
 
             # Mise a jour
             if self.transitioning:
-                self._update_transition(dt_ms)
+                with tracing.span("loop", "transition.update"):
+                    self._update_transition(dt_ms)
             elif self.current_scene:
-                self.current_scene.update(dt)
+                with tracing.span("scene", f"{scene_name}.update"):
+                    self.current_scene.update(dt)
 
             # Rendu
             if self.transitioning:
-                self._draw_transition()
+                with tracing.span("loop", "transition.draw"):
+                    self._draw_transition()
             else:
-                self.screen.fill(BG_COLOR)
-                if self.current_scene:
-                    self.current_scene.draw(self.screen)
+                with tracing.span("scene", f"{scene_name}.draw"):
+                    if self.current_scene:
+                        self.draw_scene(self.current_scene, self.screen)
+                    else:
+                        self.screen.fill(BG_COLOR)
+
+            with tracing.span("loop", "present"):
+                self.display.present()
 
-            pygame.display.flip()
+            # --profile-startup: rapport a la premiere image puis arret
+            if startup_profile.is_enabled():
+                self.exit_code = 0 if startup_profile.finish(STARTUP_TRACE_FILE, STARTUP_BUDGET_MS) else 1
+                self.running = False
 
         self.quit()
 
     def quit(self):
         """Ferme proprement le jeu"""
+        if self.telemetry:
+            self.telemetry.close()
         pygame.mixer.quit()
         pygame.quit()
-        sys.exit()
+        sys.exit(self.exit_code)
 
 
 if __name__ == "__main__":
-    game = Game()
+    parser = argparse.ArgumentParser(description=TITLE)
+    parser.add_argument("--hot-reload", action="store_true",
+                        help="recharger les niveaux JSON modifies pendant le jeu (developpement)")
+    parser.add_argument("--renderer", choices=DISPLAY_BACKENDS, default=DISPLAY_BACKEND,
+                        help="backend d'affichage (gpu: SDL Renderer, repli logiciel sans GPU)")
+    parser.add_argument("--render-scale", type=int, choices=RENDER_SCALES, default=RENDER_SCALE,
+                        help="diviseur de resolution du decor et des overlays "
+                             "(2 = 640x360 agrandi, bornes peu puissantes)")
+    parser.add_argument("--lowres-text", action="store_true",
+                        help="avec --render-scale, dessiner aussi les textes des overlays a basse resolution")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="mesurer le demarrage jusqu'a la premiere image, ecrire la trace JSON "
+                             "et quitter (code 1 si le budget STARTUP_BUDGET_MS est depasse)")
+    parser.add_argument("--trace", action="store_true",
+                        help="garder une trace des evenements (ecrite dans traces/ sur F4 "
+                             "ou apres une frame de plus de TRACE_HITCH_MS)")
+    parser.add_argument("--no-telemetry", action="store_true",
+                        help="ne pas ecrire le journal des temps de frame (telemetry/frames.log)")
+    parser.add_argument("--track-allocations", type=int, nargs="?", const=ALLOC_TRACK_FRAMES, default=0,
+                        metavar="N", help="suivre les allocations (tracemalloc) et afficher toutes les N "
+                                          f"frames les lignes qui allouent le plus (defaut {ALLOC_TRACK_FRAMES})")
+    parser.add_argument("--no-gc-policy", action="store_true",
+                        help="garder le ramasse-miettes par defaut de Python pendant le gameplay")
+    args = parser.parse_args()
+
+    if args.trace:
+        tracing.enable()
+
+    game = Game(hot_reload=args.hot_reload, display_backend=args.renderer,
+                render_scale=args.render_scale, native_text=RENDER_NATIVE_TEXT and not args.lowres_text,
+                telemetry=TELEMETRY_ENABLED and not args.no_telemetry,
+                gc_policy=GC_POLICY_ENABLED and not args.no_gc_policy, track_allocations=args.track_allocations)
     game.run()
@@ -0,0 +1,72 @@
+"""
+Rockstar Bros - Preferences du joueur
+Reglages locaux (latence audio/video, touches...) sauvegardes dans preferences.json
+"""
+
+import json
+from typing import Any, Dict, Optional
+
+from settings import PREFERENCES_FILE
+
+
+# Valeurs par defaut (et liste des cles connues)
+DEFAULT_PREFERENCES: Dict[str, Any] = {
+    # Retard mesure entre un son joue et le tap du joueur (ms)
+    "audio_latency_ms": 0,
+    # Retard mesure entre un flash affiche et le tap du joueur (ms)
+    "visual_latency_ms": 0,
+    # Touches reconfigurees: {action: [touches]} (voir input_map)
+    "controls": {},
+}
+
+
+class Preferences:
+    """Preferences chargees depuis un fichier JSON, avec valeurs par defaut"""
+
+    def __init__(self, path=PREFERENCES_FILE):
+        self.path = path
+        self.values: Dict[str, Any] = dict(DEFAULT_PREFERENCES)
+        self._load()
+
+    def _load(self):
+        """Lit le fichier (absent ou invalide = valeurs par defaut)"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Preferences ignorees ({self.path}): {e}")
+            return
+        if isinstance(data, dict):
+            for key in DEFAULT_PREFERENCES:
+                if key in data:
+                    self.values[key] = data[key]
+
+    def get(self, key):
+        """Valeur d'une preference"""
+        return self.values.get(key, DEFAULT_PREFERENCES.get(key))
+
+    def set(self, key, value):
+        """Modifie une preference et sauvegarde le fichier"""
+        self.values[key] = value
+        self.save()
+
+    def save(self):
+        """Ecrit le fichier de preferences"""
+        try:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self.values, f, indent=2)
+        except OSError as e:
+            print(f"Impossible de sauvegarder les preferences: {e}")
+
+
+_preferences: Optional[Preferences] = None
+
+
+def get_preferences() -> Preferences:
+    """Retourne l'instance globale des preferences"""
+    global _preferences
+    if _preferences is None:
+        _preferences = Preferences()
+    return _preferences
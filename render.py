@@ -0,0 +1,292 @@
+"""
+Rockstar Bros - File de rendu
+Regroupe les blits des sprites par couche et les envoie en un seul Surface.blits,
+decor du gameplay et overlays des scenes rendus a basse resolution
+"""
+
+from typing import Dict, List, Tuple
+
+import pygame
+
+from display import canvas_for
+from settings import WIDTH, HEIGHT
+from stage_geometry import StageGeometry
+
+
+# Couches d'un meme envoi (les plus petites sont dessinees en premier)
+LAYER_PICKUPS = 0
+LAYER_PROJECTILES = 1
+
+
+class RenderQueue:
+    """
+    Collecte des paires (surface, rect monde) pendant une passe de dessin.
+    Le decalage de camera et le culling sont appliques ici, puis flush()
+    envoie chaque couche a l'ecran en un seul appel a blits().
+    """
+
+    def __init__(self, view_width=WIDTH):
+        self.view_width = view_width
+        self.offset = 0
+        self._layers: Dict[int, List[Tuple[pygame.Surface, pygame.Rect]]] = {}
+
+        # Compteurs de la frame (affiches en mode debug)
+        self.queued = 0
+        self.culled = 0
+        self.batches = 0
+
+    def begin(self, camera_x):
+        """Debut de frame: fixe la camera et remet les compteurs a zero"""
+        # Meme arrondi que rect.move(-camera_x, 0)
+        self.offset = int(-camera_x)
+        self._layers.clear()
+        self.queued = self.culled = self.batches = 0
+
+    def add(self, surface, rect, layer=0):
+        """Ajoute une surface a une position monde (ignoree si hors ecran)"""
+        if rect.right + self.offset <= 0 or rect.left + self.offset >= self.view_width:
+            self.culled += 1
+            return
+        self._layers.setdefault(layer, []).append((surface, rect))
+        self.queued += 1
+
+    def add_group(self, group, layer=0):
+        """Ajoute l'image de chaque sprite d'un groupe"""
+        left = -self.offset
+        right = left + self.view_width
+        sprites = group.sprites()
+        visible = [(s.image, s.rect) for s in sprites if s.rect.right > left and s.rect.left < right]
+        if visible:
+            self._layers.setdefault(layer, []).extend(visible)
+        self.queued += len(visible)
+        self.culled += len(sprites) - len(visible)
+
+    def flush(self, screen):
+        """Dessine les couches en attente, un blits() par couche"""
+        offset = self.offset
+        for layer in sorted(self._layers):
+            items = self._layers[layer]
+            if items:
+                screen.blits([(surface, (rect.x + offset, rect.y)) for surface, rect in items],
+                             doreturn=False)
+                self.batches += 1
+        self._layers.clear()
+
+
+class WorldLayer:
+    """
+    Decor fixe du gameplay: fond en parallaxe, voile sombre et geometrie.
+    Avec scale > 1 il est dessine dans une surface basse resolution puis agrandi
+    d'un facteur entier directement dans l'ecran (une seule operation); les
+    sprites et le HUD restent a la resolution native par-dessus. La camera doit
+    etre un multiple de scale pour que sprites et geometrie restent alignes
+    (voir GameplayScene._view_x).
+    """
+
+    def __init__(self, background, platforms, level_width, scale=1, veil_alpha=90):
+        """
+        Args:
+            background: Fond (WIDTH x HEIGHT, opaque)
+            platforms: Sprites fixes de la geometrie (voir StageGeometry)
+            level_width: Largeur du stage en pixels
+            scale: Diviseur entier de resolution (1 = natif)
+            veil_alpha: Opacite du voile noir applique au fond
+        """
+        self.scale = scale
+        size = (WIDTH // scale, HEIGHT // scale)
+
+        # Le voile est integre au fond une fois pour toutes
+        veil = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        veil.fill((0, 0, 0, veil_alpha))
+        self.background = background.copy()
+        self.background.blit(veil, (0, 0))
+        if scale > 1:
+            self.background = pygame.transform.smoothscale(self.background, size)
+
+        self.geometry = StageGeometry(platforms, level_width, scale=scale)
+        self.target = pygame.Surface(size, 0, self.background) if scale > 1 else None
+
+    def draw(self, screen, camera_x):
+        """Dessine le decor pour une position de camera (entiere, multiple de scale)"""
+        target = self.target if self.target is not None else screen
+        width = target.get_width()
+        bg_offset = int(camera_x * 0.3) % WIDTH // self.scale
+        target.blit(self.background, (-bg_offset, 0))
+        target.blit(self.background, (width - bg_offset, 0))
+        self.geometry.draw(target, camera_x // self.scale)
+
+        if self.target is not None:
+            pygame.transform.scale(self.target, screen.get_size(), screen)
+
+
+def _topleft(pos):
+    """Coin haut-gauche d'une position de blit (point ou Rect)"""
+    return pos.topleft if isinstance(pos, pygame.Rect) else pos
+
+
+def _blit_text(surface, image, pos, alpha):
+    """Blit d'un texte rendu dans la frame (pas de texture GPU par texte)"""
+    if alpha >= 255:
+        surface.blit(image, pos)
+    else:
+        canvas_for(surface, software=True).blit_alpha(image, pos, alpha)
+
+
+class OverlayCanvas:
+    """
+    Canevas de l'OverlayLayer, en coordonnees de l'ecran (WIDTH x HEIGHT).
+    Avec scale > 1, positions, tailles et images sont divisees par scale et
+    dessinees dans la surface basse resolution; text() garde les textes pour
+    les dessiner a la resolution native apres la mise a l'echelle (si texts).
+    """
+
+    def __init__(self, surface, scale=1, texts=None):
+        """
+        Args:
+            surface: Ecran (scale = 1) ou surface basse resolution de l'overlay
+            scale: Diviseur entier de resolution de surface
+            texts: Liste des textes natifs de la frame (None: dessines dans surface)
+        """
+        self.surface = surface
+        self.scale = scale
+        self.texts = texts
+
+    def _rect(self, rect):
+        """Rect de l'ecran -> rect de la surface"""
+        rect = pygame.Rect(rect)
+        scale = self.scale
+        if scale == 1:
+            return rect
+        return pygame.Rect(rect.x // scale, rect.y // scale,
+                           max(1, rect.width // scale), max(1, rect.height // scale))
+
+    def _point(self, point):
+        """Point de l'ecran -> point de la surface"""
+        return int(point[0]) // self.scale, int(point[1]) // self.scale
+
+    def _width(self, width):
+        """Epaisseur d'un trait (0 = plein)"""
+        return width if width <= 0 else max(1, width // self.scale)
+
+    def _canvas(self):
+        """Canevas de display (GPU si la surface est l'ecran de l'affichage GPU)"""
+        return canvas_for(self.surface)
+
+    # --- Images ---
+
+    def blit(self, image, pos):
+        """Dessine une image telle quelle (pos: coin haut-gauche ou Rect)"""
+        if self.scale == 1:
+            self.surface.blit(image, pos)
+        else:
+            self.blit_alpha(image, pos, 255)
+
+    def blit_alpha(self, image, pos, alpha):
+        """Dessine une image avec une opacite globale (0-255)"""
+        if self.scale == 1:
+            self._canvas().blit_alpha(image, _topleft(pos), alpha)
+        else:
+            self._canvas().blit_scaled(image, self._rect(image.get_rect(topleft=_topleft(pos))), alpha)
+
+    def blit_scaled(self, image, rect, alpha=255):
+        """Dessine une image etiree dans rect"""
+        self._canvas().blit_scaled(image, self._rect(rect), alpha)
+
+    def blit_rotated(self, image, center, angle, size=None, alpha=255):
+        """Dessine une image (redimensionnee a size) tournee de angle degres autour de center"""
+        width, height = size or image.get_size()
+        size = (max(1, width // self.scale), max(1, height // self.scale))
+        self._canvas().blit_rotated(image, self._point(center), angle, size, alpha)
+
+    def text(self, image, pos, alpha=255):
+        """Dessine un texte rendu: en natif par-dessus l'overlay si le calque le demande"""
+        if self.texts is not None:
+            self.texts.append((image, _topleft(pos), alpha))
+        elif self.scale == 1:
+            _blit_text(self.surface, image, pos, alpha)
+        else:
+            self.blit_alpha(image, pos, alpha)
+
+    # --- Formes ---
+
+    def fill_alpha(self, color, alpha, rect=None):
+        """Voile de couleur semi-transparent (tout l'ecran si rect est None)"""
+        self._canvas().fill_alpha(color, alpha, None if rect is None else self._rect(rect))
+
+    def rect(self, color, rect, width=0, border_radius=0):
+        """pygame.draw.rect"""
+        pygame.draw.rect(self.surface, color, self._rect(rect), self._width(width),
+                         border_radius // self.scale)
+
+    def line(self, color, start, end, width=1):
+        """pygame.draw.line"""
+        pygame.draw.line(self.surface, color, self._point(start), self._point(end), self._width(width))
+
+    def circle(self, color, center, radius, width=0):
+        """pygame.draw.circle"""
+        pygame.draw.circle(self.surface, color, self._point(center), max(1, radius // self.scale),
+                           self._width(width))
+
+    def polygon(self, color, points, width=0):
+        """pygame.draw.polygon"""
+        pygame.draw.polygon(self.surface, color, [self._point(p) for p in points], self._width(width))
+
+
+class OverlayLayer:
+    """
+    Voiles, overlays et menus dessines par-dessus une scene (voir OverlayCanvas).
+    Avec scale > 1 ils vont dans une surface basse resolution que Game agrandit
+    en une seule operation a la fin du dessin de la scene (present); les textes
+    restent a la resolution native si native_text, sinon ils passent aussi par
+    la surface basse resolution. Avec scale = 1 le canevas dessine directement
+    dans l'ecran. Une scene qui prend le canevas y dessine toute la suite de sa
+    frame, pour garder l'ordre de dessin.
+    """
+
+    def __init__(self, scale=1, native_text=True):
+        """
+        Args:
+            scale: Diviseur entier de resolution (1 = natif)
+            native_text: True pour garder les textes a la resolution native
+        """
+        self.scale = scale
+        self.native_text = native_text
+        self.screen = None
+        self.texts: List[Tuple[pygame.Surface, Tuple[int, int], int]] = []
+        self._canvas = None
+
+        if scale > 1:
+            # Surface en alpha premultiplie: les blits alpha de pygame sur une
+            # surface transparente donnent des couleurs deja multipliees par l'alpha
+            self.target = pygame.Surface((WIDTH // scale, HEIGHT // scale), pygame.SRCALPHA)
+            self.scaled = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        else:
+            self.target = self.scaled = None
+
+    def begin(self, screen):
+        """Debut du dessin d'une scene dans screen"""
+        self.screen = screen
+        self._canvas = None
+        self.texts.clear()
+
+    def canvas(self) -> OverlayCanvas:
+        """Canevas de l'overlay pour la frame en cours"""
+        if self._canvas is None:
+            if self.target is None:
+                self._canvas = OverlayCanvas(self.screen)
+            else:
+                self.target.fill((0, 0, 0, 0))
+                self._canvas = OverlayCanvas(self.target, self.scale, self.texts if self.native_text else None)
+        return self._canvas
+
+    def present(self):
+        """Fin de la scene: agrandit l'overlay dans l'ecran puis dessine les textes natifs"""
+        if self._canvas is not None and self.target is not None:
+            screen = self.screen
+            pygame.transform.scale(self.target, self.scaled.get_size(), self.scaled)
+            screen.blit(self.scaled, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+            for image, pos, alpha in self.texts:
+                _blit_text(screen, image, pos, alpha)
+        self.texts.clear()
+        self._canvas = None
+        self.screen = None
@@ -0,0 +1,194 @@
+"""
+Rockstar Bros - Comptabilite memoire
+Registre des ressources (surfaces, sons, niveaux) par categorie et proprietaire,
+avec des budgets pour les caches qui peuvent etre vides (voir MEMORY_BUDGETS).
+Les tailles sont calculees a la demande: rien n'est mesure pendant le jeu.
+"""
+
+import sys
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+import pygame
+
+from settings import MEMORY_BUDGETS
+
+
+# Une source retourne des (proprietaire, objet): Surface, Sound, handle audio ou octets
+Reporter = Callable[[], Iterable[Tuple[str, object]]]
+# Une eviction recoit le nombre d'octets a liberer et retourne ceux liberes
+Evictor = Callable[[int], int]
+
+# Attributs jamais parcourus par walk() (references vers le jeu ou d'autres scenes)
+_SKIPPED_ATTRIBUTES = {"game", "loader", "bank", "tracer"}
+# Profondeur maximum de parcours des attributs
+_WALK_DEPTH = 3
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Memoire des pixels d'une surface (largeur x hauteur x octets par pixel)"""
+    width, height = surface.get_size()
+    return width * height * surface.get_bytesize()
+
+
+def sound_bytes(sound: pygame.mixer.Sound) -> int:
+    """Memoire PCM d'un son decode (duree x frequence x canaux x octets par echantillon)"""
+    init = pygame.mixer.get_init()
+    if not init:
+        return 0
+    frequency, size, channels = init
+    return int(sound.get_length() * frequency) * channels * (abs(size) // 8)
+
+
+def deep_size(obj, _seen=None) -> int:
+    """Taille approximative d'une structure Python (dataclasses, listes, dicts)"""
+    seen = set() if _seen is None else _seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_size(item, seen) for item in obj)
+    elif not isinstance(obj, type):
+        if hasattr(obj, "__dict__"):
+            size += deep_size(vars(obj), seen)
+        # Objets a __slots__ (modeles de level_models)
+        for cls in type(obj).__mro__:
+            slots = getattr(cls, "__slots__", ())
+            for slot in (slots,) if isinstance(slots, str) else slots:
+                size += deep_size(getattr(obj, slot, None), seen)
+    return size
+
+
+def walk(owner, value, depth=_WALK_DEPTH):
+    """
+    Parcourt les attributs d'un objet et produit les (proprietaire, ressource) trouves:
+    surfaces, sons, handles audio, contenus des groupes de sprites et des conteneurs.
+    """
+    if isinstance(value, (pygame.Surface, pygame.mixer.Sound)):
+        yield owner, value
+    elif hasattr(value, "bank") and hasattr(value, "name"):
+        # SoundHandle: le son n'existe en memoire que s'il a ete decode
+        sound = value.bank.decoded(value.name)
+        if sound is not None:
+            yield owner, sound
+    elif depth <= 0 or value is None or isinstance(value, (str, bytes, int, float, bool, type)):
+        return
+    elif isinstance(value, pygame.sprite.AbstractGroup):
+        for sprite in value.sprites():
+            yield from walk(owner, sprite, depth - 1)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from walk(owner, item, depth - 1)
+    elif isinstance(value, (list, tuple, set)):
+        for item in value:
+            yield from walk(owner, item, depth - 1)
+    elif hasattr(value, "__dict__"):
+        for name, item in vars(value).items():
+            if name not in _SKIPPED_ATTRIBUTES:
+                yield from walk(owner, item, depth - 1)
+
+
+def walk_attributes(owner, obj):
+    """walk() de chaque attribut d'un objet (proprietaire: owner.attribut)"""
+    for name, value in list(vars(obj).items()):
+        if name not in _SKIPPED_ATTRIBUTES:
+            yield from walk(f"{owner}.{name}", value)
+
+
+def _size_of(resource) -> int:
+    """Octets d'une ressource produite par une source"""
+    if isinstance(resource, pygame.Surface):
+        return surface_bytes(resource)
+    if isinstance(resource, pygame.mixer.Sound):
+        return sound_bytes(resource)
+    return int(resource)
+
+
+class ResourceRegistry:
+    """Sources de ressources par categorie, budgets et evictions"""
+
+    def __init__(self, budgets=None):
+        self.reporters: Dict[str, Reporter] = {}
+        self.evictors: Dict[str, Evictor] = {}
+        self.budgets: Dict[str, Optional[int]] = dict(MEMORY_BUDGETS if budgets is None else budgets)
+
+    def register(self, category, reporter: Reporter, evictor: Optional[Evictor] = None):
+        """
+        Ajoute (ou remplace) la source d'une categorie.
+        Les categories enregistrees en premier sont prioritaires: une surface partagee
+        (cache d'images + scene) n'est comptee qu'une fois, dans la premiere.
+        """
+        self.reporters[category] = reporter
+        if evictor is not None:
+            self.evictors[category] = evictor
+
+    def unregister(self, category):
+        """Retire une categorie"""
+        self.reporters.pop(category, None)
+        self.evictors.pop(category, None)
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """Octets par categorie puis par proprietaire (ressources partagees comptees une fois)"""
+        seen = set()
+        result: Dict[str, Dict[str, int]] = {}
+        for category, reporter in list(self.reporters.items()):
+            owners: Dict[str, int] = {}
+            for owner, resource in reporter():
+                if not isinstance(resource, int):
+                    if id(resource) in seen:
+                        continue
+                    seen.add(id(resource))
+                owners[owner] = owners.get(owner, 0) + _size_of(resource)
+            result[category] = owners
+        return result
+
+    def category_bytes(self, category) -> int:
+        """Octets d'une seule categorie (sans deduplication avec les autres)"""
+        reporter = self.reporters.get(category)
+        if reporter is None:
+            return 0
+        seen = set()
+        total = 0
+        for _, resource in reporter():
+            if not isinstance(resource, int):
+                if id(resource) in seen:
+                    continue
+                seen.add(id(resource))
+            total += _size_of(resource)
+        return total
+
+    def totals(self) -> Dict[str, int]:
+        """Octets par categorie"""
+        return {category: sum(owners.values()) for category, owners in self.snapshot().items()}
+
+    def enforce(self) -> Dict[str, int]:
+        """Vide les caches au-dela de leur budget; retourne les octets liberes par categorie"""
+        freed = {}
+        for category, evictor in self.evictors.items():
+            budget = self.budgets.get(category)
+            if budget is None:
+                continue
+            excess = self.category_bytes(category) - budget
+            if excess > 0:
+                freed[category] = evictor(excess)
+                print(f"[Memoire] {category}: {freed[category] / 1024:.0f} Ko liberes (budget {budget // 1024} Ko)")
+        return freed
+
+    def summary(self) -> str:
+        """Une ligne pour l'overlay de debug"""
+        totals = self.totals()
+        parts = [f"{category} {size / (1024 * 1024):.1f}" for category, size in totals.items() if size]
+        return f"Memoire (Mo): {sum(totals.values()) / (1024 * 1024):.1f} | " + " | ".join(parts)
+
+
+_registry: Optional[ResourceRegistry] = None
+
+
+def get_resource_registry() -> ResourceRegistry:
+    """Retourne le registre global"""
+    global _registry
+    if _registry is None:
+        _registry = ResourceRegistry()
+    return _registry
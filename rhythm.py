@@ -0,0 +1,159 @@
+"""
+Rockstar Bros - Moteur de partition rythmique
+Notes planifiees en millisecondes sur une horloge monotone et jugees par
+l'ecart de temps entre l'appui et la note (independant du framerate)
+"""
+
+import json
+import random
+import time
+from typing import List, Optional
+
+from settings import HIT_WINDOW_PERFECT, HIT_WINDOW_GOOD, HIT_WINDOW_OK
+
+
+# Resultats du jugement
+JUDGE_PERFECT = "perfect"
+JUDGE_GOOD = "good"
+JUDGE_OK = "ok"
+JUDGE_MISS = "miss"
+
+
+# Source de l'horloge en secondes (remplacee par une horloge simulee en headless)
+_clock = time.perf_counter
+
+
+def now_ms() -> float:
+    """Horloge monotone en millisecondes (ne depend pas des frames)"""
+    return _clock() * 1000
+
+
+def set_clock(clock=None):
+    """Remplace la source de now_ms() (fonction en secondes, None = perf_counter)"""
+    global _clock
+    _clock = time.perf_counter if clock is None else clock
+
+
+class ChartNote:
+    """Une note: instant (ms depuis le debut de la partition) et piste"""
+
+    __slots__ = ("time", "lane", "result")
+
+    def __init__(self, time_ms, lane):
+        self.time = time_ms
+        self.lane = lane
+        self.result: Optional[str] = None
+
+
+class NoteChart:
+    """Partition: liste de (temps en ms, piste) triee par temps"""
+
+    def __init__(self, notes):
+        self.notes = sorted(notes)
+
+    def __len__(self):
+        return len(self.notes)
+
+    @classmethod
+    def from_bpm(cls, bpm, count, lanes, rng=random) -> "NoteChart":
+        """Une note par temps sur une piste aleatoire (le premier temps apres une mesure vide)"""
+        interval = 60000 / bpm
+        return cls([((i + 1) * interval, rng.randrange(lanes)) for i in range(count)])
+
+    @classmethod
+    def load(cls, path, lanes) -> "NoteChart":
+        """
+        Charge une beat map JSON: {"bpm": 75, "notes": [[temps, piste], ...]}.
+
+        Raises:
+            OSError, ValueError: fichier absent ou invalide
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        try:
+            interval = 60000 / float(data["bpm"])
+            notes = [(float(beat) * interval, int(lane)) for beat, lane in data["notes"]]
+        except (KeyError, TypeError, ZeroDivisionError) as e:
+            raise ValueError(f"{path}: beat map invalide ({e})") from e
+        for _, lane in notes:
+            if not 0 <= lane < lanes:
+                raise ValueError(f"{path}: piste {lane} hors de [0, {lanes - 1}]")
+        return cls(notes)
+
+
+class RhythmTrack:
+    """
+    Lecture d'une partition: position dans le temps, jugement des appuis
+    et detection des notes ratees.
+    """
+
+    def __init__(self, chart: NoteChart, latency_ms=0, audio_latency_ms=0):
+        """
+        Args:
+            chart: Partition a jouer
+            latency_ms: Retard du joueur mesure par la calibration video, retire des appuis
+            audio_latency_ms: Retard mesure par la calibration audio: le son de chaque
+                note est lance en avance pour que l'appui tombe au meme instant
+        """
+        self.notes: List[ChartNote] = [ChartNote(t, lane) for t, lane in chart.notes]
+        self.latency_ms = latency_ms
+        self.audio_latency_ms = audio_latency_ms
+        self.start_time = 0.0
+        self._next_cue = 0
+
+    def start(self, clock_ms, lead_ms=0):
+        """Demarre la partition: son temps 0 arrive lead_ms apres clock_ms"""
+        self.start_time = clock_ms + lead_ms
+
+    def song_time(self, clock_ms) -> float:
+        """Position dans la partition (negative avant le debut)"""
+        return clock_ms - self.start_time
+
+    def due_cues(self, clock_ms) -> List[ChartNote]:
+        """Notes dont le son doit etre lance maintenant (une seule fois chacune)"""
+        cue_time = self.song_time(clock_ms) + self.audio_latency_ms - self.latency_ms
+        first = self._next_cue
+        while self._next_cue < len(self.notes) and self.notes[self._next_cue].time <= cue_time:
+            self._next_cue += 1
+        return self.notes[first:self._next_cue]
+
+    def pending(self):
+        """Notes pas encore jugees"""
+        return [note for note in self.notes if note.result is None]
+
+    def judge(self, lane, press_ms) -> Optional[str]:
+        """
+        Juge un appui sur une piste a l'instant press_ms (horloge de now_ms).
+        Retourne JUDGE_PERFECT/GOOD/OK, ou None si aucune note n'est assez proche.
+        """
+        hit_time = self.song_time(press_ms) - self.latency_ms
+        closest = None
+        closest_delta = HIT_WINDOW_OK
+        for note in self.notes:
+            if note.result is None and note.lane == lane:
+                delta = abs(note.time - hit_time)
+                if delta <= closest_delta:
+                    closest, closest_delta = note, delta
+        if closest is None:
+            return None
+
+        if closest_delta <= HIT_WINDOW_PERFECT:
+            closest.result = JUDGE_PERFECT
+        elif closest_delta <= HIT_WINDOW_GOOD:
+            closest.result = JUDGE_GOOD
+        else:
+            closest.result = JUDGE_OK
+        return closest.result
+
+    def collect_misses(self, clock_ms) -> List[ChartNote]:
+        """Marque et retourne les notes dont la fenetre de jugement est passee"""
+        late = self.song_time(clock_ms) - self.latency_ms - HIT_WINDOW_OK
+        missed = [note for note in self.notes if note.result is None and note.time < late]
+        for note in missed:
+            note.result = JUDGE_MISS
+        return missed
+
+    @property
+    def finished(self) -> bool:
+        """True quand toutes les notes sont jugees"""
+        return all(note.result is not None for note in self.notes)
@@ -12,6 +12,12 @@ class Scene(ABC):
     Chaque scene doit implementer: handle_event, update, draw
     """
 
+    # True pour une scene affichee par-dessus la precedente (pause):
+    # la scene du dessous n'est pas quittee (pas d'exit) et reprend ensuite
+    overlay = False
+    # True pour une scene sensible aux pauses du ramasse-miettes (voir allocations.GcPolicy)
+    defer_gc = False
+
     def __init__(self, game):
         """
         Initialise la scene avec une reference au jeu principal.
@@ -31,13 +37,45 @@ class Scene(ABC):
         """
         pass
 
+    def get_preload_assets(self, **kwargs):
+        """
+        Images a precharger en arriere-plan avant enter() (pendant la transition).
+        Peut etre surchargee; recoit les memes arguments que enter().
+
+        Returns:
+            Liste de tuples (chemin, taille[, alpha]) au format de assets.load_image
+        """
+        return []
+
     def exit(self):
         """
-        Appelee quand on quitte cette scene.
-        Peut etre surchargee pour nettoyer des ressources.
+        Appelee quand on quitte cette scene (pas quand une scene overlay
+        s'affiche par-dessus). Peut etre surchargee pour lacher les surfaces
+        et sons gardes par la scene; enter() doit pouvoir les recharger.
+        Les images prechargees par get_preload_assets() sont retirees du cache par Game.
         """
         pass
 
+    def on_levels_changed(self, level_ids):
+        """
+        Appelee en mode hot-reload quand des fichiers de niveaux ont change.
+        Peut etre surchargee pour reconstruire ce qui depend des niveaux.
+
+        Args:
+            level_ids: IDs des niveaux modifies sur disque
+        """
+        pass
+
+    def telemetry_context(self):
+        """
+        Etat de la scene joint a une saccade dans la telemetrie.
+        Peut etre surchargee (stage, nombre d'entites...).
+
+        Returns:
+            Dictionnaire serialisable en JSON
+        """
+        return {}
+
     @abstractmethod
     def handle_event(self, event):
         """
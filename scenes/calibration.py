@@ -0,0 +1,179 @@
+"""
+Rockstar Bros - Scene de calibration
+Mesure la latence audio puis video par tap test (ESPACE sur le battement)
+et la sauvegarde dans les preferences pour le jugement du rythme
+"""
+
+import pygame
+from scenes.base import Scene
+from assets import get_font
+from audio import make_beep
+from preferences import get_preferences
+from input_events import event_time
+from rhythm import now_ms
+from settings import (
+    WIDTH, HEIGHT, WHITE, YELLOW, GRAY, ORANGE, BG_COLOR,
+    STATE_MENU,
+    FONT_METAL_MANIA, FONT_ROAD_RAGE,
+    CALIBRATION_BEAT_INTERVAL, CALIBRATION_TAPS, CALIBRATION_MAX_OFFSET,
+)
+
+
+# Taps ignores au debut de chaque test (le temps de prendre le rythme)
+WARMUP_TAPS = 2
+# Delai avant le premier battement (ms)
+LEAD_IN = 1000
+# Duree du flash du test video (ms)
+FLASH_DURATION = 100
+
+
+def _median(values):
+    """Mediane d'une liste non vide"""
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2
+
+
+class CalibrationScene(Scene):
+    """Tap tests de latence: 'audio' (bip seul), 'visual' (flash seul), puis 'done'"""
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.font_title = None
+        self.font_text = None
+        self.font_small = None
+        self.beep = None
+
+        self.phase = "audio"
+        self.start_time = 0
+        self.beat_times = []
+        self.taps = []
+        self.results = {}
+
+    def enter(self, **kwargs):
+        """Demarre le test audio"""
+        try:
+            self.font_title = get_font(FONT_METAL_MANIA, 72)
+            self.font_text = get_font(FONT_ROAD_RAGE, 32)
+            self.font_small = get_font(FONT_ROAD_RAGE, 24)
+        except (pygame.error, FileNotFoundError):
+            self.font_title = get_font(None, 72)
+            self.font_text = get_font(None, 32)
+            self.font_small = get_font(None, 24)
+
+        pygame.mixer.music.stop()
+        try:
+            self.beep = make_beep()
+        except pygame.error:
+            self.beep = None
+
+        self.results = {}
+        # Sans mixer, seul le test video a un sens
+        self._start_phase("audio" if self.beep else "visual")
+
+    def _start_phase(self, phase):
+        """Remet les mesures a zero pour un test"""
+        self.phase = phase
+        self.start_time = now_ms() + LEAD_IN
+        self.beat_times = []
+        self.taps = []
+
+    def _next_beat_time(self):
+        """Instant prevu du prochain battement"""
+        return self.start_time + len(self.beat_times) * CALIBRATION_BEAT_INTERVAL
+
+    def handle_event(self, event):
+        """Saut (ESPACE, A) = tap, pause (ECHAP, Start) = quitter sans sauvegarder"""
+        actions = self.game.input_map.actions(event)
+        if "pause" in actions:
+            self.game.change_scene(STATE_MENU)
+        elif self.phase == "done":
+            if "confirm" in actions:
+                self.game.change_scene(STATE_MENU)
+        elif "jump" in actions:
+            self._register_tap(event_time(event))
+
+    def _register_tap(self, tap_time):
+        """Compare un tap au battement le plus proche"""
+        if not self.beat_times:
+            return
+        nearest = min(self.beat_times, key=lambda beat: abs(tap_time - beat))
+        offset = tap_time - nearest
+        if abs(offset) > CALIBRATION_MAX_OFFSET:
+            return
+        self.taps.append(offset)
+
+        if len(self.taps) >= WARMUP_TAPS + CALIBRATION_TAPS:
+            latency = int(round(_median(self.taps[WARMUP_TAPS:])))
+            self.results[self.phase] = latency
+            if self.phase == "audio":
+                self._start_phase("visual")
+            else:
+                self._finish()
+
+    def _finish(self):
+        """Sauvegarde les latences mesurees"""
+        self.phase = "done"
+        preferences = get_preferences()
+        if "audio" in self.results:
+            preferences.values["audio_latency_ms"] = self.results["audio"]
+        preferences.values["visual_latency_ms"] = self.results["visual"]
+        preferences.save()
+
+    def update(self, dt):
+        """Declenche les battements a l'heure prevue"""
+        if self.phase == "done":
+            return
+        now = now_ms()
+        while now >= self._next_beat_time():
+            # Heure reelle du battement (le bip part au debut de la frame)
+            self.beat_times.append(now)
+            if self.phase == "audio" and self.beep:
+                self.beep.play()
+
+    def draw(self, screen):
+        """Dessine le test en cours ou les resultats"""
+        screen.fill(BG_COLOR)
+
+        title = self.font_title.render("CALIBRATION", True, YELLOW)
+        screen.blit(title, title.get_rect(center=(WIDTH // 2, 100)))
+
+        if self.phase == "done":
+            self._draw_results(screen)
+            return
+
+        if self.phase == "audio":
+            text = "Test audio: appuie sur ESPACE a chaque bip"
+        else:
+            text = "Test video: appuie sur ESPACE a chaque flash"
+        label = self.font_text.render(text, True, WHITE)
+        screen.blit(label, label.get_rect(center=(WIDTH // 2, 200)))
+
+        # Cercle: allume pendant le flash du test video uniquement
+        center = (WIDTH // 2, HEIGHT // 2 + 20)
+        flashing = (self.phase == "visual" and self.beat_times
+                    and now_ms() - self.beat_times[-1] < FLASH_DURATION)
+        pygame.draw.circle(screen, ORANGE if flashing else (60, 60, 70), center, 80)
+        pygame.draw.circle(screen, WHITE, center, 80, 3)
+
+        count = max(0, len(self.taps) - WARMUP_TAPS)
+        progress = self.font_small.render(f"Taps: {count}/{CALIBRATION_TAPS}", True, GRAY)
+        screen.blit(progress, progress.get_rect(center=(WIDTH // 2, HEIGHT - 140)))
+
+        hint = self.font_small.render("ECHAP pour annuler", True, GRAY)
+        screen.blit(hint, hint.get_rect(center=(WIDTH // 2, HEIGHT - 50)))
+
+    def _draw_results(self, screen):
+        """Affiche les latences sauvegardees"""
+        lines = []
+        if "audio" in self.results:
+            lines.append(f"Latence audio: {self.results['audio']} ms")
+        lines.append(f"Latence video: {self.results['visual']} ms")
+        for i, line in enumerate(lines):
+            text = self.font_text.render(line, True, WHITE)
+            screen.blit(text, text.get_rect(center=(WIDTH // 2, 260 + i * 60)))
+
+        hint = self.font_small.render("Reglages sauvegardes - ENTREE pour revenir", True, GRAY)
+        screen.blit(hint, hint.get_rect(center=(WIDTH // 2, HEIGHT - 50)))
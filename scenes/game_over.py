@@ -5,9 +5,11 @@ Affiche le score et propose de rejouer ou retourner au menu
 
 import pygame
 from scenes.base import Scene
+from assets import load_image
+from audio import get_audio_bank, play_music
 from settings import (
     WIDTH, HEIGHT, WHITE, YELLOW, RED, GRAY,
-    STATE_GAMEPLAY, STATE_MENU, CONTROLS,
+    STATE_GAMEPLAY, STATE_MENU,
     IMG_DIR, IMG_GAMEOVER,
     FONT_METAL_MANIA, FONT_ROAD_RAGE,
     SND_DIR, SND_BOSS_LAUGH_1, SND_BOSS_LAUGH_2, SND_BOSS_LAUGH_3, SND_MENU_CLICK,
@@ -17,6 +19,9 @@ from settings import (
 class GameOverScene(Scene):
     """Scene de game over"""
 
+    # Fond d'ecran au format de assets.load_image
+    BACKGROUND = (IMG_DIR / IMG_GAMEOVER, (WIDTH, HEIGHT), False)
+
     def __init__(self, game):
         super().__init__(game)
         self.font_title = None
@@ -31,12 +36,11 @@ class GameOverScene(Scene):
         self.background = None
 
         # Son de navigation
-        self.click_sfx = None
-        try:
-            self.click_sfx = pygame.mixer.Sound(str(SND_DIR / SND_MENU_CLICK))
-            self.click_sfx.set_volume(0.5)
-        except (pygame.error, FileNotFoundError):
-            pass
+        self.click_sfx = get_audio_bank().get(SND_MENU_CLICK, 0.5)
+
+    def get_preload_assets(self, **kwargs):
+        """Fond d'ecran a precharger pendant la transition"""
+        return [self.BACKGROUND]
 
     def enter(self, **kwargs):
         """Initialisation a l'entree dans le game over"""
@@ -71,12 +75,7 @@ class GameOverScene(Scene):
 
                 music_path = str(SND_DIR / laugh_sound)
                 print(f"[GameOver] Playing boss laugh: {music_path}")
-                try:
-                    pygame.mixer.music.load(music_path)
-                except pygame.error:
-                    pygame.mixer.music.load(music_path, namehint=".mp3")
-                pygame.mixer.music.set_volume(0.6)
-                pygame.mixer.music.play()  # Jouer une seule fois (pas en boucle)
+                play_music(laugh_sound, 0.6, loops=0)
             except (pygame.error, FileNotFoundError) as e:
                 print(f"[GameOver] Error playing boss laugh: {e}")
         else:
@@ -84,25 +83,27 @@ class GameOverScene(Scene):
 
         # Charger l'image de game over
         try:
-            bg_path = IMG_DIR / IMG_GAMEOVER
-            self.background = pygame.image.load(str(bg_path)).convert()
-            self.background = pygame.transform.scale(self.background, (WIDTH, HEIGHT))
+            self.background = load_image(*self.BACKGROUND)
         except (pygame.error, FileNotFoundError):
             self.background = None
 
+    def exit(self):
+        """Lache le fond (recharge par enter)"""
+        self.background = None
+
     def handle_event(self, event):
         """Gere les evenements"""
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_UP:
-                self.selected_option = (self.selected_option - 1) % len(self.options)
-                if self.click_sfx:
-                    self.click_sfx.play()
-            elif event.key == pygame.K_DOWN:
-                self.selected_option = (self.selected_option + 1) % len(self.options)
-                if self.click_sfx:
-                    self.click_sfx.play()
-            elif event.key in CONTROLS["confirm"]:
-                self._select_option()
+        actions = self.game.input_map.actions(event)
+        if "up" in actions:
+            self.selected_option = (self.selected_option - 1) % len(self.options)
+            if self.click_sfx:
+                self.click_sfx.play()
+        elif "down" in actions:
+            self.selected_option = (self.selected_option + 1) % len(self.options)
+            if self.click_sfx:
+                self.click_sfx.play()
+        elif "confirm" in actions:
+            self._select_option()
 
     def _select_option(self):
         """Execute l'option selectionnee"""
@@ -4,24 +4,33 @@ Coeur du jeu: gestion du niveau, collisions, systeme rythme
 """
 
 import pygame
-import random
 import math
 from scenes.base import Scene
 from entities import Player, Projectile, Enemy, Boss, Platform, Pickup, MysteryBlock, StarItem
+from entities.projectile import RivalProjectile
 from level_loader import get_loader
+from audio import get_audio_bank, play_music, make_beep
+from preferences import get_preferences
+from input_events import event_time
+from resources import get_resource_registry
+from rhythm import (
+    NoteChart, RhythmTrack, now_ms, JUDGE_PERFECT, JUDGE_GOOD, JUDGE_OK,
+)
+from assets import load_image, get_font
+from animation import PulsingTitle, ZoomSprite
+from render import RenderQueue, WorldLayer, LAYER_PICKUPS, LAYER_PROJECTILES
 from settings import (
     WIDTH, HEIGHT, WHITE, YELLOW, RED, GREEN, BLUE, PURPLE, ORANGE, GRAY, DARK_GRAY,
-    STATE_PAUSE, STATE_GAME_OVER, STATE_VICTORY, STATE_LEVEL_SELECT, STATE_MENU, CONTROLS,
+    STATE_PAUSE, STATE_GAME_OVER, STATE_VICTORY, STATE_LEVEL_SELECT, STATE_MENU,
     GROUND_Y,
     PLAYER_MAX_HEALTH, PLAYER_WIDTH, PLAYER_HEIGHT,
     PROJECTILE_SPEED,
     ULTIMATE_CHARGE_MAX, ULTIMATE_CHARGE_PER_HIT,
     ULTIMATE_BASE_DAMAGE, ULTIMATE_DAMAGE_PER_PERFECT, ULTIMATE_DAMAGE_PER_GOOD,
     ULTIMATE_DAMAGE_PER_OK, ULTIMATE_CHARGE_PER_PICKUP, ULTIMATE_NOTE_COUNT,
-    NOTE_FALL_SPEED, NOTE_SPAWN_INTERVAL,
-    HIT_ZONE_PERFECT, HIT_ZONE_GOOD, HIT_ZONE_OK,
+    NOTE_FALL_SPEED, ULTIMATE_CHART_FILE, ULTIMATE_CHART_BPM, ULTIMATE_CUE_VOLUME,
     NOTE_SIZE, LANE_WIDTH, LANE_COUNT, TRACK_HEIGHT, TRACK_WIDTH,
-    TRACK_X, TRACK_Y, HIT_LINE_Y, LANE_COLORS, LANE_KEYS,
+    TRACK_X, TRACK_Y, HIT_LINE_Y, LANE_COLORS, LANE_ACTIONS,
     PICKUP_NOTE_SCORE, PICKUP_MEDIATOR_ULTIMATE,
     IMG_BG_DIR, IMG_ENEMIES_DIR,
     FONT_METAL_MANIA, FONT_ROAD_RAGE,
@@ -30,12 +39,34 @@ from settings import (
     SND_ENEMY_DEATH, SND_DEATH, SND_HURT, SND_MENU_CLICK,
     SND_CROUCH, SND_RUN,
     SND_BOSS_LAUGH_1, SND_BOSS_LAUGH_2, SND_BOSS_LAUGH_3, SND_SHOOT_BOSS, SND_BOSS_STEPS,
+    AUDIO_LOOP_CHANNEL_RUN, AUDIO_LOOP_CHANNEL_BOSS_STEPS,
 )
 
 
+# Temps de chute d'une note du haut de la piste a la ligne de frappe (ms)
+NOTE_TRAVEL_MS = (HIT_LINE_Y - TRACK_Y) / NOTE_FALL_SPEED
+
+# Texte et degats de chaque jugement de l'ultime
+JUDGE_LABELS = {JUDGE_PERFECT: "PERFECT!", JUDGE_GOOD: "GOOD!", JUDGE_OK: "OK"}
+JUDGE_DAMAGE = {
+    JUDGE_PERFECT: ULTIMATE_DAMAGE_PER_PERFECT,
+    JUDGE_GOOD: ULTIMATE_DAMAGE_PER_GOOD,
+    JUDGE_OK: ULTIMATE_DAMAGE_PER_OK,
+}
+
+# Images affichees a la mort de chaque boss
+BOSS_DEATH_IMAGES = {
+    "boss": IMG_ENEMIES_DIR / "boss_death.png",
+    "boss2": IMG_ENEMIES_DIR / "boss2_death.png",
+    "boss3": IMG_ENEMIES_DIR / "boss3_death.png",
+}
+
+
 class GameplayScene(Scene):
     """Scene principale du jeu"""
 
+    defer_gc = True
+
     def __init__(self, game):
         super().__init__(game)
 
@@ -52,12 +83,20 @@ class GameplayScene(Scene):
         self.mystery_blocks = pygame.sprite.Group()
         self.star_items = pygame.sprite.Group()
 
+        # Fond et geometrie pre-rendus (construits par _load_stage)
+        self.world_layer = None
+
+        # File de blits des sprites simples (pickups, projectiles)
+        self.render_queue = RenderQueue()
+
         # Entites principales
         self.player = None
         self.boss = None
 
         # Camera
         self.camera_x = 0
+        # Camera de la derniere frame dessinee (alignee, voir _view_x)
+        self.view_x = 0
 
         # Niveau et stage
         self.current_level_id = 1
@@ -71,12 +110,11 @@ class GameplayScene(Scene):
 
         # Systeme ULTIME (Guitar Hero - notes qui tombent)
         self.ultimate_active = False
-        self.ultimate_notes = []  # Liste des notes actives: {"lane": 0-2, "y": position}
-        self.ultimate_notes_spawned = 0
-        self.ultimate_spawn_timer = 0
+        self.ultimate_track = None  # RhythmTrack de la sequence en cours
+        self.ultimate_cue = None  # Bip des notes (genere a la premiere ultime)
         self.ultimate_results = []  # Liste des resultats ("PERFECT", "GOOD", "OK", "MISS")
         self.ultimate_total_damage = 0
-        self.ultimate_lane_pressed = [False, False, False]  # Etat des touches F, G, H
+        self.ultimate_lane_pressed = [False, False, False]  # Etat des pistes (actions lane_0..2)
 
         # Feedback timing
         self.timing_feedback = ""
@@ -91,6 +129,11 @@ class GameplayScene(Scene):
 
         # Debug
         self.debug_hitboxes = False
+        self._memory_summary = ""
+        self._memory_summary_time = -1000
+
+        # Titres pre-rendus des sequences de boss (voir _build_titles)
+        self.titles = {}
 
         # Celebration (apres avoir battu le boss)
         self.celebration_active = False
@@ -100,6 +143,7 @@ class GameplayScene(Scene):
         self.boss_death_active = False
         self.boss_death_timer = 0
         self.boss_death_image = None
+        self.boss_death_sprite = None  # ZoomSprite de boss_death_image
         self.boss_death_pos = (0, 0)
         self.boss_death_alpha = 255
         self.boss_death_zoom = 1.0
@@ -149,24 +193,19 @@ class GameplayScene(Scene):
             "hurt": SND_HURT,
             "menu_click": SND_MENU_CLICK,
             "crouch": SND_CROUCH,
-            "run": SND_RUN,
             "boss_laugh_1": SND_BOSS_LAUGH_1,
             "boss_laugh_2": SND_BOSS_LAUGH_2,
             "boss_laugh_3": SND_BOSS_LAUGH_3,
             "shoot_boss": SND_SHOOT_BOSS,
-            "boss_steps": SND_BOSS_STEPS,
         }
+        bank = get_audio_bank()
         for key, filename in sfx_files.items():
-            try:
-                path = SND_DIR / filename
-                self.sfx[key] = pygame.mixer.Sound(str(path))
-                self.sfx[key].set_volume(0.5)
-            except (pygame.error, FileNotFoundError):
-                self.sfx[key] = None
+            self.sfx[key] = bank.get(filename, 0.5)
 
-        # Volume plus fort pour le son de course
-        if self.sfx.get("run"):
-            self.sfx["run"].set_volume(0.8)
+        # Les boucles jouent sur des canaux reserves (jamais voles par les tirs)
+        self.sfx["run"] = bank.get(SND_RUN, 0.8, loop_channel=AUDIO_LOOP_CHANNEL_RUN)
+        self.sfx["boss_steps"] = bank.get(SND_BOSS_STEPS, 0.5,
+                                          loop_channel=AUDIO_LOOP_CHANNEL_BOSS_STEPS)
 
         # Volume maximum pour le son de chute/mort
         if self.sfx.get("death"):
@@ -226,15 +265,14 @@ class GameplayScene(Scene):
         """Initialisation a l'entree dans le niveau"""
         # Charger les polices - Road Rage pour le HUD, Metal Mania pour les gros textes
         try:
-            self.font = pygame.font.Font(str(FONT_ROAD_RAGE), 26)
-            self.font_big = pygame.font.Font(str(FONT_METAL_MANIA), 48)
+            self.font = get_font(FONT_ROAD_RAGE, 26)
+            self.font_big = get_font(FONT_METAL_MANIA, 48)
         except (pygame.error, FileNotFoundError):
-            self.font = pygame.font.Font(None, 26)
-            self.font_big = pygame.font.Font(None, 48)
+            self.font = get_font(None, 26)
+            self.font_big = get_font(None, 48)
 
         # Recuperer les donnees du jeu et du niveau/stage
-        self.current_level_id = kwargs.get('level_id', self.game.game_data.get("selected_level", 1))
-        self.current_stage_id = kwargs.get('stage_id', self.game.game_data.get("current_stage", 1))
+        self.current_level_id, self.current_stage_id = self._resolve_stage_ids(**kwargs)
         character_id = self.game.game_data["selected_character"]
 
         # Charger les donnees du niveau et du stage depuis JSON
@@ -265,9 +303,8 @@ class GameplayScene(Scene):
         spawn_x = 100
         spawn_y = GROUND_Y
         if self.stage_data:
-            spawn_data = self.stage_data.get('player_spawn', {})
-            spawn_x = spawn_data.get('x', 100)
-            spawn_y = spawn_data.get('y', GROUND_Y)
+            spawn_x = self.stage_data.spawn_x
+            spawn_y = self.stage_data.spawn_y
 
         # Creer le joueur
         self.player = Player(character_id, spawn_x, spawn_y)
@@ -282,6 +319,7 @@ class GameplayScene(Scene):
 
         # Reset camera
         self.camera_x = 0
+        self.view_x = 0
 
         # Reset rythme
         self.beat_timer = 0
@@ -301,56 +339,110 @@ class GameplayScene(Scene):
 
         # Charger les images de mort des boss
         self.boss_death_images = {}
-        try:
-            boss_death_path = IMG_ENEMIES_DIR / "boss_death.png"
-            self.boss_death_images["boss"] = pygame.image.load(str(boss_death_path)).convert_alpha()
-        except (pygame.error, FileNotFoundError):
-            self.boss_death_images["boss"] = None
-
-        try:
-            boss2_death_path = IMG_ENEMIES_DIR / "boss2_death.png"
-            self.boss_death_images["boss2"] = pygame.image.load(str(boss2_death_path)).convert_alpha()
-        except (pygame.error, FileNotFoundError):
-            self.boss_death_images["boss2"] = None
-
-        try:
-            boss3_death_path = IMG_ENEMIES_DIR / "boss3_death.png"
-            self.boss_death_images["boss3"] = pygame.image.load(str(boss3_death_path)).convert_alpha()
-        except (pygame.error, FileNotFoundError):
-            self.boss_death_images["boss3"] = None
+        for boss_type, path in BOSS_DEATH_IMAGES.items():
+            try:
+                self.boss_death_images[boss_type] = load_image(path)
+            except (pygame.error, FileNotFoundError):
+                self.boss_death_images[boss_type] = None
 
         self.boss_death_image = None
+        self.boss_death_sprite = None
 
         # Reset affichage des degats
         self.damage_numbers = []
 
         # Activer l'intro boss si c'est un stage de boss
-        is_boss_stage = self.stage_data and self.stage_data.get('is_boss_stage', False)
+        is_boss_stage = self.stage_data and self.stage_data.is_boss_stage
         if is_boss_stage and self.boss:
             self.boss_intro_active = True
             self.boss_intro_timer = 0
+            self._build_titles()
         else:
             self.boss_intro_active = False
 
         # Jouer la musique du niveau
         self._play_stage_music()
 
+    def exit(self):
+        """Sortie du niveau (pas vers la pause): coupe les boucles et lache le stage"""
+        self._stop_run_sfx()
+        self._stop_boss_sfx()
+        # Les sons du boss sont les plus lourds a garder decodes
+        get_audio_bank().release([SND_BOSS_LAUGH_1, SND_BOSS_LAUGH_2, SND_BOSS_LAUGH_3,
+                                  SND_SHOOT_BOSS, SND_BOSS_STEPS])
+
+        for group in (self.all_sprites, self.platforms, self.enemies, self.player_projectiles,
+                      self.boss_projectiles, self.enemy_projectiles, self.pickups,
+                      self.mystery_blocks, self.star_items):
+            group.empty()
+        self.player = None
+        self.boss = None
+        self.world_layer = None
+        self.background = None
+        self.titles = {}
+        self.boss_death_images = {}
+        self.boss_death_image = None
+        self.boss_death_sprite = None
+
+    def telemetry_context(self):
+        """Stage et nombre d'entites au moment d'une saccade"""
+        return {
+            "level": self.current_level_id,
+            "stage": self.current_stage_id,
+            "enemies": len(self.enemies),
+            "projectiles": (len(self.player_projectiles) + len(self.boss_projectiles)
+                            + len(self.enemy_projectiles)),
+            "pickups": len(self.pickups),
+            "boss": self.boss.boss_type if self.boss else None,
+            "ultimate": self.ultimate_active,
+        }
+
+    def _resolve_stage_ids(self, **kwargs):
+        """(level_id, stage_id) demandes par les kwargs ou game_data"""
+        level_id = kwargs.get('level_id', self.game.game_data.get("selected_level", 1))
+        stage_id = kwargs.get('stage_id', self.game.game_data.get("current_stage", 1))
+        return level_id, stage_id
+
+    def get_preload_assets(self, **kwargs):
+        """Images du stage a venir: decor, joueur, ennemis, plateformes, pickups"""
+        level_id, stage_id = self._resolve_stage_ids(**kwargs)
+        stage = self.loader.get_stage(level_id, stage_id)
+        if not stage:
+            return []
+
+        specs = list(Player.image_specs(self.game.game_data["selected_character"]).values())
+        specs.append(Projectile.image_spec())
+        specs.extend((path, None) for path in BOSS_DEATH_IMAGES.values())
+        if stage.background:
+            specs.append((IMG_BG_DIR / stage.background, (WIDTH, HEIGHT), False))
+        for segment in stage.ground_segments:
+            specs.append(Platform.image_spec(segment.width, HEIGHT - segment.y + 100, is_ground=True))
+        for plat in stage.platforms:
+            specs.append(Platform.image_spec(plat.width, plat.height))
+        for enemy_type in {enemy.enemy_type for enemy in stage.enemies}:
+            specs.extend(Enemy.image_specs(enemy_type).values())
+            if enemy_type == "rival_shooter":
+                specs.append(RivalProjectile.image_spec())
+        for pickup_type in {pickup.pickup_type for pickup in stage.pickups}:
+            specs.append(Pickup.image_spec(pickup_type))
+        if stage.mystery_blocks:
+            specs.append(MysteryBlock.image_spec())
+            specs.append(StarItem.image_spec())
+        if stage.boss:
+            specs.extend(Boss.image_specs(stage.boss.boss_type).values())
+        return specs
+
     def _play_stage_music(self):
         """Charge et joue la musique du stage actuel"""
         if not self.stage_data:
             return
 
         try:
-            music_file = self.stage_data.get('music')
+            music_file = self.stage_data.music
             if music_file:
                 music_path = str(SND_DIR / music_file)
                 self.current_music_path = music_path  # Sauvegarder pour star mode
-                try:
-                    pygame.mixer.music.load(music_path)
-                except pygame.error:
-                    pygame.mixer.music.load(music_path, namehint=".mp3")
-                pygame.mixer.music.set_volume(0.5)
-                pygame.mixer.music.play(-1)  # -1 = boucle infinie
+                play_music(music_file, 0.5)
         except (pygame.error, FileNotFoundError) as e:
             print(f"Impossible de charger la musique du stage: {e}")
 
@@ -360,60 +452,50 @@ class GameplayScene(Scene):
             print("Error: No stage data")
             return
 
-        # Obtenir la largeur du stage
-        self.level_width = self.stage_data.get('width', 3000)
+        # Les donnees sont validees par le LevelLoader (modeles de level_models)
+        self.level_width = self.stage_data.width
 
         # Charger le background
         self._load_background()
 
         # Charger les segments de sol
-        for segment in self.stage_data.get('ground_segments', []):
-            x = segment.get('x', 0)
-            y = segment.get('y', GROUND_Y)
-            width = segment.get('width', 1000)
-            height = HEIGHT - y + 100
-            ground = Platform(x, y, width, height, is_ground=True)
+        for segment in self.stage_data.ground_segments:
+            height = HEIGHT - segment.y + 100
+            ground = Platform(segment.x, segment.y, segment.width, height, is_ground=True)
             self.platforms.add(ground)
 
         # Charger les plateformes
-        for plat_data in self.stage_data.get('platforms', []):
-            x = plat_data.get('x', 0)
-            y = plat_data.get('y', 400)
-            width = plat_data.get('width', 150)
-            height = plat_data.get('height', 30)
-            plat = Platform(x, y, width, height)
+        for plat_data in self.stage_data.platforms:
+            plat = Platform(plat_data.x, plat_data.y, plat_data.width, plat_data.height)
             self.platforms.add(plat)
 
-        # Charger les ennemis
-        for enemy_data in self.stage_data.get('enemies', []):
-            x = enemy_data.get('x', 0)
-            etype = enemy_data.get('type', 'hater')
-            y = GROUND_Y  # Les ennemis spawns sur le sol par defaut
-            enemy = Enemy(x, y, etype)
+        # Pre-rendre le fond, le sol et les plateformes (fixes)
+        self.world_layer = WorldLayer(
+            self.background or self._render_placeholder_bg(),
+            [p for p in self.platforms if isinstance(p, Platform)],
+            self.level_width, self.game.render_scale,
+        )
+
+        # Charger les ennemis (ils spawnent sur le sol)
+        for enemy_data in self.stage_data.enemies:
+            enemy = Enemy(enemy_data.x, GROUND_Y, enemy_data.enemy_type)
             self.enemies.add(enemy)
 
         # Charger les pickups
-        for pickup_data in self.stage_data.get('pickups', []):
-            x = pickup_data.get('x', 0)
-            y = pickup_data.get('y', 400)
-            ptype = pickup_data.get('type', 'note')
-            pickup = Pickup(x, y, ptype)
+        for pickup_data in self.stage_data.pickups:
+            pickup = Pickup(pickup_data.x, pickup_data.y, pickup_data.pickup_type)
             self.pickups.add(pickup)
 
         # Charger le boss si c'est un stage de boss
-        boss_data = self.stage_data.get('boss')
+        boss_data = self.stage_data.boss
         if boss_data:
-            boss_x = boss_data.get('x', WIDTH - 200)
-            boss_type = boss_data.get('type', 'boss')
-            self.boss = Boss(boss_x, GROUND_Y, boss_type)
+            self.boss = Boss(boss_data.x, GROUND_Y, boss_data.boss_type)
             self.enemies.add(self.boss)
 
         # Charger les mystery blocks (Easter Egg)
         # Les blocs sont ajoutés aux platforms pour la collision solide
-        for block_data in self.stage_data.get('mystery_blocks', []):
-            x = block_data.get('x', 0)
-            y = block_data.get('y', 400)
-            block = MysteryBlock(x, y)
+        for block_data in self.stage_data.mystery_blocks:
+            block = MysteryBlock(block_data.x, block_data.y)
             self.mystery_blocks.add(block)
             self.platforms.add(block)  # Add to platforms for solid collision
 
@@ -423,32 +505,66 @@ class GameplayScene(Scene):
             return
 
         try:
-            bg_file = self.stage_data.get('background')
+            bg_file = self.stage_data.background
             if bg_file:
-                path = IMG_BG_DIR / bg_file
-                self.background = pygame.image.load(str(path)).convert()
-                self.background = pygame.transform.scale(self.background, (WIDTH, HEIGHT))
+                self.background = load_image(IMG_BG_DIR / bg_file, (WIDTH, HEIGHT), alpha=False)
         except (pygame.error, FileNotFoundError) as e:
             print(f"Could not load background: {e}")
             self.background = None
 
 
+    def on_levels_changed(self, level_ids):
+        """Mode hot-reload: reconstruit le stage courant en gardant joueur et camera"""
+        if self.current_level_id not in level_ids or not self.player:
+            return
+
+        level_data = self.loader.load_level(self.current_level_id)
+        stage_data = level_data.get_stage(self.current_stage_id) if level_data else None
+        if not stage_data:
+            # Fichier invalide (erreurs deja affichees): on garde le stage actuel
+            print(f"[HotReload] Keeping current stage, level {self.current_level_id} failed to load")
+            return
+
+        old_music = self.stage_data.music if self.stage_data else None
+        self.level_data = level_data
+        self.stage_data = stage_data
+
+        # Vider tout ce qui vient du JSON, le joueur et la camera ne bougent pas
+        self.platforms.empty()
+        self.enemies.empty()
+        self.boss_projectiles.empty()
+        self.enemy_projectiles.empty()
+        self.pickups.empty()
+        self.mystery_blocks.empty()
+        self.star_items.empty()
+        self.boss = None
+
+        self._load_stage()
+        self.camera_x = max(0, min(self.camera_x, self.level_width - WIDTH))
+
+        if stage_data.music != old_music:
+            self._play_stage_music()
+        print(f"[HotReload] Rebuilt level {self.current_level_id} stage {self.current_stage_id}")
+
     def handle_event(self, event):
         """Gere les evenements"""
         # Bloquer les inputs pendant l'intro boss
         if self.boss_intro_active:
             return
 
-        if event.type == pygame.KEYDOWN:
+        # Actions de l'appui (touche ou bouton de manette), une seule recherche
+        actions = self.game.input_map.actions(event)
+
+        if actions:
             # Menu de victoire apres mort du boss
             if self.victory_menu_active:
-                if event.key == pygame.K_UP:
+                if "up" in actions:
                     self.victory_menu_selected = (self.victory_menu_selected - 1) % len(self.victory_menu_options)
                     self._play_sfx("menu_click")
-                elif event.key == pygame.K_DOWN:
+                elif "down" in actions:
                     self.victory_menu_selected = (self.victory_menu_selected + 1) % len(self.victory_menu_options)
                     self._play_sfx("menu_click")
-                elif event.key in CONTROLS["confirm"]:
+                elif "confirm" in actions:
                     if self.victory_menu_selected == 0:  # Continuer -> map des niveaux
                         self._complete_stage()
                     else:  # Retour -> lobby (menu principal)
@@ -456,40 +572,44 @@ class GameplayScene(Scene):
                 return
 
             # Pause (pas pendant l'ultime ou la mort du boss)
-            if event.key in CONTROLS["pause"] and not self.ultimate_active and not self.boss_death_active:
+            if "pause" in actions and not self.ultimate_active and not self.boss_death_active:
                 self._stop_run_sfx()
                 self.game.change_scene(STATE_PAUSE)
                 return
 
             # Debug
-            if event.key in CONTROLS["debug_hitbox"]:
+            if "debug_hitbox" in actions:
                 self.debug_hitboxes = not self.debug_hitboxes
-            if event.key in CONTROLS["debug_skip"]:
+            if "debug_skip" in actions:
                 self._complete_stage()
-            if event.key in CONTROLS["debug_invincible"]:
+            if "debug_invincible" in actions:
                 self.player.debug_invincible = not self.player.debug_invincible
 
-            # Pendant la sequence ultime: F, G, H pour les 3 pistes
+            # Pendant la sequence ultime: une action par piste (F, G, H par defaut)
             if self.ultimate_active:
-                for i, key in enumerate(LANE_KEYS):
-                    if event.key == key:
-                        self._ultimate_hit_lane(i)
+                for i, lane_action in enumerate(LANE_ACTIONS):
+                    if lane_action in actions:
+                        self._ultimate_hit_lane(i, event_time(event))
                 return
 
+            # Saut: l'instant exact de l'appui alimente le buffer de saut
+            if "jump" in actions and self.player:
+                self.player.buffer_jump(event_time(event))
+
             # Attaque normale
-            if event.key in CONTROLS["attack"]:
+            if "attack" in actions:
                 self._player_attack()
 
             # Lancer l'ultime
-            if event.key in CONTROLS["ultimate"]:
+            if "ultimate" in actions:
                 self._player_ultimate()
 
-        elif event.type == pygame.KEYUP:
-            # Relacher les touches pendant l'ultime
-            if self.ultimate_active:
-                for i, key in enumerate(LANE_KEYS):
-                    if event.key == key:
-                        self.ultimate_lane_pressed[i] = False
+        elif self.ultimate_active:
+            # Relacher les pistes pendant l'ultime
+            released = self.game.input_map.released_actions(event)
+            for i, lane_action in enumerate(LANE_ACTIONS):
+                if lane_action in released:
+                    self.ultimate_lane_pressed[i] = False
 
     def _player_attack(self):
         """Le joueur attaque - attaque simple sans timing"""
@@ -524,16 +644,29 @@ class GameplayScene(Scene):
 
         # Demarrer la sequence Guitar Hero
         self.ultimate_active = True
-        self.ultimate_notes = []
-        self.ultimate_notes_spawned = 0
-        self.ultimate_spawn_timer = 0
+        preferences = get_preferences()
+        self.ultimate_track = RhythmTrack(self._load_ultimate_chart(),
+                                          preferences.get("visual_latency_ms"),
+                                          preferences.get("audio_latency_ms"))
+        if self.ultimate_cue is None:
+            try:
+                self.ultimate_cue = make_beep(volume=ULTIMATE_CUE_VOLUME)
+            except pygame.error:
+                self.ultimate_cue = None
+        self.ultimate_track.start(now_ms(), lead_ms=NOTE_TRAVEL_MS)
         self.ultimate_results = []
         self.ultimate_total_damage = ULTIMATE_BASE_DAMAGE
         self.ultimate_lane_pressed = [False, False, False]
         self.player.state = "ultimate"
 
-    def _ultimate_hit_lane(self, lane):
-        """Le joueur appuie sur une touche (F=0, G=1, H=2)"""
+    def _ultimate_hit_lane(self, lane, press_ms=None):
+        """
+        Le joueur appuie sur une touche (F=0, G=1, H=2).
+
+        Args:
+            lane: Piste appuyee
+            press_ms: Instant de l'appui (horloge now_ms), None = maintenant
+        """
         if not self.ultimate_active:
             return
         if self.ultimate_lane_pressed[lane]:
@@ -541,39 +674,25 @@ class GameplayScene(Scene):
 
         self.ultimate_lane_pressed[lane] = True
 
-        # Chercher la note la plus proche sur cette piste
-        closest_note = None
-        closest_dist = float('inf')
-
-        for note in self.ultimate_notes:
-            if note["lane"] == lane:
-                dist = abs(note["y"] - HIT_LINE_Y)
-                if dist < closest_dist:
-                    closest_dist = dist
-                    closest_note = note
-
-        # Verifier le timing
-        if closest_note and closest_dist <= HIT_ZONE_OK:
-            # Determiner le resultat
-            if closest_dist <= HIT_ZONE_PERFECT:
-                result = "PERFECT!"
-                self.ultimate_total_damage += ULTIMATE_DAMAGE_PER_PERFECT
-            elif closest_dist <= HIT_ZONE_GOOD:
-                result = "GOOD!"
-                self.ultimate_total_damage += ULTIMATE_DAMAGE_PER_GOOD
-            else:
-                result = "OK"
-                self.ultimate_total_damage += ULTIMATE_DAMAGE_PER_OK
+        # Jugement par l'ecart de temps entre l'appui et la note
+        judgement = self.ultimate_track.judge(lane, press_ms if press_ms is not None else now_ms())
+        if judgement is None:
+            return  # Appui sans note = pas de penalite, juste ignorer
 
-            self.ultimate_results.append(result)
-            self.timing_feedback = result
-            self.timing_feedback_timer = 800  # Plus long pour etre lisible
+        result = JUDGE_LABELS[judgement]
+        self.ultimate_total_damage += JUDGE_DAMAGE[judgement]
+        self.ultimate_results.append(result)
+        self.timing_feedback = result
+        self.timing_feedback_timer = 800  # Plus long pour etre lisible
 
-            # Supprimer la note
-            self.ultimate_notes.remove(closest_note)
-        else:
-            # Appui sans note = pas de penalite, juste ignorer
-            pass
+    def _load_ultimate_chart(self):
+        """Partition de l'ultime: beat map si le fichier existe, sinon notes aleatoires"""
+        if ULTIMATE_CHART_FILE.exists():
+            try:
+                return NoteChart.load(ULTIMATE_CHART_FILE, LANE_COUNT)
+            except (OSError, ValueError) as e:
+                print(f"Beat map ignoree: {e}")
+        return NoteChart.from_bpm(ULTIMATE_CHART_BPM, ULTIMATE_NOTE_COUNT, LANE_COUNT)
 
     def _finish_ultimate(self):
         """Termine la sequence ultime et lance l'attaque"""
@@ -645,8 +764,9 @@ class GameplayScene(Scene):
         self.player.head_bumped_platform = None
 
         # Input joueur normal
-        keys = pygame.key.get_pressed()
-        self.player.handle_input(keys)
+        # Etat des actions calcule une fois pour la frame
+        self.game.input_map.update()
+        self.player.handle_input(self.game.input_map, now_ms())
 
         # Son de saut
         if self.player.just_jumped:
@@ -777,37 +897,20 @@ class GameplayScene(Scene):
             self.game.change_scene(STATE_GAME_OVER)
 
     def _update_ultimate_sequence(self, dt_ms):
-        """Met a jour la sequence Guitar Hero avec notes qui tombent"""
-        # Spawn de nouvelles notes
-        self.ultimate_spawn_timer += dt_ms
-        if self.ultimate_spawn_timer >= NOTE_SPAWN_INTERVAL:
-            if self.ultimate_notes_spawned < ULTIMATE_NOTE_COUNT:
-                self.ultimate_spawn_timer = 0
-                # Creer une note sur une piste aleatoire
-                lane = random.randint(0, LANE_COUNT - 1)
-                self.ultimate_notes.append({
-                    "lane": lane,
-                    "y": TRACK_Y  # Commence en haut
-                })
-                self.ultimate_notes_spawned += 1
-
-        # Faire tomber les notes
-        notes_to_remove = []
-        for note in self.ultimate_notes:
-            note["y"] += NOTE_FALL_SPEED
-
-            # Note ratee (passee sous la ligne de frappe)
-            if note["y"] > HIT_LINE_Y + HIT_ZONE_OK + NOTE_SIZE:
-                notes_to_remove.append(note)
-                self.ultimate_results.append("MISS")
-                self.timing_feedback = "MISS"
-                self.timing_feedback_timer = 800  # Plus long pour etre lisible
-
-        for note in notes_to_remove:
-            self.ultimate_notes.remove(note)
+        """Met a jour la sequence Guitar Hero (notes placees sur l'horloge de la partition)"""
+        # Bip de chaque note, lance en avance de la latence audio
+        for _ in self.ultimate_track.due_cues(now_ms()):
+            if self.ultimate_cue:
+                self.ultimate_cue.play()
+
+        # Notes passees sans appui
+        for _ in self.ultimate_track.collect_misses(now_ms()):
+            self.ultimate_results.append("MISS")
+            self.timing_feedback = "MISS"
+            self.timing_feedback_timer = 800  # Plus long pour etre lisible
 
         # Verifier si la sequence est terminee
-        if self.ultimate_notes_spawned >= ULTIMATE_NOTE_COUNT and len(self.ultimate_notes) == 0:
+        if self.ultimate_track.finished:
             self._finish_ultimate()
 
     def _check_fall_death(self):
@@ -1073,7 +1176,7 @@ class GameplayScene(Scene):
             return  # Deja en celebration
 
         # Verifier si c'est un stage de boss
-        is_boss_stage = self.stage_data and self.stage_data.get('is_boss_stage', False)
+        is_boss_stage = self.stage_data and self.stage_data.is_boss_stage
 
         if is_boss_stage:
             # Stage boss - victoire si boss mort
@@ -1099,6 +1202,8 @@ class GameplayScene(Scene):
         # Sélectionner l'image de mort appropriée selon le type de boss stocké
         boss_type = self.boss_type_dead if self.boss_type_dead else 'boss'
         self.boss_death_image = self.boss_death_images.get(boss_type, self.boss_death_images.get("boss"))
+        self.boss_death_sprite = ZoomSprite(self.boss_death_image) if self.boss_death_image else None
+        self._build_titles()
 
         # Camera cible pour centrer sur le boss (position déjà stockée)
         self.target_camera_x = self.boss_death_pos[0] - WIDTH // 2
@@ -1106,13 +1211,7 @@ class GameplayScene(Scene):
 
         # Jouer la musique de victoire (en boucle)
         try:
-            music_path = str(SND_DIR / SND_VICTORY)
-            try:
-                pygame.mixer.music.load(music_path)
-            except pygame.error:
-                pygame.mixer.music.load(music_path, namehint=".mp3")
-            pygame.mixer.music.set_volume(0.7)
-            pygame.mixer.music.play(-1)
+            play_music(SND_VICTORY, 0.7)
         except (pygame.error, FileNotFoundError) as e:
             print(f"Impossible de charger la musique de victoire: {e}")
 
@@ -1155,13 +1254,15 @@ class GameplayScene(Scene):
         self.game.game_data["ultimate_charge"] = self.player.ultimate_charge
 
         # Obtenir le nombre total de stages dans ce niveau
-        total_stages = len(self.level_data.get('stages', [])) if self.level_data else 3
+        total_stages = self.level_data.stage_count if self.level_data else 3
 
         if self.current_stage_id < total_stages:
             # Passer au stage suivant du meme niveau
             self.current_stage_id += 1
             self.game.game_data["current_stage"] = self.current_stage_id
             self.enter(level_id=self.current_level_id, stage_id=self.current_stage_id)
+            # Le stage precedent n'est plus reference: le degeler et geler le nouveau
+            self.game.apply_gc_policy(self)
         else:
             # Niveau complete! Marquer comme complete et calculer les etoiles
             if self.current_level_id not in self.game.game_data["completed_levels"]:
@@ -1178,65 +1279,45 @@ class GameplayScene(Scene):
             # Aller directement a la map des niveaux
             self.game.change_scene(STATE_LEVEL_SELECT)
 
+    def _view_x(self):
+        """Camera de la frame dessinee: entiere, sur les pixels du decor basse resolution"""
+        camera_x = int(self.camera_x)
+        return camera_x - camera_x % self.game.render_scale
+
     def draw(self, screen):
         """Dessine le gameplay"""
-        # Background
-        if self.background:
-            # Parallax simple
-            bg_offset = int(self.camera_x * 0.3) % WIDTH
-            screen.blit(self.background, (-bg_offset, 0))
-            screen.blit(self.background, (WIDTH - bg_offset, 0))
-        else:
-            self._draw_placeholder_bg(screen)
-
-        # Voile sombre pour attenuer les couleurs du fond
-        if not hasattr(self, '_bg_overlay'):
-            self._bg_overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            self._bg_overlay.fill((0, 0, 0, 90))
-        screen.blit(self._bg_overlay, (0, 0))
+        camera_x = self.view_x = self._view_x()
 
-        # Plateformes
-        for platform in self.platforms:
-            draw_rect = platform.rect.move(-self.camera_x, 0)
-            if draw_rect.right > 0 and draw_rect.left < WIDTH:
-                screen.blit(platform.image, draw_rect)
+        # Fond, voile et geometrie (les mystery blocks sont dessines a part)
+        if self.world_layer:
+            self.world_layer.draw(screen, camera_x)
 
         # Pickups
-        for pickup in self.pickups:
-            draw_rect = pickup.rect.move(-self.camera_x, 0)
-            if draw_rect.right > 0 and draw_rect.left < WIDTH:
-                screen.blit(pickup.image, draw_rect)
+        queue = self.render_queue
+        queue.begin(camera_x)
+        queue.add_group(self.pickups, LAYER_PICKUPS)
+        queue.flush(screen)
 
         # Mystery Blocks (Easter Egg)
         for block in self.mystery_blocks:
-            block.draw(screen, self.camera_x)
+            block.draw(screen, camera_x)
 
         # Star Items (Easter Egg)
         for star in self.star_items:
-            star.draw(screen, self.camera_x)
+            star.draw(screen, camera_x)
 
         # Ennemis
         for enemy in self.enemies:
-            if isinstance(enemy, Boss):
-                enemy.draw(screen, self.camera_x)
-            else:
-                enemy.draw(screen, self.camera_x)
+            enemy.draw(screen, camera_x)
 
         # Projectiles
-        for proj in self.player_projectiles:
-            draw_rect = proj.rect.move(-self.camera_x, 0)
-            screen.blit(proj.image, draw_rect)
-
-        for proj in self.boss_projectiles:
-            draw_rect = proj.rect.move(-self.camera_x, 0)
-            screen.blit(proj.image, draw_rect)
-
-        for proj in self.enemy_projectiles:
-            draw_rect = proj.rect.move(-self.camera_x, 0)
-            screen.blit(proj.image, draw_rect)
+        queue.add_group(self.player_projectiles, LAYER_PROJECTILES)
+        queue.add_group(self.boss_projectiles, LAYER_PROJECTILES)
+        queue.add_group(self.enemy_projectiles, LAYER_PROJECTILES)
+        queue.flush(screen)
 
         # Joueur
-        player_draw_rect = self.player.rect.move(-self.camera_x, 0)
+        player_draw_rect = self.player.rect.move(-camera_x, 0)
         # Star mode effect (Easter Egg) - rainbow cycling colors
         if self.player.star_mode:
             # Draw glowing outline effect
@@ -1261,24 +1342,27 @@ class GameplayScene(Scene):
         # HUD
         self._draw_hud(screen)
 
+        # Overlays plein ecran: calque de Game (basse resolution avec --render-scale)
+        overlay = self.game.overlay
+
         # Barre Guitar Hero (UNIQUEMENT pendant l'ultime)
         if self.ultimate_active:
-            self._draw_ultimate_overlay(screen)
-            self._draw_rhythm_bar(screen)
+            self._draw_ultimate_overlay(overlay.canvas())
+            self._draw_rhythm_bar(overlay.canvas())
 
         # Feedback timing
         if self.timing_feedback_timer > 0:
-            self._draw_timing_feedback(screen)
+            self._draw_timing_feedback(overlay.canvas())
 
         # Celebration (apres avoir battu le boss)
         if self.celebration_active:
-            self._draw_celebration(screen)
+            self._draw_celebration(overlay.canvas())
 
         # Intro boss (avant le combat)
         if self.boss_intro_active:
-            self._draw_boss_intro(screen)
+            self._draw_boss_intro(overlay.canvas())
 
-    def _draw_boss_intro(self, screen):
+    def _draw_boss_intro(self, canvas):
         """Dessine la transition d'intro avant un combat de boss"""
         progress = self.boss_intro_timer / self.boss_intro_duration  # 0 -> 1
 
@@ -1296,9 +1380,7 @@ class GameplayScene(Scene):
         else:
             alpha = 200
 
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, alpha))
-        screen.blit(overlay, (0, 0))
+        canvas.fill_alpha((0, 0, 0), alpha)
 
         # Texte "PREPAREZ-VOUS" - apparait en phase 1 et reste en phase 2
         if progress >= 0.1:
@@ -1306,19 +1388,8 @@ class GameplayScene(Scene):
             if progress > 0.7:
                 text_alpha = int(255 * (1 - (progress - 0.7) / 0.3))
 
-            try:
-                font_title = pygame.font.Font(str(FONT_METAL_MANIA), 64)
-            except (pygame.error, FileNotFoundError):
-                font_title = pygame.font.Font(None, 64)
-
             # "PREPAREZ-VOUS" avec ombre
-            title_surf = font_title.render("PREPAREZ-VOUS", True, WHITE)
-            title_surf.set_alpha(text_alpha)
-            shadow_surf = font_title.render("PREPAREZ-VOUS", True, (50, 50, 50))
-            shadow_surf.set_alpha(text_alpha)
-            title_rect = title_surf.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 60))
-            screen.blit(shadow_surf, title_rect.move(3, 3))
-            screen.blit(title_surf, title_rect)
+            self.titles["prepare"].draw(canvas, (WIDTH // 2, HEIGHT // 2 - 60), alpha=text_alpha)
 
         # "AU COMBAT !" - apparait en phase 2 avec pulsation
         if progress >= 0.3:
@@ -1331,19 +1402,7 @@ class GameplayScene(Scene):
 
             # Pulsation du texte
             pulse = 1.0 + math.sin(self.boss_intro_timer / 120) * 0.1
-            font_size = int(80 * pulse)
-            try:
-                font_combat = pygame.font.Font(str(FONT_METAL_MANIA), font_size)
-            except (pygame.error, FileNotFoundError):
-                font_combat = pygame.font.Font(None, font_size)
-
-            combat_surf = font_combat.render("AU COMBAT !", True, YELLOW)
-            combat_surf.set_alpha(sub_alpha)
-            shadow2 = font_combat.render("AU COMBAT !", True, (80, 50, 0))
-            shadow2.set_alpha(sub_alpha)
-            combat_rect = combat_surf.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 30))
-            screen.blit(shadow2, combat_rect.move(3, 3))
-            screen.blit(combat_surf, combat_rect)
+            self.titles["combat"].draw(canvas, (WIDTH // 2, HEIGHT // 2 + 30), pulse, sub_alpha)
 
         # Barres decoratives en haut et en bas (style cinematique)
         bar_height = 60
@@ -1354,20 +1413,16 @@ class GameplayScene(Scene):
         else:
             bar_alpha = 255
 
-        bar_surf = pygame.Surface((WIDTH, bar_height), pygame.SRCALPHA)
-        bar_surf.fill((0, 0, 0, bar_alpha))
-        screen.blit(bar_surf, (0, 0))
-        screen.blit(bar_surf, (0, HEIGHT - bar_height))
+        canvas.fill_alpha((0, 0, 0), bar_alpha, (0, 0, WIDTH, bar_height))
+        canvas.fill_alpha((0, 0, 0), bar_alpha, (0, HEIGHT - bar_height, WIDTH, bar_height))
 
-    def _draw_celebration(self, screen):
+    def _draw_celebration(self, canvas):
         """Dessine l'animation de mort du boss et le menu de victoire"""
         # Fond semi-transparent sombre
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 100))
-        screen.blit(overlay, (0, 0))
+        canvas.fill_alpha((0, 0, 0), 100)
 
         # Dessiner l'image de mort du boss avec zoom et fade
-        if self.boss_death_active and self.boss_death_image and self.boss_death_alpha > 0:
+        if self.boss_death_active and self.boss_death_sprite and self.boss_death_alpha > 0:
             # Centrer l'image au milieu de l'ecran (pas sur la position du boss)
             draw_x = WIDTH // 2
             draw_y = HEIGHT // 2
@@ -1379,59 +1434,43 @@ class GameplayScene(Scene):
             elif self.boss_type_dead == "boss3":
                 zoom_factor = self.boss_death_zoom * 0.6  # Reduire de 40%
 
-            # Appliquer le zoom
-            original_size = self.boss_death_image.get_size()
-            new_width = int(original_size[0] * zoom_factor)
-            new_height = int(original_size[1] * zoom_factor)
-            scaled_img = pygame.transform.scale(self.boss_death_image, (new_width, new_height))
-
-            # Appliquer l'alpha (transparence)
-            scaled_img.set_alpha(self.boss_death_alpha)
-
-            # Centrer l'image au milieu de l'ecran
-            img_rect = scaled_img.get_rect(center=(draw_x, draw_y))
-            screen.blit(scaled_img, img_rect)
+            # Zoom (frames quantifiees) + alpha, centre au milieu de l'ecran
+            self.boss_death_sprite.draw(canvas, (draw_x, draw_y), zoom_factor, self.boss_death_alpha)
 
         # Texte "BOSS VAINCU!" avec effet de pulsation
         pulse = 1.0 + math.sin(self.celebration_timer / 200) * 0.15
-        font_size = int(72 * pulse)
-        try:
-            font = pygame.font.Font(str(FONT_METAL_MANIA), font_size)
-        except (pygame.error, FileNotFoundError):
-            font = pygame.font.Font(None, font_size)
-
-        # Ombre du texte
-        shadow_text = font.render("BOSS VAINCU!", True, (50, 50, 50))
-        shadow_rect = shadow_text.get_rect(center=(WIDTH // 2 + 4, HEIGHT // 4 + 4))
-        screen.blit(shadow_text, shadow_rect)
-
-        # Texte principal
-        text = font.render("BOSS VAINCU!", True, YELLOW)
-        text_rect = text.get_rect(center=(WIDTH // 2, HEIGHT // 4))
-        screen.blit(text, text_rect)
+        self.titles["victory"].draw(canvas, (WIDTH // 2, HEIGHT // 4), pulse)
 
         # Message "Vous avez gagne!"
-        try:
-            sub_font = pygame.font.Font(str(FONT_ROAD_RAGE), 36)
-        except (pygame.error, FileNotFoundError):
-            sub_font = pygame.font.Font(None, 36)
-
-        win_text = sub_font.render("Vous avez gagne!", True, WHITE)
-        win_rect = win_text.get_rect(center=(WIDTH // 2, HEIGHT // 4 + 70))
-        screen.blit(win_text, win_rect)
+        self.titles["win"].draw(canvas, (WIDTH // 2, HEIGHT // 4 + 70))
 
         # Menu de victoire (apres le fade du boss)
         if self.victory_menu_active:
-            self._draw_victory_menu(screen)
+            self._draw_victory_menu(canvas)
 
-    def _draw_victory_menu(self, screen):
+    def _build_titles(self):
+        """Pre-rend les titres des sequences de boss (une seule fois par scene)"""
+        if self.titles:
+            return
+        self.titles = {
+            "prepare": PulsingTitle("PREPAREZ-VOUS", FONT_METAL_MANIA, 64, WHITE, (50, 50, 50)),
+            "combat": PulsingTitle("AU COMBAT !", FONT_METAL_MANIA, 80, YELLOW, (80, 50, 0), max_scale=1.1),
+            "victory": PulsingTitle("BOSS VAINCU!", FONT_METAL_MANIA, 72, YELLOW, (50, 50, 50),
+                                    shadow_offset=4, max_scale=1.15),
+            "win": PulsingTitle("Vous avez gagne!", FONT_ROAD_RAGE, 36, WHITE, WHITE, shadow_offset=0),
+        }
+        # Preparer toutes les tailles de pulsation pour ne rien redimensionner en jeu
+        self.titles["combat"].prebake(0.9)
+        self.titles["victory"].prebake(0.85)
+
+    def _draw_victory_menu(self, canvas):
         """Dessine le menu continuer/quitter apres la mort du boss"""
         try:
-            menu_font = pygame.font.Font(str(FONT_ROAD_RAGE), 36)
-            small_font = pygame.font.Font(str(FONT_ROAD_RAGE), 24)
+            menu_font = get_font(FONT_ROAD_RAGE, 36)
+            small_font = get_font(FONT_ROAD_RAGE, 24)
         except (pygame.error, FileNotFoundError):
-            menu_font = pygame.font.Font(None, 36)
-            small_font = pygame.font.Font(None, 24)
+            menu_font = get_font(None, 36)
+            small_font = get_font(None, 24)
 
         # Box du menu
         box_width = 300
@@ -1440,9 +1479,7 @@ class GameplayScene(Scene):
         box_y = HEIGHT // 2 + 50
 
         # Fond de la boite
-        box_surf = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
-        box_surf.fill((30, 20, 40, 220))
-        screen.blit(box_surf, (box_x, box_y))
+        canvas.fill_alpha((30, 20, 40), 220, (box_x, box_y, box_width, box_height))
 
         # Bordure animee
         border_color = (
@@ -1450,7 +1487,7 @@ class GameplayScene(Scene):
             int(100 + math.sin(self.animation_time * 3) * 50),
             0
         )
-        pygame.draw.rect(screen, border_color, (box_x, box_y, box_width, box_height), 3, border_radius=10)
+        canvas.rect(border_color, (box_x, box_y, box_width, box_height), 3, border_radius=10)
 
         # Options
         for i, option in enumerate(self.victory_menu_options):
@@ -1458,9 +1495,7 @@ class GameplayScene(Scene):
             is_selected = i == self.victory_menu_selected
 
             if is_selected:
-                sel_surf = pygame.Surface((box_width - 40, 45), pygame.SRCALPHA)
-                sel_surf.fill((255, 200, 0, 80))
-                screen.blit(sel_surf, (box_x + 20, y - 8))
+                canvas.fill_alpha((255, 200, 0), 80, (box_x + 20, y - 8, box_width - 40, 45))
 
                 # Fleche animee
                 arrow_offset = math.sin(self.animation_time * 8) * 5
@@ -1470,7 +1505,7 @@ class GameplayScene(Scene):
                     (box_x + 30 + arrow_offset, y + 14 + arrow_size // 2),
                     (box_x + 30 + arrow_offset + arrow_size, y + 14)
                 ]
-                pygame.draw.polygon(screen, YELLOW, points)
+                canvas.polygon(YELLOW, points)
 
                 color = YELLOW
             else:
@@ -1478,15 +1513,16 @@ class GameplayScene(Scene):
 
             text = menu_font.render(option, True, color)
             rect = text.get_rect(center=(WIDTH // 2, y + 14))
-            screen.blit(text, rect)
+            canvas.text(text, rect)
 
         # Instructions
         instructions = small_font.render("Fleches + Entree pour choisir", True, GRAY)
         inst_rect = instructions.get_rect(center=(WIDTH // 2, box_y + box_height + 20))
-        screen.blit(instructions, inst_rect)
+        canvas.text(instructions, inst_rect)
 
-    def _draw_placeholder_bg(self, screen):
-        """Dessine un fond placeholder"""
+    def _render_placeholder_bg(self):
+        """Fond placeholder (degrade) quand l'image du stage manque"""
+        screen = pygame.Surface((WIDTH, HEIGHT))
         # Gradient selon le niveau
         colors = {
             1: ((40, 30, 50), (60, 40, 70)),   # Coulisses - violet sombre
@@ -1501,36 +1537,37 @@ class GameplayScene(Scene):
             g = int(c1[1] + (c2[1] - c1[1]) * ratio)
             b = int(c1[2] + (c2[2] - c1[2]) * ratio)
             pygame.draw.line(screen, (r, g, b), (0, y), (WIDTH, y))
+        return screen
 
     def _draw_debug_hitboxes(self, screen):
         """Dessine les hitboxes en mode debug"""
         # Joueur
-        player_rect = self.player.rect.move(-self.camera_x, 0)
+        player_rect = self.player.rect.move(-self.view_x, 0)
         pygame.draw.rect(screen, GREEN, player_rect, 2)
 
         # Ennemis
         for enemy in self.enemies:
-            enemy_rect = enemy.rect.move(-self.camera_x, 0)
+            enemy_rect = enemy.rect.move(-self.view_x, 0)
             pygame.draw.rect(screen, RED, enemy_rect, 2)
 
         # Projectiles
         for proj in self.player_projectiles:
-            proj_rect = proj.rect.move(-self.camera_x, 0)
+            proj_rect = proj.rect.move(-self.view_x, 0)
             pygame.draw.rect(screen, YELLOW, proj_rect, 2)
 
         for proj in self.boss_projectiles:
-            proj_rect = proj.rect.move(-self.camera_x, 0)
+            proj_rect = proj.rect.move(-self.view_x, 0)
             pygame.draw.rect(screen, ORANGE, proj_rect, 2)
 
         for proj in self.enemy_projectiles:
-            proj_rect = proj.rect.move(-self.camera_x, 0)
+            proj_rect = proj.rect.move(-self.view_x, 0)
             pygame.draw.rect(screen, RED, proj_rect, 2)
 
     def _draw_damage_numbers(self, screen):
         """Dessine les nombres de degats flottants"""
         for dmg in self.damage_numbers:
             # Position avec camera
-            draw_x = dmg["x"] - self.camera_x
+            draw_x = dmg["x"] - self.view_x
             draw_y = dmg["y"] + dmg["offset_y"]
 
             # Alpha basé sur le timer restant (fade out)
@@ -1597,8 +1634,8 @@ class GameplayScene(Scene):
 
         # Niveau et stage
         if self.level_data and self.stage_data:
-            level_name = self.level_data.get('name', 'Unknown')
-            stage_name = self.stage_data.get('name', f'Stage {self.current_stage_id}')
+            level_name = self.level_data.name
+            stage_name = self.stage_data.name
             level_text = self.font.render(f"{level_name} - {stage_name}", True, WHITE)
             screen.blit(level_text, (WIDTH // 2 - level_text.get_width() // 2, HUD_MARGIN))
 
@@ -1660,40 +1697,49 @@ class GameplayScene(Scene):
 
         # Debug info
         if self.debug_hitboxes:
+            # Comptabilite memoire recalculee au plus une fois par seconde
+            now = pygame.time.get_ticks()
+            if now - self._memory_summary_time >= 1000:
+                self._memory_summary = get_resource_registry().summary()
+                self._memory_summary_time = now
+            memory_text = self.font.render(self._memory_summary, True, YELLOW)
+            screen.blit(memory_text, (10, HEIGHT - 60))
+
             debug_text = self.font.render(
-                f"DEBUG | Invincible: {self.player.debug_invincible} | F1:Hitbox F2:Skip F3:Godmode",
+                f"DEBUG | Invincible: {self.player.debug_invincible} | F1:Hitbox F2:Skip F3:Godmode"
+                f" | Blits: {self.render_queue.queued} ({self.render_queue.culled} culled,"
+                f" {self.render_queue.batches} batches)",
                 True, YELLOW
             )
             screen.blit(debug_text, (10, HEIGHT - 30))
 
-    def _draw_ultimate_overlay(self, screen):
+    def _draw_ultimate_overlay(self, canvas):
         """Dessine l'overlay Guitar Hero pendant la sequence ultime"""
         # Fond semi-transparent
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        screen.blit(overlay, (0, 0))
+        canvas.fill_alpha((0, 0, 0), 150)
 
         # Titre ULTIMATE
         title = self.font_big.render("ULTIMATE!", True, YELLOW)
         title_rect = title.get_rect(center=(WIDTH // 2, 50))
-        screen.blit(title, title_rect)
+        canvas.text(title, title_rect)
 
         # Degats accumules
         dmg_text = self.font_big.render(f"Damage: {self.ultimate_total_damage}", True, ORANGE)
         dmg_rect = dmg_text.get_rect(center=(WIDTH // 2, 90))
-        screen.blit(dmg_text, dmg_rect)
+        canvas.text(dmg_text, dmg_rect)
 
         # Compteur de notes
-        notes_left = ULTIMATE_NOTE_COUNT - len(self.ultimate_results)
-        count_text = self.font.render(f"Notes: {notes_left}/{ULTIMATE_NOTE_COUNT}", True, WHITE)
+        note_count = len(self.ultimate_track.notes)
+        notes_left = note_count - len(self.ultimate_results)
+        count_text = self.font.render(f"Notes: {notes_left}/{note_count}", True, WHITE)
         count_rect = count_text.get_rect(center=(WIDTH // 2, 120))
-        screen.blit(count_text, count_rect)
+        canvas.text(count_text, count_rect)
 
-    def _draw_rhythm_bar(self, screen):
+    def _draw_rhythm_bar(self, canvas):
         """Dessine la piste Guitar Hero avec les 3 colonnes (F, G, H)"""
         # Fond de la piste
         track_rect = pygame.Rect(TRACK_X, TRACK_Y, TRACK_WIDTH, TRACK_HEIGHT)
-        pygame.draw.rect(screen, (20, 20, 30), track_rect)
+        canvas.rect((20, 20, 30), track_rect)
 
         # Dessiner les 3 pistes (colonnes)
         for i in range(LANE_COUNT):
@@ -1702,16 +1748,13 @@ class GameplayScene(Scene):
 
             # Fond de la piste (plus sombre)
             dark_color = (lane_color[0] // 4, lane_color[1] // 4, lane_color[2] // 4)
-            pygame.draw.rect(screen, dark_color,
-                           (lane_x + 2, TRACK_Y, LANE_WIDTH - 4, TRACK_HEIGHT))
+            canvas.rect(dark_color, (lane_x + 2, TRACK_Y, LANE_WIDTH - 4, TRACK_HEIGHT))
 
             # Separateurs entre pistes
-            pygame.draw.line(screen, GRAY, (lane_x, TRACK_Y), (lane_x, TRACK_Y + TRACK_HEIGHT), 2)
+            canvas.line(GRAY, (lane_x, TRACK_Y), (lane_x, TRACK_Y + TRACK_HEIGHT), 2)
 
         # Ligne de frappe (zone cible)
-        pygame.draw.line(screen, WHITE,
-                        (TRACK_X, HIT_LINE_Y),
-                        (TRACK_X + TRACK_WIDTH, HIT_LINE_Y), 4)
+        canvas.line(WHITE, (TRACK_X, HIT_LINE_Y), (TRACK_X + TRACK_WIDTH, HIT_LINE_Y), 4)
 
         # Zones de timing sur la ligne de frappe
         for i in range(LANE_COUNT):
@@ -1720,47 +1763,51 @@ class GameplayScene(Scene):
 
             # Cercle cible (plus brillant si touche pressee)
             if self.ultimate_lane_pressed[i]:
-                pygame.draw.circle(screen, lane_color, (lane_x, HIT_LINE_Y), NOTE_SIZE // 2 + 5)
-                pygame.draw.circle(screen, WHITE, (lane_x, HIT_LINE_Y), NOTE_SIZE // 2, 3)
+                canvas.circle(lane_color, (lane_x, HIT_LINE_Y), NOTE_SIZE // 2 + 5)
+                canvas.circle(WHITE, (lane_x, HIT_LINE_Y), NOTE_SIZE // 2, 3)
             else:
                 dark_color = (lane_color[0] // 2, lane_color[1] // 2, lane_color[2] // 2)
-                pygame.draw.circle(screen, dark_color, (lane_x, HIT_LINE_Y), NOTE_SIZE // 2)
-                pygame.draw.circle(screen, lane_color, (lane_x, HIT_LINE_Y), NOTE_SIZE // 2, 2)
-
-        # Dessiner les notes qui tombent
-        for note in self.ultimate_notes:
-            lane_x = TRACK_X + note["lane"] * LANE_WIDTH + LANE_WIDTH // 2
-            lane_color = LANE_COLORS[note["lane"]]
+                canvas.circle(dark_color, (lane_x, HIT_LINE_Y), NOTE_SIZE // 2)
+                canvas.circle(lane_color, (lane_x, HIT_LINE_Y), NOTE_SIZE // 2, 2)
+
+        # Dessiner les notes qui tombent (position calculee depuis le temps de la partition)
+        song_time = self.ultimate_track.song_time(now_ms())
+        for note in self.ultimate_track.pending():
+            note_y = int(HIT_LINE_Y - (note.time - song_time) * NOTE_FALL_SPEED)
+            if note_y < TRACK_Y:
+                continue  # Pas encore entree sur la piste
+            lane_x = TRACK_X + note.lane * LANE_WIDTH + LANE_WIDTH // 2
+            lane_color = LANE_COLORS[note.lane]
 
             # Note (cercle colore)
-            pygame.draw.circle(screen, lane_color, (lane_x, int(note["y"])), NOTE_SIZE // 2)
-            pygame.draw.circle(screen, WHITE, (lane_x, int(note["y"])), NOTE_SIZE // 2, 2)
+            canvas.circle(lane_color, (lane_x, note_y), NOTE_SIZE // 2)
+            canvas.circle(WHITE, (lane_x, note_y), NOTE_SIZE // 2, 2)
 
             # Trainee lumineuse
-            pygame.draw.line(screen, lane_color,
-                           (lane_x, int(note["y"]) - NOTE_SIZE // 2),
-                           (lane_x, int(note["y"]) - NOTE_SIZE), 4)
+            canvas.line(lane_color, (lane_x, note_y - NOTE_SIZE // 2), (lane_x, note_y - NOTE_SIZE), 4)
 
         # Bordure de la piste
-        pygame.draw.rect(screen, WHITE, track_rect, 3)
+        canvas.rect(WHITE, track_rect, 3)
 
-        # Labels des touches (F, G, H)
-        key_names = ["F", "G", "H"]
+        # Labels des touches (F, G, H par defaut, ou touches reconfigurees)
         for i in range(LANE_COUNT):
             lane_x = TRACK_X + i * LANE_WIDTH + LANE_WIDTH // 2
-            key_text = self.font_big.render(key_names[i], True, LANE_COLORS[i])
+            keys = self.game.input_map.keys_for(LANE_ACTIONS[i])
+            key_name = pygame.key.name(keys[0]).upper() if keys else "?"
+            key_text = self.font_big.render(key_name, True, LANE_COLORS[i])
             key_rect = key_text.get_rect(center=(lane_x, TRACK_Y + TRACK_HEIGHT + 30))
-            screen.blit(key_text, key_rect)
+            canvas.text(key_text, key_rect)
 
         # Afficher les resultats (cercles colores en bas)
         result_colors = {"PERFECT!": YELLOW, "GOOD!": GREEN, "OK": BLUE, "MISS": RED}
         start_x = TRACK_X
         for i, result in enumerate(self.ultimate_results[-8:]):  # Max 8 derniers resultats
             color = result_colors.get(result, WHITE)
-            pygame.draw.circle(screen, color, (start_x + i * 30 + 15, TRACK_Y + TRACK_HEIGHT + 70), 10)
+            canvas.circle(color, (start_x + i * 30 + 15, TRACK_Y + TRACK_HEIGHT + 70), 10)
 
     def _draw_star_mode_effect(self, screen, player_rect):
-        """Draw the star mode glow effect around player (Easter Egg)"""
+        """Draw the star mode glow effect around player (Easter Egg), glow at the backdrop resolution"""
+        scale = self.game.render_scale
         # Rainbow color cycling based on time
         time_ms = pygame.time.get_ticks()
         cycle_speed = 100  # Color changes every 100ms
@@ -1775,25 +1822,25 @@ class GameplayScene(Scene):
         color_idx = (time_ms // cycle_speed) % len(colors)
         glow_color = colors[color_idx]
 
-        # Draw expanding glow rings
+        # Draw expanding glow rings into one surface at 1/scale (largest ring: 14 + 5 px
+        # around the player), scaled up and blitted once under the player
+        margin = 19
+        glow = pygame.Surface(((player_rect.width + margin * 2) // scale,
+                               (player_rect.height + margin * 2) // scale), pygame.SRCALPHA)
         for i in range(3):
             expand = (time_ms // 50 + i * 5) % 15
             alpha = 150 - expand * 10
             if alpha > 0:
-                glow_surf = pygame.Surface(
-                    (player_rect.width + expand * 2 + 10, player_rect.height + expand * 2 + 10),
-                    pygame.SRCALPHA
-                )
-                pygame.draw.rect(
-                    glow_surf,
-                    (*glow_color, alpha),
-                    (0, 0, glow_surf.get_width(), glow_surf.get_height()),
-                    border_radius=8
-                )
-                screen.blit(
-                    glow_surf,
-                    (player_rect.x - expand - 5, player_rect.y - expand - 5)
-                )
+                inset = (margin - expand - 5) // scale
+                ring = pygame.Surface((glow.get_width() - inset * 2, glow.get_height() - inset * 2),
+                                      pygame.SRCALPHA)
+                pygame.draw.rect(ring, (*glow_color, alpha), ring.get_rect(), border_radius=8 // scale)
+                glow.blit(ring, (inset, inset))
+        if scale > 1:
+            glow = pygame.transform.scale(glow, (glow.get_width() * scale, glow.get_height() * scale))
+        # Rings blended onto a transparent surface hold premultiplied colors
+        screen.blit(glow, (player_rect.x - margin, player_rect.y - margin),
+                    special_flags=pygame.BLEND_PREMULTIPLIED)
 
         # Draw sparkles around player
         sparkle_count = 6
@@ -1805,7 +1852,7 @@ class GameplayScene(Scene):
             sparkle_color = colors[(color_idx + i) % len(colors)]
             pygame.draw.circle(screen, sparkle_color, (int(sx), int(sy)), 3)
 
-    def _draw_timing_feedback(self, screen):
+    def _draw_timing_feedback(self, canvas):
         """Dessine le feedback de timing"""
         colors = {
             "PERFECT!": YELLOW,
@@ -1825,9 +1872,6 @@ class GameplayScene(Scene):
         text_rect = text.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 100))
 
         # Fond semi-transparent
-        bg_rect = text_rect.inflate(20, 10)
-        bg_surf = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-        bg_surf.fill((0, 0, 0, 150))
-        screen.blit(bg_surf, bg_rect)
+        canvas.fill_alpha((0, 0, 0), 150, text_rect.inflate(20, 10))
 
-        screen.blit(text, text_rect)
+        canvas.text(text, text_rect)
@@ -4,14 +4,15 @@ Level Select Scene - Scene de selection des niveaux avec interface carte
 
 import pygame
 from scenes.base import Scene
+from assets import load_image
+from audio import get_audio_bank, play_music
 from settings import (
     WIDTH, HEIGHT, WHITE, BLACK, BG_COLOR, DARK_GRAY, GRAY,
     PURPLE, ORANGE, YELLOW, GREEN, BLUE, RED,
     FONT_METAL_MANIA, FONT_ROAD_RAGE,
     STATE_GAMEPLAY, STATE_MENU,
-    CONTROLS,
     IMG_BG_DIR, IMG_BG_LEVEL_CHOICE,
-    SND_DIR, SND_MUSIC_MENU, SND_MENU_CLICK, SND_CONFIRM_STAGE,
+    SND_MUSIC_MENU, SND_MENU_CLICK, SND_CONFIRM_STAGE,
 )
 from level_loader import get_loader
 import math
@@ -22,7 +23,7 @@ class LevelNode:
 
     def __init__(self, level_data, x, y, unlocked=False, stars=0):
         self.level_data = level_data
-        self.level_id = level_data['id']
+        self.level_id = level_data.id
         self.x = x
         self.y = y
         self.unlocked = unlocked
@@ -68,7 +69,7 @@ class LevelNode:
             border_color = YELLOW
         else:
             # Couleur selon la difficulte
-            difficulty = self.level_data.get('difficulty', 'easy')
+            difficulty = self.level_data.difficulty
             if difficulty == 'easy':
                 color = GREEN
             elif difficulty == 'medium':
@@ -91,7 +92,7 @@ class LevelNode:
 
         # Nom du niveau en dessous
         if self.unlocked:
-            name_text = font_small.render(self.level_data['name'], True, WHITE)
+            name_text = font_small.render(self.level_data.name, True, WHITE)
             name_rect = name_text.get_rect(center=(self.x, self.y + self.radius + 25))
             screen.blit(name_text, name_rect)
 
@@ -143,6 +144,9 @@ class LevelNode:
 class LevelSelectScene(Scene):
     """Scene de selection des niveaux avec interface carte"""
 
+    # Fond d'ecran au format de assets.load_image
+    BACKGROUND = (IMG_BG_DIR / IMG_BG_LEVEL_CHOICE, (WIDTH, HEIGHT), False)
+
     def __init__(self, game):
         super().__init__(game)
 
@@ -186,27 +190,19 @@ class LevelSelectScene(Scene):
         self.keyboard_index = 0
 
         # Sons
-        self.click_sfx = None
-        try:
-            self.click_sfx = pygame.mixer.Sound(str(SND_DIR / SND_MENU_CLICK))
-            self.click_sfx.set_volume(0.5)
-        except (pygame.error, FileNotFoundError):
-            pass
+        self.click_sfx = get_audio_bank().get(SND_MENU_CLICK, 0.5)
 
-        self.confirm_sfx = None
-        try:
-            self.confirm_sfx = pygame.mixer.Sound(str(SND_DIR / SND_CONFIRM_STAGE))
-            self.confirm_sfx.set_volume(0.6)
-        except (pygame.error, FileNotFoundError):
-            pass
+        self.confirm_sfx = get_audio_bank().get(SND_CONFIRM_STAGE, 0.6)
+
+    def get_preload_assets(self, **kwargs):
+        """Fond d'ecran a precharger pendant la transition"""
+        return [self.BACKGROUND]
 
     def enter(self, **kwargs):
         """Entre dans la scene"""
         # Charger le background
         try:
-            bg_path = IMG_BG_DIR / IMG_BG_LEVEL_CHOICE
-            self.background = pygame.image.load(str(bg_path)).convert()
-            self.background = pygame.transform.scale(self.background, (WIDTH, HEIGHT))
+            self.background = load_image(*self.BACKGROUND)
         except (pygame.error, FileNotFoundError) as e:
             print(f"Could not load level choice background: {e}")
             self.background = None
@@ -223,7 +219,7 @@ class LevelSelectScene(Scene):
         for i, level_data in enumerate(levels):
             if i < len(self.node_positions):
                 x, y = self.node_positions[i]
-                level_id = level_data['id']
+                level_id = level_data.id
 
                 # Verifier si debloque
                 unlocked = self.loader.is_level_unlocked(level_id, self.completed_levels)
@@ -242,37 +238,37 @@ class LevelSelectScene(Scene):
 
         # Jouer la musique du menu (meme musique que le menu principal)
         try:
-            music_path = str(SND_DIR / SND_MUSIC_MENU)
-            try:
-                pygame.mixer.music.load(music_path)
-            except pygame.error:
-                pygame.mixer.music.load(music_path, namehint=".mp3")
-            pygame.mixer.music.set_volume(0.5)
-            pygame.mixer.music.play(-1)
+            play_music(SND_MUSIC_MENU, 0.5)
         except (pygame.error, FileNotFoundError):
             pass
 
+    def exit(self):
+        """Lache le fond (recharge par enter)"""
+        self.background = None
+
     def handle_event(self, event):
         """Gere les evenements"""
-        if event.type == pygame.KEYDOWN:
+        # Actions de l'appui: clavier, boutons, croix ou stick de la manette
+        actions = self.game.input_map.actions(event)
+        if actions:
             # Retour au menu
-            if event.key in CONTROLS["pause"]:
+            if "pause" in actions:
                 self.game.change_scene(STATE_MENU)
 
-            # Navigation clavier gauche/droite
-            if event.key in CONTROLS["left"] and self.nodes:
+            # Navigation gauche/droite (fleches, croix ou stick)
+            if "left" in actions and self.nodes:
                 self.keyboard_index = (self.keyboard_index - 1) % len(self.nodes)
                 self.selected_node = self.nodes[self.keyboard_index]
                 if self.click_sfx:
                     self.click_sfx.play()
-            elif event.key in CONTROLS["right"] and self.nodes:
+            elif "right" in actions and self.nodes:
                 self.keyboard_index = (self.keyboard_index + 1) % len(self.nodes)
                 self.selected_node = self.nodes[self.keyboard_index]
                 if self.click_sfx:
                     self.click_sfx.play()
 
-            # Selection avec Enter
-            if event.key in CONTROLS["confirm"] and self.selected_node:
+            # Selection avec Entree (ou A)
+            if "confirm" in actions and self.selected_node:
                 if self.selected_node.unlocked:
                     if self.confirm_sfx:
                         self.confirm_sfx.play()
@@ -416,22 +412,22 @@ class LevelSelectScene(Scene):
         pygame.draw.rect(screen, ORANGE, (panel_x, panel_y, panel_width, panel_height), 3, border_radius=10)
 
         # Nom du niveau
-        name_text = self.font_medium.render(node.level_data['name'], True, YELLOW)
+        name_text = self.font_medium.render(node.level_data.name, True, YELLOW)
         screen.blit(name_text, (panel_x + 20, panel_y + 15))
 
         # Description
-        desc = node.level_data.get('description', 'No description')
+        desc = node.level_data.description
         desc_text = self.font_small.render(desc, True, WHITE)
         screen.blit(desc_text, (panel_x + 20, panel_y + 55))
 
         # Difficulte
-        difficulty = node.level_data.get('difficulty', 'easy').upper()
+        difficulty = node.level_data.difficulty.upper()
         diff_color = GREEN if difficulty == 'EASY' else (BLUE if difficulty == 'MEDIUM' else RED)
         diff_text = self.font_small.render(f"Difficulty: {difficulty}", True, diff_color)
         screen.blit(diff_text, (panel_x + 20, panel_y + 90))
 
         # Nombre de stages
-        num_stages = len(node.level_data.get('stages', []))
+        num_stages = node.level_data.stage_count
         stages_text = self.font_small.render(f"Stages: {num_stages}", True, WHITE)
         screen.blit(stages_text, (panel_x + 20, panel_y + 120))
 
@@ -6,13 +6,15 @@ Menu stylise avec selection de personnage et configuration des touches
 import pygame
 import math
 from scenes.base import Scene
+from assets import load_image
+from audio import get_audio_bank, play_music
 from settings import (
     WIDTH, HEIGHT, WHITE, YELLOW, GRAY, PURPLE, ORANGE, RED, BLACK,
-    STATE_LEVEL_SELECT, CONTROLS,
+    STATE_LEVEL_SELECT, STATE_CALIBRATION,
     IMG_DIR, IMG_HOME, IMG_LOGO, IMG_PLAYER_DIR,
     IMG_PLAYER1_IDLE, IMG_PLAYER2_IDLE,
     PLAYER_WIDTH, PLAYER_HEIGHT,
-    SND_DIR, SND_MUSIC_MENU, SND_MENU_CLICK, SND_CONFIRM_MENU,
+    SND_MUSIC_MENU, SND_MENU_CLICK, SND_CONFIRM_MENU,
     FONT_METAL_MANIA, FONT_ROAD_RAGE
 )
 
@@ -55,6 +57,9 @@ def get_key_name(key):
 class MenuScene(Scene):
     """Scene du menu principal avec selection de personnage et options"""
 
+    # Fond d'ecran au format de assets.load_image
+    BACKGROUND = (IMG_DIR / IMG_HOME, (WIDTH, HEIGHT), False)
+
     def __init__(self, game):
         super().__init__(game)
         self.font_title = None
@@ -65,7 +70,7 @@ class MenuScene(Scene):
         self.menu_state = "main"
         self.selected_option = 0
         self.main_options = ["Jouer", "Options", "Quitter"]
-        self.options_menu = ["Touches", "Retour"]
+        self.options_menu = ["Touches", "Calibration", "Retour"]
         self.selected_character = 1
 
         # Configuration des touches
@@ -80,20 +85,10 @@ class MenuScene(Scene):
         self.player2_img = None
 
         # Son de navigation
-        self.click_sfx = None
-        try:
-            self.click_sfx = pygame.mixer.Sound(str(SND_DIR / SND_MENU_CLICK))
-            self.click_sfx.set_volume(0.5)
-        except (pygame.error, FileNotFoundError):
-            pass
+        self.click_sfx = get_audio_bank().get(SND_MENU_CLICK, 0.5)
 
         # Son de confirmation
-        self.confirm_sfx = None
-        try:
-            self.confirm_sfx = pygame.mixer.Sound(str(SND_DIR / SND_CONFIRM_MENU))
-            self.confirm_sfx.set_volume(0.6)
-        except (pygame.error, FileNotFoundError):
-            pass
+        self.confirm_sfx = get_audio_bank().get(SND_CONFIRM_MENU, 0.6)
 
         # Animation
         self.anim_time = 0
@@ -116,6 +111,15 @@ class MenuScene(Scene):
         }
         self.particles.append(particle)
 
+    def get_preload_assets(self, **kwargs):
+        """Images du menu a precharger pendant la transition"""
+        return [
+            self.BACKGROUND,
+            (IMG_DIR / IMG_LOGO, None),
+            (IMG_PLAYER_DIR / IMG_PLAYER1_IDLE, (PLAYER_WIDTH * 2, PLAYER_HEIGHT * 2)),
+            (IMG_PLAYER_DIR / IMG_PLAYER2_IDLE, (PLAYER_WIDTH * 2, PLAYER_HEIGHT * 2)),
+        ]
+
     def enter(self, **kwargs):
         """Initialisation a l'entree dans la scene"""
         try:
@@ -135,15 +139,12 @@ class MenuScene(Scene):
     def _load_images(self):
         """Charge les images du menu"""
         try:
-            bg_path = IMG_DIR / IMG_HOME
-            self.background = pygame.image.load(str(bg_path)).convert()
-            self.background = pygame.transform.scale(self.background, (WIDTH, HEIGHT))
+            self.background = load_image(*self.BACKGROUND)
         except (pygame.error, FileNotFoundError):
             self.background = None
 
         try:
-            logo_path = IMG_DIR / IMG_LOGO
-            self.logo = pygame.image.load(str(logo_path)).convert_alpha()
+            self.logo = load_image(IMG_DIR / IMG_LOGO)
             logo_width = 500
             ratio = logo_width / self.logo.get_width()
             logo_height = int(self.logo.get_height() * ratio)
@@ -152,52 +153,44 @@ class MenuScene(Scene):
             self.logo = None
 
         try:
-            p1_path = IMG_PLAYER_DIR / IMG_PLAYER1_IDLE
-            self.player1_img = pygame.image.load(str(p1_path)).convert_alpha()
-            self.player1_img = pygame.transform.scale(
-                self.player1_img, (PLAYER_WIDTH * 2, PLAYER_HEIGHT * 2)
-            )
+            self.player1_img = load_image(IMG_PLAYER_DIR / IMG_PLAYER1_IDLE,
+                                          (PLAYER_WIDTH * 2, PLAYER_HEIGHT * 2))
         except (pygame.error, FileNotFoundError):
             self.player1_img = None
 
         try:
-            p2_path = IMG_PLAYER_DIR / IMG_PLAYER2_IDLE
-            self.player2_img = pygame.image.load(str(p2_path)).convert_alpha()
-            self.player2_img = pygame.transform.scale(
-                self.player2_img, (PLAYER_WIDTH * 2, PLAYER_HEIGHT * 2)
-            )
+            self.player2_img = load_image(IMG_PLAYER_DIR / IMG_PLAYER2_IDLE,
+                                          (PLAYER_WIDTH * 2, PLAYER_HEIGHT * 2))
         except (pygame.error, FileNotFoundError):
             self.player2_img = None
 
     def _play_menu_music(self):
         """Charge et joue la musique du menu"""
         try:
-            music_path = str(SND_DIR / SND_MUSIC_MENU)
-            try:
-                pygame.mixer.music.load(music_path)
-            except pygame.error:
-                pygame.mixer.music.load(music_path, namehint=".mp3")
-            pygame.mixer.music.set_volume(0.5)
-            pygame.mixer.music.play(-1)
+            play_music(SND_MUSIC_MENU, 0.5)
         except (pygame.error, FileNotFoundError):
             pass
 
     def handle_event(self, event):
         """Gere les evenements du menu"""
-        if event.type == pygame.KEYDOWN:
-            # Attente d'une touche pour la configuration
-            if self.waiting_for_key:
+        # Attente d'une touche pour la configuration (clavier seulement)
+        if self.waiting_for_key:
+            if event.type == pygame.KEYDOWN:
                 self._set_new_key(event.key)
-                return
+            return
 
-            if self.menu_state == "main":
-                self._handle_main_menu(event)
-            elif self.menu_state == "character_select":
-                self._handle_character_select(event)
-            elif self.menu_state == "options":
-                self._handle_options(event)
-            elif self.menu_state == "controls":
-                self._handle_controls(event)
+        # Actions de l'appui: clavier, boutons, croix ou stick de la manette
+        actions = self.game.input_map.actions(event)
+        if not actions:
+            return
+        if self.menu_state == "main":
+            self._handle_main_menu(actions)
+        elif self.menu_state == "character_select":
+            self._handle_character_select(actions)
+        elif self.menu_state == "options":
+            self._handle_options(actions)
+        elif self.menu_state == "controls":
+            self._handle_controls(actions)
 
     def _play_click(self):
         """Joue le son de clic menu"""
@@ -209,15 +202,15 @@ class MenuScene(Scene):
         if self.confirm_sfx:
             self.confirm_sfx.play()
 
-    def _handle_main_menu(self, event):
+    def _handle_main_menu(self, actions):
         """Gere les inputs du menu principal"""
-        if event.key == pygame.K_UP:
+        if "up" in actions:
             self.selected_option = (self.selected_option - 1) % len(self.main_options)
             self._play_click()
-        elif event.key == pygame.K_DOWN:
+        elif "down" in actions:
             self.selected_option = (self.selected_option + 1) % len(self.main_options)
             self._play_click()
-        elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
+        elif "confirm" in actions:
             self._play_confirm()
             if self.selected_option == 0:  # Jouer
                 self.menu_state = "character_select"
@@ -228,55 +221,57 @@ class MenuScene(Scene):
             elif self.selected_option == 2:  # Quitter
                 self.game.running = False
 
-    def _handle_character_select(self, event):
+    def _handle_character_select(self, actions):
         """Gere les inputs de la selection de personnage"""
-        if event.key == pygame.K_LEFT:
+        if "left" in actions:
             self.selected_character = 1
             self._play_click()
-        elif event.key == pygame.K_RIGHT:
+        elif "right" in actions:
             self.selected_character = 2
             self._play_click()
-        elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
+        elif "confirm" in actions:
             self._play_confirm()
             self.game.game_data["selected_character"] = self.selected_character
             self.game.reset_game()
             # Aller vers la selection de niveau
             self.game.change_scene(STATE_LEVEL_SELECT)
-        elif event.key == pygame.K_ESCAPE:
+        elif "pause" in actions:
             self.menu_state = "main"
             self.selected_option = 0
 
-    def _handle_options(self, event):
+    def _handle_options(self, actions):
         """Gere les inputs du menu options"""
-        if event.key == pygame.K_UP:
+        if "up" in actions:
             self.selected_option = (self.selected_option - 1) % len(self.options_menu)
             self._play_click()
-        elif event.key == pygame.K_DOWN:
+        elif "down" in actions:
             self.selected_option = (self.selected_option + 1) % len(self.options_menu)
             self._play_click()
-        elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
+        elif "confirm" in actions:
             self._play_confirm()
             if self.selected_option == 0:  # Touches
                 self.menu_state = "controls"
                 self.controls_selected = 0
-            elif self.selected_option == 1:  # Retour
+            elif self.selected_option == 1:  # Calibration de la latence
+                self.game.change_scene(STATE_CALIBRATION)
+            elif self.selected_option == 2:  # Retour
                 self.menu_state = "main"
                 self.selected_option = 0
-        elif event.key == pygame.K_ESCAPE:
+        elif "pause" in actions:
             self.menu_state = "main"
             self.selected_option = 0
 
-    def _handle_controls(self, event):
+    def _handle_controls(self, actions):
         """Gere les inputs du menu de configuration des touches"""
         num_actions = len(CONFIGURABLE_ACTIONS)
 
-        if event.key == pygame.K_UP:
+        if "up" in actions:
             self.controls_selected = (self.controls_selected - 1) % (num_actions + 1)
             self._play_click()
-        elif event.key == pygame.K_DOWN:
+        elif "down" in actions:
             self.controls_selected = (self.controls_selected + 1) % (num_actions + 1)
             self._play_click()
-        elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
+        elif "confirm" in actions:
             if self.controls_selected < num_actions:
                 # Commencer a attendre une nouvelle touche
                 self.waiting_for_key = True
@@ -285,7 +280,7 @@ class MenuScene(Scene):
                 # Retour
                 self.menu_state = "options"
                 self.selected_option = 0
-        elif event.key == pygame.K_ESCAPE:
+        elif "pause" in actions:
             self.menu_state = "options"
             self.selected_option = 0
 
@@ -297,13 +292,20 @@ class MenuScene(Scene):
             self.key_to_change = None
             return
 
-        # Mettre a jour la touche (remplace la premiere touche)
-        if self.key_to_change and self.key_to_change in CONTROLS:
-            CONTROLS[self.key_to_change][0] = key
+        # Mettre a jour la touche (remplace la premiere touche, sauvegardee dans les preferences)
+        if self.key_to_change:
+            self.game.input_map.rebind(self.key_to_change, key)
 
         self.waiting_for_key = False
         self.key_to_change = None
 
+    def exit(self):
+        """Lache les images du menu (rechargees par enter)"""
+        self.background = None
+        self.logo = None
+        self.player1_img = None
+        self.player2_img = None
+
     def update(self, dt):
         """Mise a jour du menu"""
         self.anim_time += dt
@@ -323,30 +325,31 @@ class MenuScene(Scene):
         else:
             self._draw_gradient_bg(screen)
 
+        # Particules, voile et menu dans l'overlay de Game (basse resolution avec --render-scale)
+        canvas = self.game.overlay.canvas()
+
         # Particules de fond
-        self._draw_particles(screen)
+        self._draw_particles(canvas)
 
         # Overlay semi-transparent pour meilleure lisibilite
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 100))
-        screen.blit(overlay, (0, 0))
+        canvas.fill_alpha((0, 0, 0), 100)
 
         if self.menu_state == "main":
-            self._draw_main_menu(screen)
+            self._draw_main_menu(canvas)
         elif self.menu_state == "character_select":
-            self._draw_character_select(screen)
+            self._draw_character_select(canvas)
         elif self.menu_state == "options":
-            self._draw_options(screen)
+            self._draw_options(canvas)
         elif self.menu_state == "controls":
-            self._draw_controls(screen)
+            self._draw_controls(canvas)
 
-    def _draw_particles(self, screen):
+    def _draw_particles(self, canvas):
         """Dessine les particules de fond"""
         for particle in self.particles:
             surf = pygame.Surface((particle["size"] * 2, particle["size"] * 2), pygame.SRCALPHA)
             color = (*particle["color"], particle["alpha"])
             pygame.draw.circle(surf, color, (particle["size"], particle["size"]), particle["size"])
-            screen.blit(surf, (int(particle["x"]), int(particle["y"])))
+            canvas.blit(surf, (int(particle["x"]), int(particle["y"])))
 
     def _draw_gradient_bg(self, screen):
         """Dessine un fond degrade rock"""
@@ -357,7 +360,7 @@ class MenuScene(Scene):
             b = int(30 + ratio * 40)
             pygame.draw.line(screen, (r, g, b), (0, y), (WIDTH, y))
 
-    def _draw_menu_box(self, screen, title, options, selected, y_start=250):
+    def _draw_menu_box(self, canvas, title, options, selected, y_start=250):
         """Dessine une boite de menu stylisee"""
         box_width = 500
         box_height = 100 + len(options) * 70
@@ -372,7 +375,7 @@ class MenuScene(Scene):
             alpha = 200 - int(y / box_height * 50)
             pygame.draw.line(box_surf, (30, 20, 40, alpha), (0, y), (box_width, y))
 
-        screen.blit(box_surf, (box_x, box_y))
+        canvas.blit(box_surf, (box_x, box_y))
 
         # Bordure animee
         border_color = (
@@ -380,15 +383,15 @@ class MenuScene(Scene):
             int(100 + math.sin(self.anim_time * 3) * 50),
             0
         )
-        pygame.draw.rect(screen, border_color, (box_x, box_y, box_width, box_height), 3, border_radius=10)
+        canvas.rect(border_color, (box_x, box_y, box_width, box_height), 3, border_radius=10)
 
         # Titre de la boite
         title_text = self.font_menu.render(title, True, YELLOW)
         title_rect = title_text.get_rect(center=(WIDTH // 2, box_y + 40))
-        screen.blit(title_text, title_rect)
+        canvas.text(title_text, title_rect)
 
         # Ligne sous le titre
-        pygame.draw.line(screen, YELLOW, (box_x + 30, box_y + 70), (box_x + box_width - 30, box_y + 70), 2)
+        canvas.line(YELLOW, (box_x + 30, box_y + 70), (box_x + box_width - 30, box_y + 70), 2)
 
         # Options
         for i, option in enumerate(options):
@@ -397,14 +400,12 @@ class MenuScene(Scene):
 
             if is_selected:
                 # Fond de selection
-                sel_surf = pygame.Surface((box_width - 60, 50), pygame.SRCALPHA)
-                sel_surf.fill((255, 200, 0, 80))
-                screen.blit(sel_surf, (box_x + 30, y - 8))
+                canvas.fill_alpha((255, 200, 0), 80, (box_x + 30, y - 8, box_width - 60, 50))
 
                 # Fleches animees
                 arrow_offset = math.sin(self.anim_time * 8) * 5
-                self._draw_arrow(screen, box_x + 45 + arrow_offset, y + 17)
-                self._draw_arrow_right(screen, box_x + box_width - 45 - arrow_offset, y + 17)
+                self._draw_arrow(canvas, box_x + 45 + arrow_offset, y + 17)
+                self._draw_arrow_right(canvas, box_x + box_width - 45 - arrow_offset, y + 17)
 
                 color = YELLOW
             else:
@@ -412,66 +413,66 @@ class MenuScene(Scene):
 
             text = self.font_menu.render(option, True, color)
             rect = text.get_rect(center=(WIDTH // 2, y + 17))
-            screen.blit(text, rect)
+            canvas.text(text, rect)
 
         return box_y + box_height
 
-    def _draw_arrow(self, screen, x, y, color=YELLOW):
+    def _draw_arrow(self, canvas, x, y, color=YELLOW):
         """Dessine une fleche vers la droite"""
         points = [(x, y - 8), (x, y + 8), (x + 12, y)]
-        pygame.draw.polygon(screen, color, points)
+        canvas.polygon(color, points)
 
-    def _draw_arrow_right(self, screen, x, y, color=YELLOW):
+    def _draw_arrow_right(self, canvas, x, y, color=YELLOW):
         """Dessine une fleche vers la gauche"""
         points = [(x, y - 8), (x, y + 8), (x - 12, y)]
-        pygame.draw.polygon(screen, color, points)
+        canvas.polygon(color, points)
 
-    def _draw_main_menu(self, screen):
+    def _draw_main_menu(self, canvas):
         """Dessine le menu principal"""
         # Logo avec effet de pulsation
         if self.logo:
             pulse = 1.0 + math.sin(self.anim_time * 2) * 0.03
             logo_w = int(self.logo.get_width() * pulse)
             logo_h = int(self.logo.get_height() * pulse)
-            scaled_logo = pygame.transform.scale(self.logo, (logo_w, logo_h))
-            logo_rect = scaled_logo.get_rect(center=(WIDTH // 2, 130))
-            screen.blit(scaled_logo, logo_rect)
+            logo_rect = pygame.Rect(0, 0, logo_w, logo_h)
+            logo_rect.center = (WIDTH // 2, 130)
+            canvas.blit_scaled(self.logo, logo_rect)
         else:
             # Titre texte avec effet
             title_text = self.font_title.render("ROCKSTAR BROS", True, YELLOW)
             shadow_text = self.font_title.render("ROCKSTAR BROS", True, (50, 30, 0))
             title_rect = title_text.get_rect(center=(WIDTH // 2, 130))
-            screen.blit(shadow_text, title_rect.move(4, 4))
-            screen.blit(title_text, title_rect)
+            canvas.text(shadow_text, title_rect.move(4, 4))
+            canvas.text(title_text, title_rect)
 
         # Boite de menu
-        self._draw_menu_box(screen, "MENU PRINCIPAL", self.main_options, self.selected_option)
+        self._draw_menu_box(canvas, "MENU PRINCIPAL", self.main_options, self.selected_option)
 
         # Instructions en bas
-        self._draw_instructions(screen, "Naviguer  |  ENTREE Valider")
+        self._draw_instructions(canvas, "Naviguer  |  ENTREE Valider")
 
-    def _draw_options(self, screen):
+    def _draw_options(self, canvas):
         """Dessine le menu options"""
         # Titre
         title_text = self.font_title.render("OPTIONS", True, YELLOW)
         shadow_text = self.font_title.render("OPTIONS", True, (50, 30, 0))
         title_rect = title_text.get_rect(center=(WIDTH // 2, 120))
-        screen.blit(shadow_text, title_rect.move(4, 4))
-        screen.blit(title_text, title_rect)
+        canvas.text(shadow_text, title_rect.move(4, 4))
+        canvas.text(title_text, title_rect)
 
         # Menu options - centre verticalement
-        self._draw_menu_box(screen, "PARAMETRES", self.options_menu, self.selected_option, 220)
+        self._draw_menu_box(canvas, "PARAMETRES", self.options_menu, self.selected_option, 220)
 
-        self._draw_instructions(screen, "Naviguer  |  ENTREE Valider  |  ECHAP Retour")
+        self._draw_instructions(canvas, "Naviguer  |  ENTREE Valider  |  ECHAP Retour")
 
-    def _draw_controls(self, screen):
+    def _draw_controls(self, canvas):
         """Dessine le menu de configuration des touches"""
         # Titre
         title_text = self.font_title.render("TOUCHES", True, YELLOW)
         shadow_text = self.font_title.render("TOUCHES", True, (50, 30, 0))
         title_rect = title_text.get_rect(center=(WIDTH // 2, 60))
-        screen.blit(shadow_text, title_rect.move(4, 4))
-        screen.blit(title_text, title_rect)
+        canvas.text(shadow_text, title_rect.move(4, 4))
+        canvas.text(title_text, title_rect)
 
         # Calculer la hauteur necessaire
         num_actions = len(CONFIGURABLE_ACTIONS)
@@ -487,13 +488,11 @@ class MenuScene(Scene):
         box_y = 110
 
         # Fond
-        box_surf = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
-        box_surf.fill((30, 20, 40, 220))
-        screen.blit(box_surf, (box_x, box_y))
+        canvas.fill_alpha((30, 20, 40), 220, (box_x, box_y, box_width, box_height))
 
         # Bordure
         border_color = (200, 100, 0)
-        pygame.draw.rect(screen, border_color, (box_x, box_y, box_width, box_height), 3, border_radius=10)
+        canvas.rect(border_color, (box_x, box_y, box_width, box_height), 3, border_radius=10)
 
         # Colonnes bien espacees - tout a l'interieur de la boite
         col1_x = box_x + 40  # Action
@@ -502,13 +501,13 @@ class MenuScene(Scene):
 
         # En-tete
         header_text = self.font_menu.render("Action", True, YELLOW)
-        screen.blit(header_text, (col1_x, box_y + 20))
+        canvas.text(header_text, (col1_x, box_y + 20))
         header_text2 = self.font_menu.render("Touche 1", True, YELLOW)
-        screen.blit(header_text2, (col2_x, box_y + 20))
+        canvas.text(header_text2, (col2_x, box_y + 20))
         header_text3 = self.font_menu.render("Touche 2", True, YELLOW)
-        screen.blit(header_text3, (col3_x, box_y + 20))
+        canvas.text(header_text3, (col3_x, box_y + 20))
 
-        pygame.draw.line(screen, YELLOW, (box_x + 20, box_y + 60), (box_x + box_width - 20, box_y + 60), 2)
+        canvas.line(YELLOW, (box_x + 20, box_y + 60), (box_x + box_width - 20, box_y + 60), 2)
 
         # Liste des actions
         for i, (action_key, action_name) in enumerate(CONFIGURABLE_ACTIONS):
@@ -517,80 +516,74 @@ class MenuScene(Scene):
 
             if is_selected:
                 # Fond de selection - bien centre dans la boite
-                sel_surf = pygame.Surface((box_width - 40, 42), pygame.SRCALPHA)
-                sel_surf.fill((255, 200, 0, 80))
-                screen.blit(sel_surf, (box_x + 20, y - 2))
+                canvas.fill_alpha((255, 200, 0), 80, (box_x + 20, y - 2, box_width - 40, 42))
 
             # Nom de l'action
             color = YELLOW if is_selected else WHITE
             name_text = self.font_small.render(action_name, True, color)
-            screen.blit(name_text, (col1_x, y + 10))
+            canvas.text(name_text, (col1_x, y + 10))
 
             # Touches actuelles
-            keys = CONTROLS.get(action_key, [])
+            keys = self.game.input_map.keys_for(action_key)
             if len(keys) > 0:
                 key1_name = get_key_name(keys[0])
                 if self.waiting_for_key and self.key_to_change == action_key:
                     key1_text = self.font_small.render("...", True, RED)
                 else:
                     key1_text = self.font_small.render(key1_name, True, color)
-                screen.blit(key1_text, (col2_x, y + 10))
+                canvas.text(key1_text, (col2_x, y + 10))
 
             if len(keys) > 1:
                 key2_name = get_key_name(keys[1])
                 key2_text = self.font_small.render(key2_name, True, GRAY)
-                screen.blit(key2_text, (col3_x, y + 10))
+                canvas.text(key2_text, (col3_x, y + 10))
 
         # Option Retour - positionne apres les actions
         retour_y = box_y + header_height + num_actions * row_height + 10
         is_retour_selected = self.controls_selected == num_actions
 
         if is_retour_selected:
-            sel_surf = pygame.Surface((box_width - 40, 42), pygame.SRCALPHA)
-            sel_surf.fill((255, 200, 0, 80))
-            screen.blit(sel_surf, (box_x + 20, retour_y))
+            canvas.fill_alpha((255, 200, 0), 80, (box_x + 20, retour_y, box_width - 40, 42))
 
         retour_color = YELLOW if is_retour_selected else WHITE
         retour_text = self.font_menu.render("Retour", True, retour_color)
         # Centrer verticalement le texte dans la bande de selection
         text_y = retour_y + (42 - retour_text.get_height()) // 2
-        screen.blit(retour_text, (col1_x, text_y))
+        canvas.text(retour_text, (col1_x, text_y))
 
         # Message si en attente de touche
         if self.waiting_for_key:
             msg = self.font_small.render("Appuyez sur une touche... (ECHAP pour annuler)", True, RED)
             msg_rect = msg.get_rect(center=(WIDTH // 2, HEIGHT - 80))
-            screen.blit(msg, msg_rect)
+            canvas.text(msg, msg_rect)
         else:
-            self._draw_instructions(screen, "Naviguer  |  ENTREE Modifier  |  ECHAP Retour")
+            self._draw_instructions(canvas, "Naviguer  |  ENTREE Modifier  |  ECHAP Retour")
 
-    def _draw_instructions(self, screen, text):
+    def _draw_instructions(self, canvas, text):
         """Dessine les instructions en bas de l'ecran"""
         # Fond semi-transparent
-        inst_surf = pygame.Surface((WIDTH, 50), pygame.SRCALPHA)
-        inst_surf.fill((0, 0, 0, 150))
-        screen.blit(inst_surf, (0, HEIGHT - 50))
+        canvas.fill_alpha((0, 0, 0), 150, (0, HEIGHT - 50, WIDTH, 50))
 
         inst_text = self.font_small.render(text, True, WHITE)
         inst_rect = inst_text.get_rect(center=(WIDTH // 2, HEIGHT - 25))
-        screen.blit(inst_text, inst_rect)
+        canvas.text(inst_text, inst_rect)
 
-    def _draw_character_select(self, screen):
+    def _draw_character_select(self, canvas):
         """Dessine l'ecran de selection de personnage"""
         # Titre avec effet
         title_text = self.font_title.render("CHOISIS TON GUITARISTE", True, YELLOW)
         shadow_text = self.font_title.render("CHOISIS TON GUITARISTE", True, (50, 30, 0))
         title_rect = title_text.get_rect(center=(WIDTH // 2, 80))
-        screen.blit(shadow_text, title_rect.move(4, 4))
-        screen.blit(title_text, title_rect)
+        canvas.text(shadow_text, title_rect.move(4, 4))
+        canvas.text(title_text, title_rect)
 
         # Personnages
         p1_x = WIDTH // 3
         p2_x = (WIDTH // 5) * 3
         char_y = HEIGHT // 2 - 20
 
-        self._draw_character_option(screen, 1, p1_x, char_y, self.player1_img, "Axel")
-        self._draw_character_option(screen, 2, p2_x, char_y, self.player2_img, "Luna")
+        self._draw_character_option(canvas, 1, p1_x, char_y, self.player1_img, "Axel")
+        self._draw_character_option(canvas, 2, p2_x, char_y, self.player2_img, "Luna")
 
         # VS au milieu
         # vs_pulse = 1.0 + math.sin(self.anim_time * 4) * 0.1
@@ -602,9 +595,9 @@ class MenuScene(Scene):
         # vs_rect = vs_text.get_rect(center=(WIDTH // 2, char_y))
         # screen.blit(vs_text, vs_rect)
 
-        self._draw_instructions(screen, "Choisir  |  ENTREE Valider  |  ECHAP Retour")
+        self._draw_instructions(canvas, "Choisir  |  ENTREE Valider  |  ECHAP Retour")
 
-    def _draw_character_option(self, screen, char_num, x, y, image, name):
+    def _draw_character_option(self, canvas, char_num, x, y, image, name):
         """Dessine une option de personnage avec animations rock"""
         is_selected = self.selected_character == char_num
 
@@ -640,30 +633,27 @@ class MenuScene(Scene):
                 glow_surf = pygame.Surface((frame_rect.width + glow_offset * 2, frame_rect.height + glow_offset * 2), pygame.SRCALPHA)
                 glow_color = (255, 150, 0, glow_alpha)
                 pygame.draw.rect(glow_surf, glow_color, glow_surf.get_rect(), border_radius=15)
-                screen.blit(glow_surf, (frame_rect.x - glow_offset, frame_rect.y - glow_offset))
+                canvas.blit(glow_surf, (frame_rect.x - glow_offset, frame_rect.y - glow_offset))
 
             # Cadre principal
             frame_color = (255, int(150 + math.sin(self.anim_time * 8) * 105), 0)
-            pygame.draw.rect(screen, frame_color, frame_rect, 5, border_radius=12)
+            canvas.rect(frame_color, frame_rect, 5, border_radius=12)
         else:
-            pygame.draw.rect(screen, GRAY, frame_rect, 2, border_radius=12)
+            canvas.rect(GRAY, frame_rect, 2, border_radius=12)
 
         # Image
         if image:
             if is_selected:
                 new_width = int(img_width * (1 + scale_bonus))
                 new_height = int(img_height * (1 + scale_bonus))
-                scaled_img = pygame.transform.scale(image, (new_width, new_height))
-                rotated_img = pygame.transform.rotate(scaled_img, rotation)
-                img_rect = rotated_img.get_rect(center=(x, char_y))
-                screen.blit(rotated_img, img_rect)
+                canvas.blit_rotated(image, (x, char_y), rotation, (new_width, new_height))
             else:
                 img_rect = image.get_rect(center=(x, y))
-                screen.blit(image, img_rect)
+                canvas.blit(image, img_rect)
         else:
             placeholder_color = PURPLE if char_num == 1 else ORANGE
             placeholder_rect = pygame.Rect(x - img_width // 2, char_y - img_height // 2, img_width, img_height)
-            pygame.draw.rect(screen, placeholder_color, placeholder_rect, border_radius=5)
+            canvas.rect(placeholder_color, placeholder_rect, border_radius=5)
 
         # Nom
         name_y = frame_rect.bottom + 30
@@ -677,4 +667,4 @@ class MenuScene(Scene):
         else:
             name_text = self.font_menu.render(name, True, WHITE)
         name_rect = name_text.get_rect(center=(x, name_y))
-        screen.blit(name_text, name_rect)
+        canvas.text(name_text, name_rect)
@@ -6,12 +6,14 @@ Menu de pause identique au menu principal avec Reprendre, Touches, Quitter
 import pygame
 import math
 from scenes.base import Scene
+from assets import load_image
+from audio import get_audio_bank
 from settings import (
     WIDTH, HEIGHT, WHITE, YELLOW, GRAY, BLACK, ORANGE, RED,
-    STATE_GAMEPLAY, STATE_MENU, CONTROLS,
+    STATE_GAMEPLAY, STATE_MENU,
     IMG_DIR, IMG_PAUSE,
     FONT_METAL_MANIA, FONT_ROAD_RAGE,
-    SND_DIR, SND_MENU_CLICK, SND_CONFIRM_MENU,
+    SND_MENU_CLICK, SND_CONFIRM_MENU,
 )
 
 
@@ -53,6 +55,12 @@ def get_key_name(key):
 class PauseScene(Scene):
     """Scene de pause du jeu - identique au menu principal"""
 
+    # Affichee par-dessus le gameplay, qui reprend sans etre recharge
+    overlay = True
+
+    # Fond d'ecran au format de assets.load_image
+    BACKGROUND = (IMG_DIR / IMG_PAUSE, (WIDTH, HEIGHT), False)
+
     def __init__(self, game):
         super().__init__(game)
         self.font_title = None
@@ -74,24 +82,18 @@ class PauseScene(Scene):
         self.game_screenshot = None
 
         # Son de navigation
-        self.click_sfx = None
-        try:
-            self.click_sfx = pygame.mixer.Sound(str(SND_DIR / SND_MENU_CLICK))
-            self.click_sfx.set_volume(0.5)
-        except (pygame.error, FileNotFoundError):
-            pass
+        self.click_sfx = get_audio_bank().get(SND_MENU_CLICK, 0.5)
 
         # Son de confirmation
-        self.confirm_sfx = None
-        try:
-            self.confirm_sfx = pygame.mixer.Sound(str(SND_DIR / SND_CONFIRM_MENU))
-            self.confirm_sfx.set_volume(0.6)
-        except (pygame.error, FileNotFoundError):
-            pass
+        self.confirm_sfx = get_audio_bank().get(SND_CONFIRM_MENU, 0.6)
 
         # Animation
         self.anim_time = 0
 
+    def get_preload_assets(self, **kwargs):
+        """Fond d'ecran a precharger pendant la transition"""
+        return [self.BACKGROUND]
+
     def enter(self, **kwargs):
         """Initialisation a l'entree dans la pause"""
         try:
@@ -111,25 +113,27 @@ class PauseScene(Scene):
 
         # Charger l'image de pause ou capturer l'ecran
         try:
-            bg_path = IMG_DIR / IMG_PAUSE
-            self.background = pygame.image.load(str(bg_path)).convert()
-            self.background = pygame.transform.scale(self.background, (WIDTH, HEIGHT))
+            self.background = load_image(*self.BACKGROUND)
         except (pygame.error, FileNotFoundError):
             self.background = None
-            self.game_screenshot = self.game.screen.copy()
+            self.game_screenshot = self.game.capture_screen()
 
     def handle_event(self, event):
         """Gere les evenements du menu pause"""
-        if event.type == pygame.KEYDOWN:
-            # Attente d'une touche pour la configuration
-            if self.waiting_for_key:
+        # Attente d'une touche pour la configuration (clavier seulement)
+        if self.waiting_for_key:
+            if event.type == pygame.KEYDOWN:
                 self._set_new_key(event.key)
-                return
+            return
 
-            if self.menu_state == "main":
-                self._handle_main_menu(event)
-            elif self.menu_state == "controls":
-                self._handle_controls(event)
+        # Actions de l'appui: clavier, boutons, croix ou stick de la manette
+        actions = self.game.input_map.actions(event)
+        if not actions:
+            return
+        if self.menu_state == "main":
+            self._handle_main_menu(actions)
+        elif self.menu_state == "controls":
+            self._handle_controls(actions)
 
     def _play_click(self):
         """Joue le son de clic menu"""
@@ -141,15 +145,15 @@ class PauseScene(Scene):
         if self.confirm_sfx:
             self.confirm_sfx.play()
 
-    def _handle_main_menu(self, event):
+    def _handle_main_menu(self, actions):
         """Gere les inputs du menu principal pause"""
-        if event.key == pygame.K_UP:
+        if "up" in actions:
             self.selected_option = (self.selected_option - 1) % len(self.main_options)
             self._play_click()
-        elif event.key == pygame.K_DOWN:
+        elif "down" in actions:
             self.selected_option = (self.selected_option + 1) % len(self.main_options)
             self._play_click()
-        elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
+        elif "confirm" in actions:
             self._play_confirm()
             if self.selected_option == 0:  # Reprendre
                 self.game.change_scene(STATE_GAMEPLAY, resume=True)
@@ -158,21 +162,21 @@ class PauseScene(Scene):
                 self.controls_selected = 0
             elif self.selected_option == 2:  # Quitter
                 self.game.change_scene(STATE_MENU)
-        elif event.key == pygame.K_ESCAPE:
-            # Echap pour reprendre directement
+        elif "pause" in actions:
+            # Echap (ou Start) pour reprendre directement
             self.game.change_scene(STATE_GAMEPLAY, resume=True)
 
-    def _handle_controls(self, event):
+    def _handle_controls(self, actions):
         """Gere les inputs du menu de configuration des touches"""
         num_actions = len(CONFIGURABLE_ACTIONS)
 
-        if event.key == pygame.K_UP:
+        if "up" in actions:
             self.controls_selected = (self.controls_selected - 1) % (num_actions + 1)
             self._play_click()
-        elif event.key == pygame.K_DOWN:
+        elif "down" in actions:
             self.controls_selected = (self.controls_selected + 1) % (num_actions + 1)
             self._play_click()
-        elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
+        elif "confirm" in actions:
             if self.controls_selected < num_actions:
                 # Commencer a attendre une nouvelle touche
                 self.waiting_for_key = True
@@ -181,7 +185,7 @@ class PauseScene(Scene):
                 # Retour
                 self.menu_state = "main"
                 self.selected_option = 0
-        elif event.key == pygame.K_ESCAPE:
+        elif "pause" in actions:
             self.menu_state = "main"
             self.selected_option = 0
 
@@ -193,18 +197,23 @@ class PauseScene(Scene):
             self.key_to_change = None
             return
 
-        # Mettre a jour la touche (remplace la premiere touche)
-        if self.key_to_change and self.key_to_change in CONTROLS:
-            CONTROLS[self.key_to_change][0] = key
+        # Mettre a jour la touche (remplace la premiere touche, sauvegardee dans les preferences)
+        if self.key_to_change:
+            self.game.input_map.rebind(self.key_to_change, key)
 
         self.waiting_for_key = False
         self.key_to_change = None
 
+    def exit(self):
+        """Lache le fond et la capture d'ecran"""
+        self.background = None
+        self.game_screenshot = None
+
     def update(self, dt):
         """Mise a jour de l'animation"""
         self.anim_time += dt
 
-    def _draw_arrow(self, screen, x, y, color=YELLOW):
+    def _draw_arrow(self, canvas, x, y, color=YELLOW):
         """Dessine une fleche de selection (triangle)"""
         arrow_size = 12
         points = [
@@ -212,30 +221,31 @@ class PauseScene(Scene):
             (x, y + arrow_size // 2),
             (x + arrow_size, y)
         ]
-        pygame.draw.polygon(screen, color, points)
+        canvas.polygon(color, points)
 
-    def _draw_arrow_right(self, screen, x, y, color=YELLOW):
+    def _draw_arrow_right(self, canvas, x, y, color=YELLOW):
         """Dessine une fleche vers la gauche"""
         points = [(x, y - 8), (x, y + 8), (x - 12, y)]
-        pygame.draw.polygon(screen, color, points)
+        canvas.polygon(color, points)
 
     def draw(self, screen):
         """Dessine le menu pause"""
+        # Voile et menu dans l'overlay de Game (basse resolution avec --render-scale)
+        canvas = self.game.overlay.canvas()
+
         # Background
         if self.background:
             screen.blit(self.background, (0, 0))
         elif self.game_screenshot:
             screen.blit(self.game_screenshot, (0, 0))
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            screen.blit(overlay, (0, 0))
+            canvas.fill_alpha((0, 0, 0), 180)
 
         if self.menu_state == "main":
-            self._draw_main_menu(screen)
+            self._draw_main_menu(canvas)
         elif self.menu_state == "controls":
-            self._draw_controls(screen)
+            self._draw_controls(canvas)
 
-    def _draw_menu_box(self, screen, title, options, selected, y_start=250):
+    def _draw_menu_box(self, canvas, title, options, selected, y_start=250):
         """Dessine une boite de menu stylisee"""
         box_width = 500
         box_height = 100 + len(options) * 70
@@ -250,7 +260,7 @@ class PauseScene(Scene):
             alpha = 200 - int(y / box_height * 50)
             pygame.draw.line(box_surf, (30, 20, 40, alpha), (0, y), (box_width, y))
 
-        screen.blit(box_surf, (box_x, box_y))
+        canvas.blit(box_surf, (box_x, box_y))
 
         # Bordure animee
         border_color = (
@@ -258,15 +268,15 @@ class PauseScene(Scene):
             int(100 + math.sin(self.anim_time * 3) * 50),
             0
         )
-        pygame.draw.rect(screen, border_color, (box_x, box_y, box_width, box_height), 3, border_radius=10)
+        canvas.rect(border_color, (box_x, box_y, box_width, box_height), 3, border_radius=10)
 
         # Titre de la boite
         title_text = self.font_menu.render(title, True, YELLOW)
         title_rect = title_text.get_rect(center=(WIDTH // 2, box_y + 40))
-        screen.blit(title_text, title_rect)
+        canvas.text(title_text, title_rect)
 
         # Ligne sous le titre
-        pygame.draw.line(screen, YELLOW, (box_x + 30, box_y + 70), (box_x + box_width - 30, box_y + 70), 2)
+        canvas.line(YELLOW, (box_x + 30, box_y + 70), (box_x + box_width - 30, box_y + 70), 2)
 
         # Options
         for i, option in enumerate(options):
@@ -275,14 +285,12 @@ class PauseScene(Scene):
 
             if is_selected:
                 # Fond de selection
-                sel_surf = pygame.Surface((box_width - 60, 50), pygame.SRCALPHA)
-                sel_surf.fill((255, 200, 0, 80))
-                screen.blit(sel_surf, (box_x + 30, y - 8))
+                canvas.fill_alpha((255, 200, 0), 80, (box_x + 30, y - 8, box_width - 60, 50))
 
                 # Fleches animees
                 arrow_offset = math.sin(self.anim_time * 8) * 5
-                self._draw_arrow(screen, box_x + 45 + arrow_offset, y + 17)
-                self._draw_arrow_right(screen, box_x + box_width - 45 - arrow_offset, y + 17)
+                self._draw_arrow(canvas, box_x + 45 + arrow_offset, y + 17)
+                self._draw_arrow_right(canvas, box_x + box_width - 45 - arrow_offset, y + 17)
 
                 color = YELLOW
             else:
@@ -290,33 +298,33 @@ class PauseScene(Scene):
 
             text = self.font_menu.render(option, True, color)
             rect = text.get_rect(center=(WIDTH // 2, y + 17))
-            screen.blit(text, rect)
+            canvas.text(text, rect)
 
         return box_y + box_height
 
-    def _draw_main_menu(self, screen):
+    def _draw_main_menu(self, canvas):
         """Dessine le menu principal pause"""
         # Titre PAUSE avec effet
         title_text = self.font_title.render("PAUSE", True, YELLOW)
         shadow_text = self.font_title.render("PAUSE", True, (50, 30, 0))
         title_rect = title_text.get_rect(center=(WIDTH // 2, 130))
-        screen.blit(shadow_text, title_rect.move(4, 4))
-        screen.blit(title_text, title_rect)
+        canvas.text(shadow_text, title_rect.move(4, 4))
+        canvas.text(title_text, title_rect)
 
         # Boite de menu
-        self._draw_menu_box(screen, "MENU PAUSE", self.main_options, self.selected_option)
+        self._draw_menu_box(canvas, "MENU PAUSE", self.main_options, self.selected_option)
 
         # Instructions en bas
-        self._draw_instructions(screen, "↑↓ Naviguer  |  ENTREE Valider  |  ECHAP Reprendre")
+        self._draw_instructions(canvas, "↑↓ Naviguer  |  ENTREE Valider  |  ECHAP Reprendre")
 
-    def _draw_controls(self, screen):
+    def _draw_controls(self, canvas):
         """Dessine le menu de configuration des touches"""
         # Titre
         title_text = self.font_title.render("TOUCHES", True, YELLOW)
         shadow_text = self.font_title.render("TOUCHES", True, (50, 30, 0))
         title_rect = title_text.get_rect(center=(WIDTH // 2, 60))
-        screen.blit(shadow_text, title_rect.move(4, 4))
-        screen.blit(title_text, title_rect)
+        canvas.text(shadow_text, title_rect.move(4, 4))
+        canvas.text(title_text, title_rect)
 
         # Calculer la hauteur necessaire
         num_actions = len(CONFIGURABLE_ACTIONS)
@@ -331,13 +339,11 @@ class PauseScene(Scene):
         box_y = 110
 
         # Fond
-        box_surf = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
-        box_surf.fill((30, 20, 40, 220))
-        screen.blit(box_surf, (box_x, box_y))
+        canvas.fill_alpha((30, 20, 40), 220, (box_x, box_y, box_width, box_height))
 
         # Bordure
         border_color = (200, 100, 0)
-        pygame.draw.rect(screen, border_color, (box_x, box_y, box_width, box_height), 3, border_radius=10)
+        canvas.rect(border_color, (box_x, box_y, box_width, box_height), 3, border_radius=10)
 
         # Colonnes
         col1_x = box_x + 40  # Action
@@ -346,13 +352,13 @@ class PauseScene(Scene):
 
         # En-tete
         header_text = self.font_menu.render("Action", True, YELLOW)
-        screen.blit(header_text, (col1_x, box_y + 20))
+        canvas.text(header_text, (col1_x, box_y + 20))
         header_text2 = self.font_menu.render("Touche 1", True, YELLOW)
-        screen.blit(header_text2, (col2_x, box_y + 20))
+        canvas.text(header_text2, (col2_x, box_y + 20))
         header_text3 = self.font_menu.render("Touche 2", True, YELLOW)
-        screen.blit(header_text3, (col3_x, box_y + 20))
+        canvas.text(header_text3, (col3_x, box_y + 20))
 
-        pygame.draw.line(screen, YELLOW, (box_x + 20, box_y + 60), (box_x + box_width - 20, box_y + 60), 2)
+        canvas.line(YELLOW, (box_x + 20, box_y + 60), (box_x + box_width - 20, box_y + 60), 2)
 
         # Liste des actions
         for i, (action_key, action_name) in enumerate(CONFIGURABLE_ACTIONS):
@@ -360,58 +366,52 @@ class PauseScene(Scene):
             is_selected = i == self.controls_selected
 
             if is_selected:
-                sel_surf = pygame.Surface((box_width - 40, 42), pygame.SRCALPHA)
-                sel_surf.fill((255, 200, 0, 80))
-                screen.blit(sel_surf, (box_x + 20, y - 2))
+                canvas.fill_alpha((255, 200, 0), 80, (box_x + 20, y - 2, box_width - 40, 42))
 
             # Nom de l'action
             color = YELLOW if is_selected else WHITE
             name_text = self.font_small.render(action_name, True, color)
-            screen.blit(name_text, (col1_x, y + 10))
+            canvas.text(name_text, (col1_x, y + 10))
 
             # Touches actuelles
-            keys = CONTROLS.get(action_key, [])
+            keys = self.game.input_map.keys_for(action_key)
             if len(keys) > 0:
                 key1_name = get_key_name(keys[0])
                 if self.waiting_for_key and self.key_to_change == action_key:
                     key1_text = self.font_small.render("...", True, RED)
                 else:
                     key1_text = self.font_small.render(key1_name, True, color)
-                screen.blit(key1_text, (col2_x, y + 10))
+                canvas.text(key1_text, (col2_x, y + 10))
 
             if len(keys) > 1:
                 key2_name = get_key_name(keys[1])
                 key2_text = self.font_small.render(key2_name, True, GRAY)
-                screen.blit(key2_text, (col3_x, y + 10))
+                canvas.text(key2_text, (col3_x, y + 10))
 
         # Option Retour
         retour_y = box_y + header_height + num_actions * row_height + 10
         is_retour_selected = self.controls_selected == num_actions
 
         if is_retour_selected:
-            sel_surf = pygame.Surface((box_width - 40, 42), pygame.SRCALPHA)
-            sel_surf.fill((255, 200, 0, 80))
-            screen.blit(sel_surf, (box_x + 20, retour_y))
+            canvas.fill_alpha((255, 200, 0), 80, (box_x + 20, retour_y, box_width - 40, 42))
 
         retour_color = YELLOW if is_retour_selected else WHITE
         retour_text = self.font_menu.render("Retour", True, retour_color)
         text_y = retour_y + (42 - retour_text.get_height()) // 2
-        screen.blit(retour_text, (col1_x, text_y))
+        canvas.text(retour_text, (col1_x, text_y))
 
         # Message si en attente de touche
         if self.waiting_for_key:
             msg = self.font_small.render("Appuyez sur une touche... (ECHAP pour annuler)", True, RED)
             msg_rect = msg.get_rect(center=(WIDTH // 2, HEIGHT - 80))
-            screen.blit(msg, msg_rect)
+            canvas.text(msg, msg_rect)
         else:
-            self._draw_instructions(screen, "↑↓ Naviguer  |  ENTREE Modifier  |  ECHAP Retour")
+            self._draw_instructions(canvas, "↑↓ Naviguer  |  ENTREE Modifier  |  ECHAP Retour")
 
-    def _draw_instructions(self, screen, text):
+    def _draw_instructions(self, canvas, text):
         """Dessine les instructions en bas de l'ecran"""
-        inst_surf = pygame.Surface((WIDTH, 50), pygame.SRCALPHA)
-        inst_surf.fill((0, 0, 0, 150))
-        screen.blit(inst_surf, (0, HEIGHT - 50))
+        canvas.fill_alpha((0, 0, 0), 150, (0, HEIGHT - 50, WIDTH, 50))
 
         inst_text = self.font_small.render(text, True, WHITE)
         inst_rect = inst_text.get_rect(center=(WIDTH // 2, HEIGHT - 25))
-        screen.blit(inst_text, inst_rect)
+        canvas.text(inst_text, inst_rect)
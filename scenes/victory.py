@@ -8,7 +8,7 @@ import math
 from scenes.base import Scene
 from settings import (
     WIDTH, HEIGHT, WHITE, YELLOW, GREEN, PURPLE, GRAY, BLACK, ORANGE, BLUE,
-    STATE_MENU, STATE_LEVEL_SELECT, CONTROLS, BG_COLOR, DARK_GRAY,
+    STATE_MENU, STATE_LEVEL_SELECT, BG_COLOR, DARK_GRAY,
     FONT_METAL_MANIA, FONT_ROAD_RAGE
 )
 from level_loader import get_loader
@@ -19,7 +19,7 @@ class LevelNodeVictory:
 
     def __init__(self, level_data, x, y, unlocked=False, stars=0, is_completed=False):
         self.level_data = level_data
-        self.level_id = level_data['id']
+        self.level_id = level_data.id
         self.x = x
         self.y = y
         self.unlocked = unlocked
@@ -50,7 +50,7 @@ class LevelNodeVictory:
             color = YELLOW
             border_color = ORANGE
         else:
-            difficulty = self.level_data.get('difficulty', 'easy')
+            difficulty = self.level_data.difficulty
             if difficulty == 'easy':
                 color = GREEN
             elif difficulty == 'medium':
@@ -73,7 +73,7 @@ class LevelNodeVictory:
 
         # Nom du niveau en dessous
         if self.unlocked:
-            name_text = font_small.render(self.level_data['name'], True, WHITE)
+            name_text = font_small.render(self.level_data.name, True, WHITE)
             name_rect = name_text.get_rect(center=(self.x, self.y + self.radius + 25))
             screen.blit(name_text, name_rect)
 
@@ -191,7 +191,7 @@ class VictoryScene(Scene):
         for i, level_data in enumerate(levels):
             if i < len(self.node_positions):
                 x, y = self.node_positions[i]
-                level_id = level_data['id']
+                level_id = level_data.id
 
                 unlocked = self.loader.is_level_unlocked(level_id, completed_levels)
                 stars = level_stars.get(level_id, 0)
@@ -202,16 +202,16 @@ class VictoryScene(Scene):
 
     def handle_event(self, event):
         """Gere les evenements"""
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_UP:
-                self.selected_option = (self.selected_option - 1) % len(self.options)
-            elif event.key == pygame.K_DOWN:
-                self.selected_option = (self.selected_option + 1) % len(self.options)
-            elif event.key in CONTROLS["confirm"]:
-                if self.selected_option == 0:  # Continuer
-                    self.game.change_scene(STATE_LEVEL_SELECT)
-                else:  # Menu Principal
-                    self.game.change_scene(STATE_MENU)
+        actions = self.game.input_map.actions(event)
+        if "up" in actions:
+            self.selected_option = (self.selected_option - 1) % len(self.options)
+        elif "down" in actions:
+            self.selected_option = (self.selected_option + 1) % len(self.options)
+        elif "confirm" in actions:
+            if self.selected_option == 0:  # Continuer
+                self.game.change_scene(STATE_LEVEL_SELECT)
+            else:  # Menu Principal
+                self.game.change_scene(STATE_MENU)
 
     def update(self, dt):
         """Mise a jour des animations"""
@@ -13,6 +13,15 @@ WIDTH = 1280
 HEIGHT = 720
 FPS = 60
 TITLE = "Rockstar Bros"
+# Backend d'affichage: "software" (display.set_mode) ou "gpu" (SDL Renderer)
+DISPLAY_BACKENDS = ("software", "gpu")
+DISPLAY_BACKEND = "software"
+# Diviseur entier de resolution du decor du gameplay et des overlays des scenes
+# (2 = 640x360 agrandi x2)
+RENDER_SCALES = (1, 2, 4)
+RENDER_SCALE = 1
+# Textes des overlays (menus, ultime, intro boss) a la resolution native avec RENDER_SCALE > 1
+RENDER_NATIVE_TEXT = True
 
 # =============================================================================
 # COULEURS
@@ -61,6 +70,7 @@ FONT_ROAD_RAGE = FONTS_DIR / "Road_Rage.otf"
 # =============================================================================
 PLAYER_SPEED = 6
 PLAYER_JUMP_FORCE = 18
+JUMP_BUFFER_TIME = 120  # ms: un saut appuye juste avant d'atterrir est garde
 PLAYER_MAX_HEALTH = 3
 PLAYER_INVINCIBILITY_TIME = 1500  # ms apres degats
 PLAYER_WIDTH = 64
@@ -96,13 +106,20 @@ ULTIMATE_NOTE_COUNT = 8  # Nombre de notes dans la sequence
 # SYSTEME RYTHME (Guitar Hero) - UNIQUEMENT POUR L'ULTIME
 # =============================================================================
 # Vitesse des notes (plus c'est bas, plus c'est lent)
-NOTE_FALL_SPEED = 4  # pixels par frame
-NOTE_SPAWN_INTERVAL = 800  # ms entre chaque note (plus c'est haut, plus c'est lent)
+NOTE_FALL_SPEED = 0.24  # pixels par ms (4 pixels par frame a 60 FPS)
 
-# Zones de timing (distance en pixels depuis la ligne de frappe)
-HIT_ZONE_PERFECT = 15  # pixels
-HIT_ZONE_GOOD = 35  # pixels
-HIT_ZONE_OK = 55  # pixels
+# Partition de l'ultime: fichier de beat map s'il existe, sinon notes
+# aleatoires sur chaque temps au tempo ULTIMATE_CHART_BPM
+# Format du fichier: {"bpm": 75, "notes": [[temps, piste], ...]} (temps en beats)
+ULTIMATE_CHART_FILE = ASSETS_DIR / "charts" / "ultimate.json"
+ULTIMATE_CHART_BPM = 75  # 800 ms entre chaque note
+# Volume du bip joue sur chaque note (cale sur la latence audio calibree)
+ULTIMATE_CUE_VOLUME = 0.4
+
+# Fenetres de jugement (ecart en ms entre l'appui et la note)
+HIT_WINDOW_PERFECT = 60  # ms
+HIT_WINDOW_GOOD = 145  # ms
+HIT_WINDOW_OK = 230  # ms
 
 # Dimensions des notes et pistes
 NOTE_SIZE = 50  # taille des notes (cercles)
@@ -114,9 +131,14 @@ TRACK_X = (WIDTH - TRACK_WIDTH) // 2  # position X centree
 TRACK_Y = 150  # position Y du haut de la piste
 HIT_LINE_Y = TRACK_Y + TRACK_HEIGHT - 60  # ligne de frappe
 
+# Calibration de la latence (tap test)
+CALIBRATION_BEAT_INTERVAL = 600  # ms entre deux battements
+CALIBRATION_TAPS = 8  # taps gardes par test (les premiers sont ignores)
+CALIBRATION_MAX_OFFSET = 250  # ms, taps plus eloignes du battement ignores
+
 # Couleurs des pistes (F=rouge, G=jaune, H=bleu)
 LANE_COLORS = [(255, 80, 80), (255, 220, 80), (80, 180, 255)]
-LANE_KEYS = [pygame.K_f, pygame.K_g, pygame.K_h]  # Touches F, G, H
+LANE_ACTIONS = ["lane_0", "lane_1", "lane_2"]  # Actions des pistes (voir CONTROLS)
 
 # =============================================================================
 # ENNEMIS
@@ -188,6 +210,10 @@ BOSS3_ATTACK_COOLDOWN = 1900  # ms - Encore plus rapide
 BOSS3_SHOCKWAVE_DAMAGE = 1
 BOSS3_SCORE = 2500
 
+# Types supportes par Enemy / Boss (valides au chargement des niveaux)
+ENEMY_TYPES = ("hater", "hater_flying", "rival", "rival_shooter")
+BOSS_TYPES = ("boss", "boss2", "boss3")
+
 # Phases du boss (% de vie restante)
 BOSS_PHASE_2_THRESHOLD = 0.6  # 60% vie
 BOSS_PHASE_3_THRESHOLD = 0.3  # 30% vie
@@ -200,6 +226,7 @@ PICKUP_MEDIATOR_ULTIMATE = 25  # Charge ultime
 PICKUP_AMPLI_DURATION = 5000  # ms de boost
 PICKUP_WIDTH = 52
 PICKUP_HEIGHT = 52
+PICKUP_TYPES = ("note", "mediator", "ampli", "health")
 
 # =============================================================================
 # EASTER EGG - MYSTERY BLOCK & STAR POWER
@@ -208,11 +235,72 @@ MYSTERY_BLOCK_SIZE = 52  # Same as pickup for consistency
 STAR_SIZE = 48
 STAR_SPAWN_VELOCITY = -8  # Initial upward velocity when spawned
 STAR_MODE_DURATION = 8000  # 8 seconds of invincibility
+STAR_SPIN_FRAMES = 24  # Pre-baked frames for one full spin
 
 # =============================================================================
 # NIVEAUX
 # =============================================================================
 LEVEL_NAMES = ["Centre-ville", "Scene", "Boss Arena"]
+LEVELS_DIR = BASE_DIR / "levels"
+# Cache des metadonnees des niveaux (hash + schema), regenere au besoin, non versionne
+LEVEL_MANIFEST_FILE = BASE_DIR / "cache" / "levels_index.json"
+# Preferences locales du joueur (calibration...), non versionnees
+PREFERENCES_FILE = BASE_DIR / "preferences.json"
+# Mode developpement --hot-reload: intervalle de verification des fichiers (ms)
+HOT_RELOAD_POLL_INTERVAL = 500
+# Mode --profile-startup: budget jusqu'a la premiere image (ms) et trace JSON ecrite
+STARTUP_BUDGET_MS = 1500
+STARTUP_TRACE_FILE = BASE_DIR / "startup_trace.json"
+# Mode --trace: evenements gardes en memoire, ecrits sur F4 ou apres une frame
+# plus longue que TRACE_HITCH_MS (au plus une ecriture par TRACE_HITCH_COOLDOWN_MS)
+TRACE_BUFFER_EVENTS = 20000
+TRACE_HITCH_MS = 50
+TRACE_HITCH_COOLDOWN_MS = 2000
+TRACE_DIR = BASE_DIR / "traces"
+# Telemetrie des frames (bornes sans surveillance): journal local tournant,
+# une ligne JSON toutes les TELEMETRY_INTERVAL secondes (desactivable: --no-telemetry)
+TELEMETRY_ENABLED = True
+TELEMETRY_FILE = BASE_DIR / "telemetry" / "frames.log"
+TELEMETRY_MAX_BYTES = 1_000_000
+TELEMETRY_BACKUPS = 5
+TELEMETRY_INTERVAL = 60
+TELEMETRY_BUDGET_MS = 20  # frame hors budget (16.7 ms a 60 FPS, plus une marge)
+TELEMETRY_HITCH_MS = 50  # saccade: contexte enregistre
+TELEMETRY_MAX_HITCHES = 20  # contextes gardes par periode
+# Mode --track-allocations: snapshot tracemalloc toutes les ALLOC_TRACK_FRAMES frames,
+# ALLOC_TRACK_TOP lignes affichees, ALLOC_TRACK_DEPTH appels gardes par allocation
+ALLOC_TRACK_FRAMES = 300
+ALLOC_TRACK_TOP = 15
+ALLOC_TRACK_DEPTH = 1
+# Ramasse-miettes du gameplay (voir allocations.GcPolicy, desactivable: --no-gc-policy):
+# seuils pendant les stages, la generation 2 n'est collectee qu'aux transitions
+GC_POLICY_ENABLED = True
+GC_GAMEPLAY_THRESHOLDS = (700, 20, 1_000_000)
+# Simulation headless (tools/balance_sweep.py): duree de jeu maximum d'un stage (s)
+SIM_MAX_TIME_S = 300
+# Bot de simulation (voir bot.py): portee de tir, distance de reaction aux ennemis
+# volants et distance gardee avec le boss (px)
+BOT_SHOOT_RANGE = 600
+BOT_THREAT_RANGE = 250
+BOT_BOSS_DISTANCE = 450
+BOT_MAX_AIR_FRAMES = 120  # duree maximum d'un saut simule
+BOT_MAX_NODES = 20000  # positions explorees au plus par recherche de chemin
+BOT_JUMP_COST = 30  # frames ajoutees au cout d'un saut: marcher (et tirer) quand c'est possible
+BOT_SAFETY_FRAMES = 30  # frames de trajectoire verifiees contre les ennemis et projectiles
+BOT_MAX_WAIT_FRAMES = 90  # attente maximum avant un saut dangereux
+BOT_HUNT_RANGE = 450  # distance d'un tireur hors de la ligne de tir que le bot va chercher (px)
+BOT_HUNT_FRAMES = 240  # longueur maximum (frames) du detour pour aller le chercher
+BOT_STUCK_FRAMES = 600  # frames sans progresser avant de foncer sans attendre ni detour
+BOT_RUSH_FRAMES = 180  # duree de cette course (frames)
+# Budgets memoire (octets) des caches vides au-dela (voir resources), verifies apres
+# chaque entree dans une scene; None = pas de limite
+MEMORY_BUDGETS = {
+    "images": 128 * 1024 * 1024,
+    "ennemis": 32 * 1024 * 1024,
+    "sons": 48 * 1024 * 1024,
+    "niveaux": 4 * 1024 * 1024,
+}
+LEVEL_DIFFICULTIES = ("easy", "medium", "hard")
 
 # Checkpoints (positions X pour chaque niveau)
 CHECKPOINT_POSITIONS = {
@@ -233,6 +321,8 @@ LEVEL_LENGTHS = {
 # =============================================================================
 CAMERA_FOLLOW_SPEED = 0.1
 CAMERA_DEAD_ZONE_X = 200  # Zone ou la camera ne bouge pas
+# Largeur des morceaux pre-rendus de la geometrie statique (sol + plateformes)
+GEOMETRY_CHUNK_WIDTH = WIDTH
 
 # =============================================================================
 # UI / HUD
@@ -242,6 +332,11 @@ HUD_HEALTH_SIZE = 40
 HUD_FONT_SIZE = 24
 HUD_TITLE_FONT_SIZE = 48
 
+# Animations pre-rendues (titres pulses, zooms): pas de quantification de l'echelle
+ANIM_SCALE_STEP = 0.02
+# Tailles transformees (zoom, miroir) gardees par image par le canevas logiciel
+ANIM_ZOOM_CACHE_FRAMES = 3
+
 # =============================================================================
 # SONS (noms des fichiers)
 # =============================================================================
@@ -267,6 +362,24 @@ SND_BOSS_LAUGH_3 = "rire_boss3.wav"
 SND_SHOOT_BOSS = "shoot_boss.wav"
 SND_BOSS_STEPS = "boss_steps.wav"
 
+# Configuration du mixer (pygame.mixer.pre_init): un petit buffer reduit la latence
+# de sortie (512 echantillons a 44.1 kHz = ~12 ms), trop petit = craquements
+AUDIO_FREQUENCY = 44100
+AUDIO_SIZE = -16  # 16 bits signes
+AUDIO_OUTPUT_CHANNELS = 2  # stereo
+AUDIO_BUFFER = 512
+
+# Format produit par tools/build_audio.py, prefere au WAV quand il existe
+COMPRESSED_AUDIO_SUFFIX = ".ogg"
+
+# Canaux du mixer: les premiers sont reserves aux sons en boucle
+AUDIO_CHANNELS = 16
+AUDIO_LOOP_CHANNEL_RUN = 0
+AUDIO_LOOP_CHANNEL_BOSS_STEPS = 1
+AUDIO_RESERVED_CHANNELS = 2
+# Nombre max de lectures simultanees d'un meme son (tirs rapides, etc.)
+AUDIO_MAX_VOICES = 3
+
 # =============================================================================
 # IMAGES (noms des fichiers)
 # =============================================================================
@@ -393,6 +506,7 @@ STATE_GAMEPLAY = "gameplay"
 STATE_PAUSE = "pause"
 STATE_GAME_OVER = "game_over"
 STATE_VICTORY = "victory"
+STATE_CALIBRATION = "calibration"
 
 # =============================================================================
 # CONTROLES
@@ -404,9 +518,31 @@ CONTROLS = {
     "crouch": [pygame.K_DOWN, pygame.K_s],
     "attack": [pygame.K_j],
     "ultimate": [pygame.K_k],
+    "lane_0": [pygame.K_f],
+    "lane_1": [pygame.K_g],
+    "lane_2": [pygame.K_h],
     "pause": [pygame.K_ESCAPE],
     "confirm": [pygame.K_RETURN, pygame.K_SPACE],
+    # Navigation dans les menus (croix ou stick gauche a la manette)
+    "up": [pygame.K_UP, pygame.K_w],
+    "down": [pygame.K_DOWN, pygame.K_s],
     "debug_hitbox": [pygame.K_F1],
     "debug_skip": [pygame.K_F2],
     "debug_invincible": [pygame.K_F3],
+    "debug_trace": [pygame.K_F4],
+}
+
+# Manette (boutons au format XInput: 0=A, 1=B, 2=X, 3=Y, 4=LB, 5=RB, 7=Start)
+GAMEPAD_BUTTONS = {
+    "jump": [0],
+    "attack": [2],
+    "ultimate": [3],
+    # Pistes de l'ultime: LB, B, RB (gauche, milieu, droite), aucun bouton partage
+    "lane_0": [4],
+    "lane_1": [1],
+    "lane_2": [5],
+    "pause": [7],
+    "confirm": [0],
 }
+# Zone morte du stick gauche (deplacement et accroupissement)
+GAMEPAD_AXIS_DEADZONE = 0.5
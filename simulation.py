@@ -0,0 +1,249 @@
+"""
+Rockstar Bros - Simulation headless du gameplay
+Joue un stage sans fenetre ni son, sur une horloge simulee (aussi vite que le
+CPU le permet), avec des entrees scriptees et des reglages de settings modifies.
+Utilise par tools/balance_sweep.py pour les campagnes d'equilibrage.
+"""
+
+import ast
+import json
+import os
+import random
+import sys
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import pygame
+
+import rhythm
+import settings
+from settings import (
+    BASE_DIR, FPS, WIDTH, HEIGHT, STATE_GAME_OVER, STATE_LEVEL_SELECT, SIM_MAX_TIME_S,
+)
+from input_map import InputMap
+
+
+# Entrees predefinies (voir ScriptedController): maintenues + appuis periodiques
+SCRIPTS = {
+    "idle": [],
+    "run": [
+        {"at": 0, "hold": ["right"]},
+        {"at": 0, "every": 350, "press": ["attack"]},
+        {"at": 200, "every": 900, "press": ["jump"]},
+    ],
+}
+
+
+class SimClock:
+    """Horloge simulee en millisecondes, avancee d'une frame a chaque pas"""
+
+    def __init__(self):
+        self.ms = 0.0
+
+    def __call__(self) -> float:
+        """Secondes (meme unite que time.perf_counter, voir rhythm.set_clock)"""
+        return self.ms / 1000
+
+
+class SimulatedInput(InputMap):
+    """InputMap dont les actions maintenues viennent du controleur et pas du clavier"""
+
+    def __init__(self):
+        super().__init__(persist=False)
+        self.hold: FrozenSet[str] = frozenset()
+
+    def update(self, keys=None):
+        """Actions maintenues de la frame: celles choisies par le controleur"""
+        self.held_actions = self.hold
+
+
+class ScriptedController:
+    """
+    Entrees scriptees. Chaque etape: {"at": ms, "hold": [actions]} remplace les actions
+    maintenues a partir de "at"; {"at": ms, "press": [actions], "every": ms} appuie
+    une fois (ou toutes les "every" ms) a partir de "at".
+    """
+
+    def __init__(self, steps: List[dict]):
+        self.steps = sorted(steps, key=lambda step: step.get("at", 0))
+        self.hold: FrozenSet[str] = frozenset()
+        self.next_press: Dict[int, float] = {}
+
+    def reset(self, scene):
+        """Debut d'une simulation"""
+        self.hold = frozenset()
+        self.next_press = {index: step.get("at", 0) for index, step in enumerate(self.steps)
+                           if "press" in step}
+
+    def step(self, scene, now_ms) -> Tuple[FrozenSet[str], Iterable[str]]:
+        """Actions maintenues et actions appuyees pour la frame"""
+        for step in self.steps:
+            if "hold" in step and step.get("at", 0) <= now_ms:
+                self.hold = frozenset(step["hold"])
+        pressed = []
+        for index, at in list(self.next_press.items()):
+            if at <= now_ms:
+                step = self.steps[index]
+                pressed.extend(step["press"])
+                if step.get("every"):
+                    self.next_press[index] = at + step["every"]
+                else:
+                    del self.next_press[index]
+        return self.hold, pressed
+
+
+def make_controller(name):
+    """Controleur par nom ("bot", SCRIPTS) ou chemin d'un script JSON (liste d'etapes)"""
+    if name == "bot":
+        from bot import BotController
+        return BotController()
+    if name in SCRIPTS:
+        return ScriptedController(SCRIPTS[name])
+    with open(name, encoding="utf-8") as f:
+        return ScriptedController(json.load(f))
+
+
+class HeadlessGame:
+    """Ce que GameplayScene utilise de Game, sans fenetre ni changement de scene"""
+
+    def __init__(self, character_id=1):
+        from main import new_game_data
+        self.game_data = new_game_data()
+        self.game_data["selected_character"] = character_id
+        self.input_map = SimulatedInput()
+        self.render_scale = 1
+        self.gc_policy = None
+        # Scene demandee par le gameplay (fin de la simulation)
+        self.requested_scene: Optional[str] = None
+
+    def change_scene(self, scene_name, resume=False, **kwargs):
+        """Le gameplay veut changer de scene: memorise et arrete la simulation"""
+        self.requested_scene = scene_name
+
+    def apply_gc_policy(self, scene):
+        """Pas de politique de ramasse-miettes en simulation"""
+
+
+def init_headless():
+    """Initialise pygame sans fenetre ni sortie son (aussi l'initializer des processus)"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    # Les chemins des niveaux et assets sont relatifs au dossier du jeu
+    os.chdir(BASE_DIR)
+    if str(BASE_DIR) not in sys.path:
+        sys.path.insert(0, str(BASE_DIR))
+    pygame.init()
+    # convert_alpha() a besoin d'un mode video
+    pygame.display.set_mode((WIDTH, HEIGHT))
+
+
+def parse_override(text) -> Tuple[str, object]:
+    """Texte NOM=valeur -> (NOM, valeur Python); ValueError si NOM n'est pas dans settings"""
+    name, sep, value = text.partition("=")
+    name = name.strip()
+    if not sep or not hasattr(settings, name):
+        raise ValueError(f"Reglage inconnu: {text!r}")
+    try:
+        return name, ast.literal_eval(value.strip())
+    except (ValueError, SyntaxError):
+        return name, value.strip()
+
+
+def apply_overrides(overrides: Dict[str, object]) -> Dict[str, object]:
+    """
+    Remplace des constantes de settings, y compris dans les modules du jeu qui les
+    ont importees (from settings import ...). Retourne les valeurs d'origine.
+    """
+    original = {}
+    for name, value in overrides.items():
+        if not hasattr(settings, name):
+            raise ValueError(f"Reglage inconnu: {name}")
+        original[name] = getattr(settings, name)
+        for module in list(sys.modules.values()):
+            path = getattr(module, "__file__", None) or ""
+            if path.startswith(str(BASE_DIR)) and getattr(module, name, None) is original[name]:
+                setattr(module, name, value)
+    if overrides:
+        # Les images des ennemis sont mises a l'echelle de leurs tailles
+        from entities.enemy import Enemy
+        Enemy.evict_image_cache(sys.maxsize)
+    return original
+
+
+def run_simulation(level_id, stage_id, controller="run", seed=0, overrides=None,
+                   character_id=1, max_time_s=SIM_MAX_TIME_S) -> dict:
+    """
+    Joue un stage jusqu'a sa fin, la mort du joueur ou max_time_s secondes de jeu.
+
+    Returns:
+        Resultat: outcome ("clear", "death", "timeout"), temps, degats, score, morts
+    """
+    from scenes.gameplay import GameplayScene
+
+    overrides = overrides or {}
+    original = apply_overrides(overrides)
+    clock = SimClock()
+    rhythm.set_clock(clock)
+    random.seed(seed)
+    try:
+        game = HeadlessGame(character_id)
+        game.game_data["selected_level"] = level_id
+        game.game_data["current_stage"] = stage_id
+        scene = GameplayScene(game)
+        scene.enter(level_id=level_id, stage_id=stage_id)
+        control = make_controller(controller) if isinstance(controller, str) else controller
+        control.reset(scene)
+
+        dt_ms = 1000 / FPS
+        health = scene.player.health
+        damage_taken = 0
+        frames = 0
+        outcome = "timeout"
+        while clock.ms < max_time_s * 1000:
+            # Actions appuyees: touche enfoncee avant la frame, relachee apres
+            hold, pressed = control.step(scene, clock.ms)
+            keys = [game.input_map.keys_for(action)[0] for action in pressed
+                    if game.input_map.keys_for(action)]
+            for key in keys:
+                scene.handle_event(pygame.event.Event(
+                    pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0, input_time=clock.ms))
+            game.input_map.hold = frozenset(hold)
+            scene.update(dt_ms / 1000)
+            for key in keys:
+                scene.handle_event(pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode="", scancode=0))
+            frames += 1
+            clock.ms += dt_ms
+
+            if scene.player.health < health:
+                damage_taken += health - scene.player.health
+            health = scene.player.health
+
+            if game.requested_scene == STATE_GAME_OVER:
+                outcome = "death"
+                break
+            # Fin du stage: stage suivant, retour a la carte ou boss vaincu
+            if (game.requested_scene == STATE_LEVEL_SELECT or scene.current_stage_id != stage_id
+                    or scene.celebration_active):
+                outcome = "clear"
+                break
+            if game.requested_scene is not None:
+                outcome = game.requested_scene
+                break
+
+        result = {
+            "level": level_id,
+            "stage": stage_id,
+            "controller": controller if isinstance(controller, str) else type(controller).__name__,
+            "seed": seed,
+            "outcome": outcome,
+            "clear_time_s": round(clock.ms / 1000, 2) if outcome == "clear" else None,
+            "sim_time_s": round(clock.ms / 1000, 2),
+            "frames": frames,
+            "damage_taken": damage_taken,
+            "score": game.game_data["score"],
+            "deaths": 1 if outcome == "death" else 0,
+        }
+        scene.exit()
+        return result
+    finally:
+        rhythm.set_clock(None)
+        apply_overrides(original)
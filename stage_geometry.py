@@ -0,0 +1,77 @@
+"""
+Rockstar Bros - Geometrie statique pre-rendue
+Le sol et les plateformes d'un stage sont dessines une seule fois dans une
+rangee de surfaces de la largeur de l'ecran
+"""
+
+from typing import List, Optional, Tuple
+
+import pygame
+
+from settings import HEIGHT, GEOMETRY_CHUNK_WIDTH
+
+
+class StageGeometry:
+    """
+    Morceaux pre-rendus de la geometrie fixe d'un stage.
+    Chaque morceau est recadre verticalement sur ce qu'il contient
+    (None si le morceau est vide, par exemple au-dessus d'un trou).
+    """
+
+    def __init__(self, platforms, level_width, chunk_width=GEOMETRY_CHUNK_WIDTH, scale=1):
+        """
+        Args:
+            platforms: Sprites fixes (image + rect) a pre-rendre
+            level_width: Largeur du stage en pixels
+            chunk_width: Largeur d'un morceau
+            scale: Diviseur entier de resolution (2 = morceaux a demi-resolution)
+        """
+        self.chunk_width = chunk_width
+        self.scale = scale
+        platforms = list(platforms)
+        right = max([level_width] + [p.rect.right for p in platforms])
+        chunk_count = max(1, -(-right // chunk_width))
+        self.chunks: List[Optional[Tuple[pygame.Surface, int]]] = [
+            self._render_chunk(platforms, index * chunk_width) for index in range(chunk_count)
+        ]
+        if scale > 1:
+            self.chunks = [self._reduce(chunk) for chunk in self.chunks]
+            self.chunk_width //= scale
+
+    def _reduce(self, chunk):
+        """Morceau reduit pour un rendu basse resolution"""
+        if chunk is None:
+            return None
+        surface, top = chunk
+        width, height = surface.get_size()
+        # Bords alignes sur scale par _render_chunk: position exacte apres reduction
+        size = (width // self.scale, height // self.scale)
+        return (pygame.transform.smoothscale(surface, size), top // self.scale)
+
+    def _render_chunk(self, platforms, chunk_x):
+        """Dessine les plateformes qui touchent un morceau"""
+        area = pygame.Rect(chunk_x, 0, self.chunk_width, HEIGHT)
+        visible = [p for p in platforms if p.rect.colliderect(area)]
+        if not visible:
+            return None
+
+        top = max(0, min(p.rect.top for p in visible))
+        bottom = min(HEIGHT, max(p.rect.bottom for p in visible))
+        # Haut et bas sur des multiples de scale (pixels entiers une fois reduit)
+        top -= top % self.scale
+        bottom = min(HEIGHT, bottom + -bottom % self.scale)
+        surface = pygame.Surface((self.chunk_width, bottom - top), pygame.SRCALPHA)
+        surface.blits([(p.image, p.rect.move(-chunk_x, -top)) for p in visible], doreturn=False)
+        return (surface, top)
+
+    def draw(self, screen, camera_x):
+        """Dessine les 1 ou 2 morceaux visibles (camera_x a la resolution des morceaux)"""
+        # Meme arrondi que rect.move(-camera_x, 0) pour rester aligne avec les sprites
+        offset = int(-camera_x)
+        first = max(0, -offset // self.chunk_width)
+        last = min(len(self.chunks) - 1, (screen.get_width() - 1 - offset) // self.chunk_width)
+        for index in range(first, last + 1):
+            chunk = self.chunks[index]
+            if chunk is not None:
+                surface, top = chunk
+                screen.blit(surface, (index * self.chunk_width + offset, top))
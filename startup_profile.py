@@ -0,0 +1,176 @@
+"""
+Rockstar Bros - Profil du demarrage (mode --profile-startup)
+Mesure les imports, l'init de pygame, les polices, le decodage des images et
+la construction des scenes jusqu'a la premiere image affichee.
+Ce module n'importe ni pygame ni settings: il doit pouvoir s'activer avant eux.
+"""
+
+import builtins
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+
+class StartupProfiler:
+    """Intervalles mesures (categorie, nom, debut, duree) sur perf_counter"""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.events = []  # (categorie, nom, debut_ms, duree_ms, duree_propre_ms, thread)
+        self._lock = threading.Lock()
+        # Pile par thread des intervalles ouverts: duree cumulee de leurs enfants
+        self._local = threading.local()
+        self._original_import = None
+
+    def _now_ms(self):
+        """Temps depuis l'activation (ms)"""
+        return (time.perf_counter() - self.origin) * 1000
+
+    def _stack(self):
+        """Pile du thread courant"""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _begin(self):
+        """Ouvre un intervalle, retourne son debut"""
+        self._stack().append(0.0)
+        return self._now_ms()
+
+    def _end(self, category, name, start_ms):
+        """Ferme l'intervalle ouvert: temps cumule et temps propre (sans les enfants)"""
+        duration = self._now_ms() - start_ms
+        stack = self._stack()
+        children = stack.pop()
+        if stack:
+            stack[-1] += duration
+        event = (category, name, start_ms, duration, duration - children, threading.get_ident())
+        with self._lock:
+            self.events.append(event)
+
+    @contextmanager
+    def span(self, category, name):
+        """Mesure le bloc with"""
+        start = self._begin()
+        try:
+            yield
+        finally:
+            self._end(category, name, start)
+
+    # --- Imports ---
+
+    def install_import_hook(self):
+        """Chronometre chaque premier import de module (temps propre et cumule)"""
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def remove_import_hook(self):
+        """Remet l'import d'origine"""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import
+        # Deja importe (cas courant): pas de mesure
+        if level or name in sys.modules or threading.current_thread() is not threading.main_thread():
+            return original(name, globals, locals, fromlist, level)
+
+        start = self._begin()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            self._end("import", name, start)
+
+    # --- Resultats ---
+
+    def total_ms(self):
+        """Temps ecoule depuis l'activation"""
+        return self._now_ms()
+
+    def report(self, budget_ms=None, limit=25):
+        """Rapport texte: total par categorie puis intervalles les plus longs (temps propre)"""
+        total = self.total_ms()
+        lines = [f"Demarrage: {total:.0f} ms jusqu'a la premiere image"
+                 + (f" (budget {budget_ms} ms)" if budget_ms else "")]
+
+        main_thread = threading.main_thread().ident
+        by_category = {}
+        for category, _, _, _, self_ms, thread in self.events:
+            if thread == main_thread:
+                by_category[category] = by_category.get(category, 0.0) + self_ms
+        lines.append("Par categorie (thread principal):")
+        for category, ms in sorted(by_category.items(), key=lambda item: -item[1]):
+            lines.append(f"  {category:<8} {ms:8.1f} ms")
+
+        lines.append(f"Les {limit} plus longs:")
+        longest = sorted(self.events, key=lambda event: -event[4])[:limit]
+        for category, name, _, duration, self_ms, thread in longest:
+            where = "" if thread == main_thread else "  [thread]"
+            lines.append(f"  {self_ms:8.1f} ms  {category:<8} {name}"
+                         + (f"  (cumule {duration:.1f} ms)" if duration - self_ms > 0.05 else "") + where)
+        return "\n".join(lines)
+
+    def write_trace(self, path):
+        """Ecrit les intervalles au format Chrome trace (chrome://tracing, Perfetto)"""
+        events = [{
+            "name": name, "cat": category, "ph": "X",
+            "ts": round(start * 1000, 1), "dur": round(duration * 1000, 1),
+            "pid": 1, "tid": thread,
+        } for category, name, start, duration, _, thread in self.events]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+_profiler = None
+
+
+def enable():
+    """Active le profil (a appeler avant les imports a mesurer)"""
+    global _profiler
+    if _profiler is None:
+        _profiler = StartupProfiler()
+        _profiler.install_import_hook()
+    return _profiler
+
+
+def is_enabled():
+    """True si le profil est en cours"""
+    return _profiler is not None
+
+
+def span(category, name):
+    """Mesure un bloc with si le profil est actif (sinon ne fait rien)"""
+    if _profiler is None:
+        return nullcontext()
+    return _profiler.span(category, name)
+
+
+def finish(trace_path, budget_ms):
+    """
+    Termine le profil: affiche le rapport et ecrit la trace JSON.
+
+    Returns:
+        True si le demarrage tient dans le budget
+    """
+    global _profiler
+    profiler = _profiler
+    if profiler is None:
+        return True
+    _profiler = None
+    profiler.remove_import_hook()
+
+    print(profiler.report(budget_ms))
+    try:
+        profiler.write_trace(trace_path)
+        print(f"Trace ecrite dans {trace_path}")
+    except OSError as e:
+        print(f"Impossible d'ecrire la trace: {e}")
+
+    within = profiler.total_ms() <= budget_ms
+    if not within:
+        print(f"Budget de demarrage depasse ({profiler.total_ms():.0f} ms > {budget_ms} ms)")
+    return within
@@ -0,0 +1,167 @@
+"""
+Rockstar Bros - Telemetrie des frames
+Histogrammes de temps de frame par scene (p50/p95/p99/max), frames hors budget
+et contexte des saccades, ajoutes periodiquement a un journal local tournant
+(une ligne JSON par periode). Aucun acces reseau.
+"""
+
+import json
+import logging
+import logging.handlers
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from settings import (
+    TELEMETRY_FILE, TELEMETRY_MAX_BYTES, TELEMETRY_BACKUPS, TELEMETRY_INTERVAL,
+    TELEMETRY_BUDGET_MS, TELEMETRY_HITCH_MS, TELEMETRY_MAX_HITCHES,
+)
+
+
+# Histogramme: cases de 0.5 ms jusqu'a 100 ms, puis une case "au-dela"
+BUCKET_MS = 0.5
+BUCKET_COUNT = 200
+
+
+class FrameHistogram:
+    """Temps de frame d'une scene, par cases de BUCKET_MS (memoire constante)"""
+
+    def __init__(self):
+        self.buckets = [0] * (BUCKET_COUNT + 1)
+        self.count = 0
+        self.max_ms = 0.0
+        self.over_budget = 0
+
+    def add(self, frame_ms):
+        """Ajoute une frame"""
+        self.buckets[min(int(frame_ms / BUCKET_MS), BUCKET_COUNT)] += 1
+        self.count += 1
+        if frame_ms > self.max_ms:
+            self.max_ms = frame_ms
+        if frame_ms > TELEMETRY_BUDGET_MS:
+            self.over_budget += 1
+
+    def percentile(self, fraction) -> float:
+        """Borne haute de la case contenant le percentile (max pour la derniere case)"""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= target:
+                if index == BUCKET_COUNT:
+                    return self.max_ms
+                return min((index + 1) * BUCKET_MS, self.max_ms)
+        return self.max_ms
+
+    def summary(self) -> dict:
+        """Resume compact pour le journal"""
+        return {
+            "frames": self.count,
+            "p50": round(self.percentile(0.50), 1),
+            "p95": round(self.percentile(0.95), 1),
+            "p99": round(self.percentile(0.99), 1),
+            "max": round(self.max_ms, 1),
+            "over_budget": self.over_budget,
+        }
+
+
+class Telemetry:
+    """Collecte par periode de TELEMETRY_INTERVAL secondes, puis ecriture d'une ligne"""
+
+    def __init__(self, path=TELEMETRY_FILE, interval=TELEMETRY_INTERVAL):
+        """
+        Args:
+            path: Journal (tourne a TELEMETRY_MAX_BYTES, TELEMETRY_BACKUPS anciens fichiers gardes)
+            interval: Duree d'une periode en secondes
+        """
+        self.path = path
+        self.interval = interval
+        self.histograms: Dict[str, FrameHistogram] = {}
+        self.hitches: List[dict] = []
+        self.hitch_count = 0
+        self.window_start = time.monotonic()
+        self._logger: Optional[logging.Logger] = None
+        # La premiere frame contient le demarrage: ignoree
+        self._skip_frames = 1
+
+    def record_frame(self, scene_name, frame_ms, context=None):
+        """
+        Enregistre une frame.
+
+        Args:
+            scene_name: Scene affichee pendant la frame
+            frame_ms: Duree de la frame
+            context: Fonction retournant le contexte de la scene (appelee seulement
+                     pour une saccade)
+        """
+        if self._skip_frames:
+            self._skip_frames -= 1
+            return
+
+        histogram = self.histograms.get(scene_name)
+        if histogram is None:
+            histogram = self.histograms[scene_name] = FrameHistogram()
+        histogram.add(frame_ms)
+
+        if frame_ms > TELEMETRY_HITCH_MS:
+            self.hitch_count += 1
+            if len(self.hitches) < TELEMETRY_MAX_HITCHES:
+                hitch = {"at": datetime.now().strftime("%H:%M:%S"), "ms": round(frame_ms, 1),
+                         "scene": scene_name}
+                if context is not None:
+                    hitch.update(context())
+                self.hitches.append(hitch)
+
+        if time.monotonic() - self.window_start >= self.interval:
+            self.flush()
+
+    def flush(self):
+        """Ecrit la periode en cours dans le journal et en commence une nouvelle"""
+        now = time.monotonic()
+        if self.histograms:
+            record = {
+                "time": datetime.now().isoformat(timespec="seconds"),
+                "window_s": round(now - self.window_start, 1),
+                "scenes": {name: histogram.summary() for name, histogram in self.histograms.items()},
+                "hitches": self.hitch_count,
+                "hitch_samples": self.hitches,
+            }
+            logger = self._get_logger()
+            if logger:
+                logger.info(json.dumps(record, separators=(",", ":")))
+
+        self.histograms = {}
+        self.hitches = []
+        self.hitch_count = 0
+        self.window_start = now
+
+    def _get_logger(self) -> Optional[logging.Logger]:
+        """Journal tournant, ouvert a la premiere ecriture (None si impossible)"""
+        if self._logger is None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                handler = logging.handlers.RotatingFileHandler(
+                    self.path, maxBytes=TELEMETRY_MAX_BYTES, backupCount=TELEMETRY_BACKUPS,
+                    encoding="utf-8")
+            except OSError as e:
+                print(f"Telemetrie desactivee: {e}")
+                self.interval = float("inf")
+                return None
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger = logging.getLogger(f"rockstar.telemetry.{id(self)}")
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            logger.addHandler(handler)
+            self._logger = logger
+        return self._logger
+
+    def close(self):
+        """Ecrit la derniere periode et ferme le journal"""
+        self.flush()
+        if self._logger:
+            for handler in self._logger.handlers:
+                handler.close()
+            self._logger.handlers.clear()
+            self._logger = None
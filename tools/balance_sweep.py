@@ -0,0 +1,122 @@
+"""
+Rockstar Bros - Campagne d'equilibrage
+Joue des stages en simulation headless (voir simulation.py) pour chaque combinaison
+de reglages, d'entrees et de graines, sur tous les coeurs de la machine, et ecrit
+un resultat par partie dans un CSV (une colonne par reglage modifie).
+
+Usage:
+    python tools/balance_sweep.py --set HATER_HEALTH=1,2,3 --set RIVAL_SHOOT_COOLDOWN=2000,2500
+    python tools/balance_sweep.py --grid grille.json --stages 1:1,1:2 --seeds 10
+    python tools/balance_sweep.py --inputs run,mon_script.json --workers 4
+    python tools/balance_sweep.py --inputs bot --seeds 1
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+
+# Permettre l'import des modules du jeu depuis tools/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from settings import BASE_DIR, SIM_MAX_TIME_S  # noqa: E402
+from simulation import init_headless, parse_override, run_simulation  # noqa: E402
+from level_loader import get_loader  # noqa: E402
+
+
+# Colonnes des resultats (apres celles des reglages)
+RESULT_COLUMNS = ["level", "stage", "controller", "seed", "outcome", "clear_time_s",
+                  "sim_time_s", "frames", "damage_taken", "score", "deaths"]
+
+
+def override_grid(set_args, grid_file):
+    """Liste des jeux de reglages: fichier JSON (liste de dicts) ou produit des --set"""
+    if grid_file:
+        with open(grid_file, encoding="utf-8") as f:
+            grid = json.load(f)
+        for overrides in grid:
+            for name, value in overrides.items():
+                parse_override(f"{name}={value!r}")  # Verifie que le reglage existe
+        return grid or [{}]
+
+    axes = []
+    for text in set_args:
+        name, _, values = text.partition("=")
+        axes.append([parse_override(f"{name}={value}") for value in values.split(",")])
+    return [dict(combination) for combination in itertools.product(*axes)]
+
+
+def stage_list(text):
+    """Texte 1:1,1:2 -> [(1, 1), (1, 2)]; vide = tous les stages de tous les niveaux"""
+    if text:
+        return [tuple(int(part) for part in item.split(":")) for item in text.split(",")]
+    return [(info.id, stage_id) for info in get_loader().get_all_levels()
+            for stage_id in range(1, info.stage_count + 1)]
+
+
+def _run(task):
+    """Une partie (dans un processus du pool)"""
+    return task["overrides"], run_simulation(**task)
+
+
+def sweep(grid, stages, controllers, seeds, workers, max_time_s, out_path):
+    """Lance toutes les parties et ecrit le CSV; retourne le nombre de parties"""
+    tasks = [
+        {"level_id": level_id, "stage_id": stage_id, "controller": controller, "seed": seed,
+         "overrides": overrides, "max_time_s": max_time_s}
+        for overrides in grid
+        for level_id, stage_id in stages
+        for controller in controllers
+        for seed in seeds
+    ]
+    setting_columns = sorted({name for overrides in grid for name in overrides})
+    print(f"{len(tasks)} parties ({len(grid)} reglages x {len(stages)} stages x "
+          f"{len(controllers)} entrees x {len(seeds)} graines) sur {workers} processus")
+
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    with open(out_path, "w", newline="", encoding="utf-8") as f, \
+            ProcessPoolExecutor(max_workers=workers, initializer=init_headless) as pool:
+        writer = csv.DictWriter(f, fieldnames=setting_columns + RESULT_COLUMNS)
+        writer.writeheader()
+        futures = [pool.submit(_run, task) for task in tasks]
+        for done, future in enumerate(as_completed(futures), 1):
+            overrides, result = future.result()
+            writer.writerow({**overrides, **result})
+            if done % 20 == 0 or done == len(tasks):
+                print(f"  {done}/{len(tasks)} ({time.perf_counter() - start:.0f} s)")
+    print(f"Resultats ecrits dans {out_path}")
+    return len(tasks)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Equilibrage par simulations headless en parallele")
+    parser.add_argument("--set", action="append", default=[], metavar="NOM=v1,v2",
+                        help="valeurs a essayer pour un reglage de settings.py (produit des --set)")
+    parser.add_argument("--grid", help="fichier JSON: liste de {reglage: valeur} (remplace --set)")
+    parser.add_argument("--stages", default="", help="stages a jouer, ex. 1:1,2:3 (defaut: tous)")
+    parser.add_argument("--inputs", default="run",
+                        help="entrees separees par des virgules: idle, run, bot ou un script JSON")
+    parser.add_argument("--seeds", type=int, default=3, help="nombre de graines par combinaison")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processus (defaut: tous les coeurs)")
+    parser.add_argument("--max-time", type=float, default=SIM_MAX_TIME_S,
+                        help="duree de jeu maximum d'une partie en secondes")
+    parser.add_argument("--out", type=Path,
+                        default=BASE_DIR / "balance" / f"sweep_{datetime.now():%Y%m%d_%H%M%S}.csv",
+                        help="fichier CSV des resultats")
+    args = parser.parse_args()
+
+    try:
+        grid = override_grid(args.set, args.grid)
+        stages = stage_list(args.stages)
+    except (OSError, ValueError) as e:
+        print(f"Erreur: {e}")
+        sys.exit(2)
+    sweep(grid, stages, args.inputs.split(","), list(range(args.seeds)), args.workers,
+          args.max_time, args.out)
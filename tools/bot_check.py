@@ -0,0 +1,64 @@
+"""
+Rockstar Bros - Verification par le bot
+Joue chaque stage livre avec le bot (voir bot.py) en simulation headless et
+verifie qu'il le termine. Code de sortie 1 si un stage n'est pas termine
+(mort ou temps depasse), pour l'integration continue.
+
+Usage:
+    python tools/bot_check.py
+    python tools/bot_check.py --seeds 2 --stages 3:1,3:2
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Permettre l'import des modules du jeu depuis tools/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from settings import SIM_MAX_TIME_S  # noqa: E402
+from simulation import init_headless, run_simulation  # noqa: E402
+from balance_sweep import stage_list  # noqa: E402
+
+
+def _run(task):
+    """Une partie du bot (dans un processus du pool)"""
+    return run_simulation(controller="bot", **task)
+
+
+def check(stages, seeds, workers, max_time_s) -> list:
+    """Joue tous les stages pour chaque graine; retourne les parties non terminees"""
+    tasks = [{"level_id": level_id, "stage_id": stage_id, "seed": seed, "max_time_s": max_time_s}
+             for level_id, stage_id in stages for seed in seeds]
+    start = time.perf_counter()
+    failures = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_headless) as pool:
+        for result in pool.map(_run, tasks):
+            status = "ok" if result["outcome"] == "clear" else "ECHEC"
+            print(f"  {result['level']}-{result['stage']} graine {result['seed']}: {result['outcome']} "
+                  f"({result['sim_time_s']} s, {result['damage_taken']} degats) {status}")
+            if result["outcome"] != "clear":
+                failures.append(result)
+    print(f"{len(tasks) - len(failures)}/{len(tasks)} parties terminees "
+          f"({time.perf_counter() - start:.0f} s)")
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Verifie que le bot termine tous les stages")
+    parser.add_argument("--stages", default="", help="stages a jouer, ex. 1:1,2:3 (defaut: tous)")
+    parser.add_argument("--seeds", type=int, default=2, help="nombre de graines par stage")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processus (defaut: tous les coeurs)")
+    parser.add_argument("--max-time", type=float, default=SIM_MAX_TIME_S,
+                        help="duree de jeu maximum d'une partie en secondes")
+    args = parser.parse_args()
+
+    try:
+        stages = stage_list(args.stages)
+    except (OSError, ValueError) as e:
+        print(f"Erreur: {e}")
+        sys.exit(2)
+    sys.exit(1 if check(stages, list(range(args.seeds)), args.workers, args.max_time) else 0)
@@ -0,0 +1,100 @@
+"""
+Rockstar Bros - Compression des sons
+Convertit les WAV de assets/sons en OGG Vorbis (necessite ffmpeg).
+Au lancement, le jeu charge le .ogg a la place du .wav quand il existe
+(voir audio.resolve_sound_path).
+
+Usage:
+    python tools/build_audio.py            # convertit les fichiers modifies
+    python tools/build_audio.py --force    # reconvertit tout
+    python tools/build_audio.py --dry-run  # affiche le plan sans rien ecrire
+"""
+
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+# Permettre l'import des modules du jeu depuis tools/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from settings import (  # noqa: E402
+    SND_DIR, LEVELS_DIR, COMPRESSED_AUDIO_SUFFIX,
+    SND_MUSIC_MENU, SND_MUSIC_LEVEL1, SND_MUSIC_BOSS, SND_VICTORY,
+    SND_BOSS_LAUGH_1, SND_BOSS_LAUGH_2, SND_BOSS_LAUGH_3,
+)
+
+
+# Qualite Vorbis (-q:a): la musique garde plus de detail que les bruitages
+MUSIC_QUALITY = 5
+SFX_QUALITY = 3
+# Les bruitages sont ramenes a cette frequence (suffisant pour des effets courts)
+SFX_SAMPLE_RATE = 22050
+
+
+def music_files():
+    """Fichiers joues par pygame.mixer.music (streaming): menus, stages, victoire, rires"""
+    files = {SND_MUSIC_MENU, SND_MUSIC_LEVEL1, SND_MUSIC_BOSS, SND_VICTORY,
+             SND_BOSS_LAUGH_1, SND_BOSS_LAUGH_2, SND_BOSS_LAUGH_3}
+    for level_file in sorted(LEVELS_DIR.glob("level_*.json")):
+        with open(level_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        for stage in data.get("stages", []):
+            if stage.get("music"):
+                files.add(stage["music"])
+    return {name.lower() for name in files}
+
+
+def ffmpeg_command(ffmpeg, source, target, is_music):
+    """Ligne de commande ffmpeg pour un fichier"""
+    command = [ffmpeg, "-y", "-loglevel", "error", "-i", str(source), "-vn", "-c:a", "libvorbis"]
+    if is_music:
+        command += ["-q:a", str(MUSIC_QUALITY)]
+    else:
+        command += ["-q:a", str(SFX_QUALITY), "-ar", str(SFX_SAMPLE_RATE)]
+    return command + [str(target)]
+
+
+def build(force=False, dry_run=False):
+    """Convertit les WAV perimes; retourne le nombre d'erreurs"""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None and not dry_run:
+        print("ffmpeg introuvable: installe-le puis relance ce script")
+        return 1
+
+    music = music_files()
+    errors = 0
+    total_before = total_after = 0
+    for source in sorted(SND_DIR.glob("*.wav")):
+        target = source.with_suffix(COMPRESSED_AUDIO_SUFFIX)
+        is_music = source.name.lower() in music
+        kind = "music" if is_music else "sfx"
+        if not force and target.exists() and target.stat().st_mtime >= source.stat().st_mtime:
+            continue
+
+        print(f"[{kind}] {source.name} -> {target.name}")
+        if dry_run:
+            continue
+        result = subprocess.run(ffmpeg_command(ffmpeg, source, target, is_music),
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            print(f"  Erreur: {result.stderr.strip()}")
+            target.unlink(missing_ok=True)
+            errors += 1
+            continue
+        total_before += source.stat().st_size
+        total_after += target.stat().st_size
+
+    if total_before:
+        print(f"{total_before / 1024:.0f} Ko de WAV -> {total_after / 1024:.0f} Ko d'OGG")
+    return errors
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convertit les sons du jeu en OGG Vorbis")
+    parser.add_argument("--force", action="store_true", help="reconvertir meme les fichiers a jour")
+    parser.add_argument("--dry-run", action="store_true", help="afficher le plan sans convertir")
+    args = parser.parse_args()
+    sys.exit(1 if build(force=args.force, dry_run=args.dry_run) else 0)
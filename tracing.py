@@ -0,0 +1,142 @@
+"""
+Rockstar Bros - Traces d'evenements (mode --trace)
+Intervalles et evenements ponctuels gardes dans un tampon circulaire, ecrits au
+format Chrome Trace Event (chrome://tracing, Perfetto) sur F4 ou apres une
+frame trop longue. Sans --trace, span() ne coute qu'un appel de fonction.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Deque, Optional
+
+from settings import TRACE_BUFFER_EVENTS, TRACE_HITCH_MS, TRACE_HITCH_COOLDOWN_MS, TRACE_DIR
+
+
+# Contexte vide partage quand les traces sont coupees
+_NULL_SPAN = nullcontext()
+
+
+class _Span:
+    """Intervalle en cours (with tracer.span(...))"""
+
+    __slots__ = ("tracer", "category", "name", "start")
+
+    def __init__(self, tracer, category, name):
+        self.tracer = tracer
+        self.category = category
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        self.tracer.events.append(("X", self.category, self.name, self.start, end - self.start,
+                                   threading.get_ident(), None))
+        return False
+
+
+class Tracer:
+    """Tampon circulaire d'evenements (les plus anciens sont oublies)"""
+
+    def __init__(self, capacity=TRACE_BUFFER_EVENTS, hitch_ms=TRACE_HITCH_MS, out_dir=TRACE_DIR):
+        """
+        Args:
+            capacity: Nombre d'evenements gardes
+            hitch_ms: Duree de frame qui declenche une ecriture (None = jamais)
+            out_dir: Dossier des fichiers de trace
+        """
+        # deque.append est atomique: le thread de prechargement peut y ecrire aussi
+        self.events: Deque[tuple] = deque(maxlen=capacity)
+        self.hitch_ms = hitch_ms
+        self.out_dir = out_dir
+        self.origin = time.perf_counter()
+        # Le demarrage (premiere frame) ne compte pas comme une frame trop longue
+        self._last_flush = self.origin
+
+    def span(self, category, name) -> _Span:
+        """Intervalle mesure par un bloc with"""
+        return _Span(self, category, name)
+
+    def instant(self, category, name, args=None):
+        """Evenement ponctuel (changement de scene, frame trop longue...)"""
+        self.events.append(("i", category, name, time.perf_counter(), 0.0, threading.get_ident(), args))
+
+    def end_frame(self, frame_ms) -> Optional[str]:
+        """Fin de frame: ecrit la trace si la frame depasse hitch_ms (avec un delai entre deux ecritures)"""
+        if self.hitch_ms is None or frame_ms <= self.hitch_ms:
+            return None
+        if (time.perf_counter() - self._last_flush) * 1000 < TRACE_HITCH_COOLDOWN_MS:
+            return None
+        self.instant("frame", "hitch", {"frame_ms": round(frame_ms, 2)})
+        return self.flush("hitch")
+
+    def to_json(self) -> dict:
+        """Contenu du tampon au format Chrome Trace Event (temps en microsecondes)"""
+        pid = os.getpid()
+        trace_events = []
+        for phase, category, name, start, duration, thread, args in list(self.events):
+            event = {"name": name, "cat": category, "ph": phase, "pid": pid, "tid": thread,
+                     "ts": round((start - self.origin) * 1e6, 1)}
+            if phase == "X":
+                event["dur"] = round(duration * 1e6, 1)
+            else:
+                event["s"] = "t"
+            if args:
+                event["args"] = args
+            trace_events.append(event)
+        for thread in threading.enumerate():
+            trace_events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread.ident,
+                                 "args": {"name": thread.name}})
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def flush(self, reason="manual") -> Optional[str]:
+        """Ecrit le tampon dans TRACE_DIR et le vide; retourne le chemin du fichier"""
+        self._last_flush = time.perf_counter()
+        path = self.out_dir / f"trace_{datetime.now():%Y%m%d_%H%M%S_%f}_{reason}.json"
+        try:
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.to_json(), f)
+        except OSError as e:
+            print(f"Impossible d'ecrire la trace: {e}")
+            return None
+        self.events.clear()
+        print(f"[Trace] {reason}: {path}")
+        return str(path)
+
+
+_tracer: Optional[Tracer] = None
+
+
+def enable(**kwargs) -> Tracer:
+    """Active les traces (arguments de Tracer)"""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(**kwargs)
+    return _tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Tracer actif, ou None sans --trace"""
+    return _tracer
+
+
+def span(category, name):
+    """Mesure un bloc with si les traces sont actives"""
+    if _tracer is None:
+        return _NULL_SPAN
+    return _Span(_tracer, category, name)
+
+
+def instant(category, name, args=None):
+    """Evenement ponctuel si les traces sont actives"""
+    if _tracer is not None:
+        _tracer.instant(category, name, args)